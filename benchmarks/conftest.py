@@ -0,0 +1,60 @@
+import os
+from typing import Dict
+
+import pytest
+import yaml
+
+import pyfredapi as pf
+from pyfredapi import _base
+from pyfredapi.testing import MockFredServer
+
+api_key = "a" * 32
+vhs = os.path.join(os.path.dirname(__file__), os.pardir, "tests", "vhs")
+
+
+def load_cassette_body(module: str, cassette: str) -> bytes:
+    """Return the body of the largest response recorded in a cassette."""
+    with open(os.path.join(vhs, module, cassette)) as f:
+        interactions = yaml.safe_load(f)["interactions"]
+
+    bodies = [i["response"]["body"]["string"] for i in interactions]
+    body = max(bodies, key=len)
+    return body.encode() if isinstance(body, str) else body
+
+
+@pytest.fixture(scope="session")
+def payloads() -> Dict[str, bytes]:
+    return {
+        "series/observations": load_cassette_body(
+            "test_series", "test_get_series_all_releases[json].yaml"
+        ),
+        "series/search": load_cassette_body(
+            "test_series", "test_search_series[json].yaml"
+        ),
+        "series/updates": load_cassette_body(
+            "test_series", "test_get_series_updates.yaml"
+        ),
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_server():
+    """Run a local mock FRED API server that generates the responses."""
+    with MockFredServer(observations=100_000, geo_regions=3000, geo_dates=20) as server:
+        yield server
+
+
+@pytest.fixture()
+def offline(mock_server, monkeypatch):
+    """Send the requests of the pyfredapi functions to the mock server, without rate limit.
+
+    Returns the response cache used by the functions, which starts empty.
+    """
+    pool = mock_server.session_pool()
+    cache = pf.ResponseCache(max_size=1 << 30)
+    monkeypatch.setenv("FRED_API_KEY", api_key)
+    monkeypatch.setattr(_base, "get_session_pool", lambda: pool)
+    monkeypatch.setattr(_base, "get_response_cache", lambda: cache)
+    monkeypatch.setattr(_base, "get_rate_limiter", lambda: None)
+    yield cache
+    pool.close()
@@ -0,0 +1,137 @@
+"""Benchmark the conversion of observations to pandas and polars dataframes, arrow tables, and numpy arrays.
+
+`test_convert_all_releases_to_pandas` compares the typed pandas conversion with the conversion
+that infers the formats of the columns, on a response of 1M records with 4 vintages per date.
+`test_convert_all_releases` compares the conversions that parse the columns with arrow to the
+conversions without pyarrow, on the same response. `test_convert_search_results_to_pandas`
+compares the string and categorical columns of 100k series search results.
+
+Run with `pytest benchmarks/test_convert.py --benchmark-group-by=group,param:observations`.
+"""
+
+from importlib.util import find_spec
+
+import pytest
+
+from pyfredapi.testing import synthetic
+from pyfredapi.utils import _convert_to_df
+from pyfredapi.utils._convert_to_df import (
+    _convert_to_arrow,
+    _convert_to_numpy,
+    _convert_to_pandas,
+    _convert_to_pandas_inferred,
+    _convert_to_polars,
+)
+
+rows = [1_000, 10_000, 100_000, 1_000_000]
+
+
+@pytest.fixture(scope="module", params=rows, ids=lambda n: f"{n}")
+def observations(request):
+    return synthetic.observation_records(request.param)
+
+
+def test_convert_to_pandas(benchmark, observations):
+    benchmark.extra_info["rows"] = len(observations)
+    df = benchmark(_convert_to_pandas, observations)
+    assert len(df) == len(observations)
+
+
+@pytest.mark.skipif(find_spec("polars") is None, reason="polars not installed")
+def test_convert_to_polars(benchmark, observations):
+    benchmark.extra_info["rows"] = len(observations)
+    df = benchmark(_convert_to_polars, observations)
+    assert len(df) == len(observations)
+
+
+@pytest.mark.skipif(find_spec("pyarrow") is None, reason="pyarrow not installed")
+def test_convert_to_arrow(benchmark, observations):
+    benchmark.extra_info["rows"] = len(observations)
+    table = benchmark(_convert_to_arrow, observations)
+    assert table.num_rows == len(observations)
+
+
+def test_convert_to_numpy(benchmark, observations):
+    benchmark.extra_info["rows"] = len(observations)
+    array = benchmark(_convert_to_numpy, observations)
+    assert len(array) == len(observations)
+
+
+@pytest.fixture(scope="module")
+def all_releases():
+    return synthetic.vintage_records(1_000_000)
+
+
+@pytest.mark.benchmark(group="all releases")
+@pytest.mark.parametrize(
+    "convert",
+    [_convert_to_pandas, _convert_to_pandas_inferred],
+    ids=["typed", "inferred"],
+)
+def test_convert_all_releases_to_pandas(benchmark, all_releases, convert):
+    benchmark.extra_info["rows"] = len(all_releases)
+    df = benchmark.pedantic(convert, args=(all_releases,), rounds=3)
+    assert len(df) == len(all_releases)
+
+
+@pytest.mark.benchmark(group="all releases")
+@pytest.mark.skipif(find_spec("pyarrow") is None, reason="pyarrow not installed")
+@pytest.mark.parametrize("parser", ["arrow", "numpy"])
+@pytest.mark.parametrize(
+    "convert", [_convert_to_pandas, _convert_to_polars], ids=["pandas", "polars"]
+)
+def test_convert_all_releases(benchmark, monkeypatch, all_releases, convert, parser):
+    if convert is _convert_to_polars and find_spec("polars") is None:
+        pytest.skip("polars not installed")
+    if parser == "numpy":
+        monkeypatch.setattr(_convert_to_df, "MISSING_PYARROW", True)
+    benchmark.extra_info["rows"] = len(all_releases)
+    benchmark.pedantic(convert, args=(all_releases,), rounds=3)
+
+
+@pytest.mark.benchmark(group="all releases")
+@pytest.mark.skipif(find_spec("pyarrow") is None, reason="pyarrow not installed")
+def test_convert_all_releases_to_arrow(benchmark, all_releases):
+    benchmark.extra_info["rows"] = len(all_releases)
+    table = benchmark.pedantic(_convert_to_arrow, args=(all_releases,), rounds=3)
+    assert table.num_rows == len(all_releases)
+
+
+@pytest.mark.benchmark(group="all releases")
+def test_convert_all_releases_to_numpy(benchmark, all_releases):
+    benchmark.extra_info["rows"] = len(all_releases)
+    array = benchmark.pedantic(
+        _convert_to_numpy, args=(all_releases,), kwargs={"realtime": True}, rounds=3
+    )
+    assert len(array) == len(all_releases)
+
+
+@pytest.mark.benchmark(group="all releases")
+def test_convert_all_releases_to_pandas_projected(benchmark, all_releases):
+    benchmark.extra_info["rows"] = len(all_releases)
+    df = benchmark.pedantic(
+        _convert_to_pandas,
+        args=(all_releases,),
+        kwargs={"columns": ["date", "value"]},
+        rounds=3,
+    )
+    assert df.columns.tolist() == ["date", "value"]
+
+
+@pytest.fixture(scope="module")
+def search_results():
+    return [synthetic.series_record(f"SYN{i:07d}") for i in range(100_000)]
+
+
+@pytest.mark.benchmark(group="search results")
+@pytest.mark.parametrize("categorical", [False, True])
+def test_convert_search_results_to_pandas(benchmark, search_results, categorical):
+    benchmark.extra_info["rows"] = len(search_results)
+    df = benchmark.pedantic(
+        _convert_to_pandas,
+        args=(search_results,),
+        kwargs={"categorical": categorical},
+        rounds=3,
+    )
+    benchmark.extra_info["memory"] = int(df.memory_usage(deep=True).sum())
+    assert (df["frequency"].dtype == "category") == categorical
@@ -0,0 +1,41 @@
+"""Benchmark the Json backends on responses recorded in `tests/vhs`.
+
+Run with `pytest benchmarks/test_decode.py --benchmark-group-by=param:endpoint`.
+"""
+
+import pytest
+
+from pyfredapi import decoder
+
+backends = [
+    "json",
+    pytest.param(
+        "orjson",
+        marks=pytest.mark.skipif(decoder.MISSING_ORJSON, reason="orjson not installed"),
+    ),
+    pytest.param(
+        "msgspec",
+        marks=pytest.mark.skipif(
+            decoder.MISSING_MSGSPEC, reason="msgspec not installed"
+        ),
+    ),
+]
+
+
+@pytest.fixture()
+def backend(request):
+    previous = decoder.get_json_backend()
+    decoder.set_json_backend(request.param)
+    yield request.param
+    decoder.set_json_backend(previous)
+
+
+@pytest.mark.parametrize("backend", backends, indirect=True)
+@pytest.mark.parametrize(
+    "endpoint", ["series/observations", "series/search", "series/updates"]
+)
+def test_decode(benchmark, payloads, backend, endpoint):
+    content = payloads[endpoint]
+    benchmark.extra_info["bytes"] = len(content)
+    data = benchmark(decoder.decode_json, content)
+    assert data["count"] > 0
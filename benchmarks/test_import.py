@@ -0,0 +1,47 @@
+"""Benchmark the import time of pyfredapi in a fresh interpreter.
+
+Each round starts a new Python process, so the timings include the interpreter startup. The
+`python -c pass` benchmark measures the startup alone. The cumulative import time of the
+`pyfredapi` package reported by `python -X importtime` is stored in the `extra_info` of the results.
+
+Run with `pytest benchmarks/test_import.py`.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+statements = {
+    "startup": "pass",
+    "import": "import pyfredapi",
+    "get_series": "import pyfredapi; pyfredapi.get_series",
+    "get_series_pandas": "import pyfredapi; pyfredapi.get_series; import pandas",
+    "series_collection": "import pyfredapi; pyfredapi.SeriesCollection",
+}
+
+
+def run(statement):
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def import_time_us(stderr, module):
+    """Return the cumulative import time of a module reported by `-X importtime`."""
+    for line in stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1])
+    return 0
+
+
+@pytest.mark.parametrize("case", list(statements))
+def test_import_time(benchmark, case):
+    result = benchmark.pedantic(run, args=(statements[case],), rounds=5, iterations=1)
+    benchmark.extra_info["pyfredapi_import_us"] = import_time_us(
+        result.stderr, "pyfredapi"
+    )
@@ -0,0 +1,19 @@
+"""Benchmark the assembly of the `get_geoseries` dataframe.
+
+The regional series is generated by the local mock FRED API server of `pyfredapi.testing`, with
+20 cross sections of 3000 regions. The response is cached before the benchmark, so the benchmark
+measures the assembly of the dataframe, not the request.
+
+Run with `pytest benchmarks/test_maps.py`.
+"""
+
+import pyfredapi as pf
+
+
+def test_get_geoseries(benchmark, offline, mock_server):
+    pf.get_geoseries("SYN")
+    misses = offline.stats.misses
+
+    geoseries = benchmark(pf.get_geoseries, "SYN")
+    assert len(geoseries.data) == mock_server.geo_regions * mock_server.geo_dates
+    assert offline.stats.misses == misses
@@ -0,0 +1,95 @@
+"""Benchmark the per-call overhead of the request functions when the response is cached.
+
+Every call is served by the response cache, so the benchmarks measure the validation of the
+parameters, the cache lookup, and the bookkeeping around them, not the network.
+
+Run with `pytest benchmarks/test_overhead.py --benchmark-group-by=func`.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import pyfredapi as pf
+from pyfredapi import _base
+from pyfredapi.series import SeriesApiParameters
+from pyfredapi.utils import _convert_pydantic_model_to_frozenset, _validated_params
+
+api_key = "a" * 32
+observations = {
+    "count": 1,
+    "offset": 0,
+    "limit": 100000,
+    "observations": [
+        {
+            "realtime_start": "2024-01-01",
+            "realtime_end": "2024-01-01",
+            "date": "2023-10-01",
+            "value": "27956.998",
+        }
+    ],
+}
+
+
+class CannedPool:
+    """Session pool that answers every request with the same response."""
+
+    pool_size = 1
+
+    def get(self, url, params=None, timeout=30):  # noqa: D102
+        return SimpleNamespace(
+            status_code=200, content=json.dumps(observations).encode()
+        )
+
+    def close(self):  # noqa: D102
+        pass
+
+
+@pytest.fixture()
+def warm_cache(monkeypatch):
+    monkeypatch.setattr(_base, "get_session_pool", CannedPool)
+    monkeypatch.setattr(_base, "get_response_cache", lambda: cache)
+    cache = pf.ResponseCache()
+    pf.get_series("GDP", api_key=api_key, return_format="json")
+    return cache
+
+
+@pytest.fixture()
+def client():
+    client = pf.FredClient(api_key, session_pool=CannedPool(), rate_limiter=None)
+    client.get_series("GDP", return_format="json")
+    return client
+
+
+def test_get_series_cache_hit(benchmark, warm_cache):
+    data = benchmark(pf.get_series, "GDP", api_key=api_key, return_format="json")
+    assert len(data) == 1
+    assert warm_cache.stats.misses == 1
+
+
+def test_get_series_cache_hit_with_kwargs(benchmark, warm_cache):
+    kwargs = {"observation_start": "2020-01-01", "units": "pch", "frequency": "q"}
+    pf.get_series("GDP", api_key=api_key, return_format="json", **kwargs)
+    data = benchmark(
+        pf.get_series, "GDP", api_key=api_key, return_format="json", **kwargs
+    )
+    assert len(data) == 1
+
+
+def test_client_get_series_cache_hit(benchmark, client):
+    data = benchmark(client.get_series, "GDP", return_format="json")
+    assert len(data) == 1
+    assert client.cache.stats.misses == 1
+
+
+def test_validate_params(benchmark):
+    benchmark(
+        lambda: _convert_pydantic_model_to_frozenset(
+            SeriesApiParameters(series_id="GDP", units="pch")
+        )
+    )
+
+
+def test_validated_params(benchmark):
+    benchmark(_validated_params, SeriesApiParameters, series_id="GDP", units="pch")
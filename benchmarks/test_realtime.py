@@ -0,0 +1,32 @@
+"""Benchmark `filter_asof` on 1M all-releases records in each representation of the realtime columns.
+
+Run with `pytest benchmarks/test_realtime.py`.
+"""
+
+import pytest
+
+import pyfredapi as pf
+from pyfredapi.testing import synthetic
+from pyfredapi.utils._convert_to_df import _convert_to_pandas
+
+records = 1_000_000
+
+
+@pytest.fixture(scope="module")
+def all_releases():
+    return synthetic.vintage_records(records)
+
+
+@pytest.fixture(params=["coerce", "datetime", "days"])
+def df(request, all_releases):
+    pf.set_realtime_dates(request.param)
+    try:
+        yield _convert_to_pandas(all_releases)
+    finally:
+        pf.set_realtime_dates("coerce")
+
+
+def test_filter_asof(benchmark, df):
+    benchmark.extra_info["rows"] = len(df)
+    current = benchmark(pf.filter_asof, df, "2000-01-01")
+    assert len(current) > 0
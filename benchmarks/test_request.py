@@ -0,0 +1,92 @@
+"""Benchmark `_get_request` with cache hits and misses.
+
+Cache misses are measured twice: against a session pool that answers every request with the same
+response without a network, which isolates the overhead of pyfredapi and the Json decoding, and
+against the local mock FRED API server of `pyfredapi.testing`, which adds a real HTTP round trip on
+a keep-alive connection. The server generates each response once and then answers from memory.
+`test_get_series_cache_hit` measures `get_series` with a cached response, with and without the
+cached pandas dataframe.
+
+Run with `pytest benchmarks/test_request.py --benchmark-group-by=param:rows`.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import pyfredapi as pf
+from pyfredapi import _base
+from pyfredapi.testing import synthetic
+
+rows = [1, 1000, 100_000]
+
+
+class CannedPool:
+    """Session pool that answers every request with the same response."""
+
+    pool_size = 1
+
+    def __init__(self, content):  # noqa: D107
+        self.response = SimpleNamespace(status_code=200, content=content)
+
+    def get(self, url, params=None, timeout=30):  # noqa: D102
+        return self.response
+
+
+def params(n):
+    return frozenset({"series_id": "GDP", "limit": n}.items())
+
+
+@pytest.fixture()
+def components(monkeypatch):
+    """Replace the global components, without rate limiter and without cache."""
+    components = SimpleNamespace(pool=None, cache=None)
+    monkeypatch.setenv("FRED_API_KEY", "a" * 32)
+    monkeypatch.setattr(_base, "get_session_pool", lambda: components.pool)
+    monkeypatch.setattr(_base, "get_response_cache", lambda: components.cache)
+    monkeypatch.setattr(_base, "get_rate_limiter", lambda: None)
+    return components
+
+
+@pytest.mark.parametrize("rows", rows)
+def test_cache_hit(benchmark, components, rows):
+    components.pool = CannedPool(json.dumps(synthetic.observations(rows)).encode())
+    components.cache = pf.ResponseCache()
+    _base._get_request("series/observations", params=params(rows))
+
+    data = benchmark(_base._get_request, "series/observations", params=params(rows))
+    assert len(data["observations"]) == rows
+    assert components.cache.stats.misses == 1
+
+
+@pytest.mark.parametrize("rows", rows)
+def test_cache_miss(benchmark, components, rows):
+    content = json.dumps(synthetic.observations(rows)).encode()
+    components.pool = CannedPool(content)
+    benchmark.extra_info["bytes"] = len(content)
+
+    data = benchmark(_base._get_request, "series/observations", params=params(rows))
+    assert len(data["observations"]) == rows
+
+
+@pytest.mark.parametrize("rows", rows)
+def test_cache_miss_http(benchmark, components, mock_server, rows):
+    components.pool = mock_server.session_pool()
+    _base._get_request("series/observations", params=params(rows))
+
+    data = benchmark(_base._get_request, "series/observations", params=params(rows))
+    assert len(data["observations"]) == rows
+    components.pool.close()
+
+
+@pytest.mark.parametrize("rows", rows)
+@pytest.mark.parametrize("cache_frames", [False, True])
+def test_get_series_cache_hit(benchmark, components, rows, cache_frames):
+    components.pool = CannedPool(json.dumps(synthetic.observations(rows)).encode())
+    components.cache = pf.ResponseCache(cache_frames=cache_frames)
+    pf.get_series("GDP", limit=rows)
+
+    df = benchmark(pf.get_series, "GDP", limit=rows)
+    assert len(df) == rows
+    assert (components.cache.stats.frame_hits > 0) == cache_frames
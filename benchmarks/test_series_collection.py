@@ -0,0 +1,56 @@
+"""Benchmark the construction of a `SeriesCollection` and the merges of its series.
+
+The series are generated by the local mock FRED API server of `pyfredapi.testing`. The
+construction is measured with an empty response cache, so every series is requested from the
+server. The merges are measured on a collection of 200 series of 1000 daily observations.
+
+Run with `pytest benchmarks/test_series_collection.py`.
+"""
+
+import pytest
+
+import pyfredapi as pf
+
+series_ids = [f"SYN{i:03d}" for i in range(200)]
+
+
+@pytest.fixture()
+def collection(offline):
+    return pf.SeriesCollection(series_ids, limit=1000)
+
+
+@pytest.mark.parametrize("n_series", [10, 200])
+def test_series_collection(benchmark, offline, n_series):
+    benchmark.extra_info["series"] = n_series
+    collection = benchmark.pedantic(
+        pf.SeriesCollection,
+        args=(series_ids[:n_series],),
+        kwargs={"limit": 1000},
+        setup=offline.clear,
+        rounds=5,
+    )
+    assert len(collection) == n_series
+
+
+def test_merge_wide(benchmark, collection):
+    df = benchmark(collection.merge_wide)
+    assert df.shape == (1000, 201)
+
+
+def test_merge_long(benchmark, collection):
+    df = benchmark(collection.merge_long)
+    assert df.shape == (200_000, 3)
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+def test_merge_long_info_attrs(benchmark, collection, categorical):
+    df = benchmark(
+        collection.merge_long, include_info_attrs=True, categorical=categorical
+    )
+    benchmark.extra_info["memory"] = int(df.memory_usage(deep=True).sum())
+    assert len(df) == 200_000
+
+
+def test_merge_asof(benchmark, collection):
+    df = benchmark(collection.merge_asof, base_series_id=series_ids[0])
+    assert df.shape == (1000, 201)
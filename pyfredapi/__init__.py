@@ -6,55 +6,262 @@
 dataframe or json. Checkout the [docs](https://pyfredapi.readthedocs.io/en/latest/) to learn more.
 """
 
-from importlib.metadata import version as _version
-
-__version__ = _version("pyfredapi")
-
-from .category import (
-    CategoryApiParameters,
-    get_category,
-    get_category_children,
-    get_category_related,
-    get_category_related_tags,
-    get_category_series,
-    get_category_tags,
-)
-from .maps import MapApiParameters, get_geoseries, get_geoseries_info, get_shape_files
-from .releases import (
-    ReleaseApiParameters,
-    get_release,
-    get_release_dates,
-    get_release_related_tags,
-    get_release_series,
-    get_release_sources,
-    get_release_tables,
-    get_release_tags,
-    get_releases,
-    get_releases_dates,
-)
-from .series import (
-    SeriesApiParameters,
-    SeriesInfo,
-    SeriesSearchParameters,
-    get_series,
-    get_series_all_releases,
-    get_series_asof_date,
-    get_series_categories,
-    get_series_info,
-    get_series_initial_release,
-    get_series_releases,
-    get_series_tags,
-    get_series_updates,
-    get_series_vintagedates,
-    search_series,
-    search_series_related_tags,
-    search_series_tags,
-)
-from .series_collection import SeriesCollection, SeriesData
-from .sources import SourceApiParameters, get_source, get_source_release, get_sources
-from .tags import (
-    TagsApiParameters,
-    get_related_tags,
-    get_series_matching_tags,
-    get_tags,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# The submodules, and the heavy dependencies they import, are only loaded when one of their
+# attributes is first accessed, to keep `import pyfredapi` fast.
+_lazy_attrs = {
+    "CacheStats": "cache",
+    "ResponseCache": "cache",
+    "SQLiteCache": "cache",
+    "configure_response_cache": "cache",
+    "get_response_cache": "cache",
+    "set_response_cache": "cache",
+    "CategoryApiParameters": "category",
+    "get_category": "category",
+    "get_category_children": "category",
+    "get_category_related": "category",
+    "get_category_related_tags": "category",
+    "get_category_series": "category",
+    "get_category_tags": "category",
+    "iter_category_series": "category",
+    "FredClient": "client",
+    "CoalesceStats": "coalesce",
+    "RequestCoalescer": "coalesce",
+    "get_request_coalescer": "coalesce",
+    "set_request_coalescer": "coalesce",
+    "get_json_backend": "decoder",
+    "set_json_backend": "decoder",
+    "ConversionEvent": "hooks",
+    "Hook": "hooks",
+    "LoggingHook": "hooks",
+    "OpenTelemetryHook": "hooks",
+    "PrometheusHook": "hooks",
+    "RequestEvent": "hooks",
+    "add_hook": "hooks",
+    "get_hooks": "hooks",
+    "remove_hook": "hooks",
+    "set_hooks": "hooks",
+    "MapApiParameters": "maps",
+    "get_geoseries": "maps",
+    "get_geoseries_info": "maps",
+    "get_shape_files": "maps",
+    "RateLimiter": "rate_limit",
+    "SQLiteRateLimiter": "rate_limit",
+    "configure_rate_limiter": "rate_limit",
+    "get_rate_limiter": "rate_limit",
+    "set_rate_limiter": "rate_limit",
+    "filter_asof": "realtime",
+    "get_realtime_dates": "realtime",
+    "set_realtime_dates": "realtime",
+    "ReleaseApiParameters": "releases",
+    "get_release": "releases",
+    "get_release_dates": "releases",
+    "get_release_related_tags": "releases",
+    "get_release_series": "releases",
+    "get_release_sources": "releases",
+    "get_release_tables": "releases",
+    "get_release_tags": "releases",
+    "get_releases": "releases",
+    "get_releases_dates": "releases",
+    "iter_release_series": "releases",
+    "iter_releases": "releases",
+    "RetryAttempt": "retry",
+    "RetryPolicy": "retry",
+    "RetryStats": "retry",
+    "configure_retry_policy": "retry",
+    "get_retry_policy": "retry",
+    "set_retry_policy": "retry",
+    "SeriesApiParameters": "series",
+    "SeriesInfo": "series",
+    "SeriesSearchParameters": "series",
+    "get_series": "series",
+    "get_series_all_releases": "series",
+    "get_series_asof_date": "series",
+    "get_series_categories": "series",
+    "get_series_info": "series",
+    "get_series_initial_release": "series",
+    "get_series_releases": "series",
+    "get_series_tags": "series",
+    "get_series_updates": "series",
+    "get_series_vintagedates": "series",
+    "iter_search_series": "series",
+    "search_series": "series",
+    "search_series_related_tags": "series",
+    "search_series_tags": "series",
+    "SeriesCollection": "series_collection",
+    "SeriesData": "series_collection",
+    "SessionPool": "session",
+    "configure_session_pool": "session",
+    "get_session_pool": "session",
+    "SourceApiParameters": "sources",
+    "get_source": "sources",
+    "get_source_release": "sources",
+    "get_sources": "sources",
+    "iter_sources": "sources",
+    "TagsApiParameters": "tags",
+    "get_related_tags": "tags",
+    "get_series_matching_tags": "tags",
+    "get_tags": "tags",
+    "iter_series_matching_tags": "tags",
+    "iter_tags": "tags",
+}
+
+_submodules = {
+    "cache",
+    "category",
+    "client",
+    "coalesce",
+    "decoder",
+    "exceptions",
+    "hooks",
+    "maps",
+    "rate_limit",
+    "realtime",
+    "releases",
+    "retry",
+    "series",
+    "series_collection",
+    "session",
+    "sources",
+    "tags",
+    "utils",
+}
+
+__all__ = sorted(_lazy_attrs)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        from importlib.metadata import version
+
+        return version("pyfredapi")
+
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+
+    module = _lazy_attrs.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_lazy_attrs, *_submodules, "__version__"})
+
+
+if TYPE_CHECKING:
+    from .cache import (
+        CacheStats,
+        ResponseCache,
+        SQLiteCache,
+        configure_response_cache,
+        get_response_cache,
+        set_response_cache,
+    )
+    from .category import (
+        CategoryApiParameters,
+        get_category,
+        get_category_children,
+        get_category_related,
+        get_category_related_tags,
+        get_category_series,
+        get_category_tags,
+        iter_category_series,
+    )
+    from .client import FredClient
+    from .coalesce import (
+        CoalesceStats,
+        RequestCoalescer,
+        get_request_coalescer,
+        set_request_coalescer,
+    )
+    from .decoder import get_json_backend, set_json_backend
+    from .hooks import (
+        ConversionEvent,
+        Hook,
+        LoggingHook,
+        OpenTelemetryHook,
+        PrometheusHook,
+        RequestEvent,
+        add_hook,
+        get_hooks,
+        remove_hook,
+        set_hooks,
+    )
+    from .maps import (
+        MapApiParameters,
+        get_geoseries,
+        get_geoseries_info,
+        get_shape_files,
+    )
+    from .rate_limit import (
+        RateLimiter,
+        SQLiteRateLimiter,
+        configure_rate_limiter,
+        get_rate_limiter,
+        set_rate_limiter,
+    )
+    from .realtime import filter_asof, get_realtime_dates, set_realtime_dates
+    from .releases import (
+        ReleaseApiParameters,
+        get_release,
+        get_release_dates,
+        get_release_related_tags,
+        get_release_series,
+        get_release_sources,
+        get_release_tables,
+        get_release_tags,
+        get_releases,
+        get_releases_dates,
+        iter_release_series,
+        iter_releases,
+    )
+    from .retry import (
+        RetryAttempt,
+        RetryPolicy,
+        RetryStats,
+        configure_retry_policy,
+        get_retry_policy,
+        set_retry_policy,
+    )
+    from .series import (
+        SeriesApiParameters,
+        SeriesInfo,
+        SeriesSearchParameters,
+        get_series,
+        get_series_all_releases,
+        get_series_asof_date,
+        get_series_categories,
+        get_series_info,
+        get_series_initial_release,
+        get_series_releases,
+        get_series_tags,
+        get_series_updates,
+        get_series_vintagedates,
+        iter_search_series,
+        search_series,
+        search_series_related_tags,
+        search_series_tags,
+    )
+    from .series_collection import SeriesCollection, SeriesData
+    from .session import SessionPool, configure_session_pool, get_session_pool
+    from .sources import (
+        SourceApiParameters,
+        get_source,
+        get_source_release,
+        get_sources,
+        iter_sources,
+    )
+    from .tags import (
+        TagsApiParameters,
+        get_related_tags,
+        get_series_matching_tags,
+        get_tags,
+        iter_series_matching_tags,
+        iter_tags,
+    )
@@ -4,15 +4,26 @@ The `_base` module is not intended to be used directly by the user. It is used b
 functions in pyfredapi.
 """
 
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
 from functools import lru_cache
 from http import HTTPStatus
 from os import environ
-from typing import Union
+from typing import Any, Dict, Optional, Union
 
 import requests
 from pydantic import BaseModel, ConfigDict
 
+from . import hooks
+from .cache import Cache, CacheKey, _cache_key, get_response_cache
+from .coalesce import RequestCoalescer, get_request_coalescer
+from .decoder import decode_json
 from .exceptions import APIKeyNotFound, FredAPIRequestError, InvalidAPIKey
+from .hooks import RequestEvent, _emit_request
+from .rate_limit import Limiter, get_rate_limiter
+from .retry import RetryPolicy, _RetryState, get_retry_policy
+from .session import SessionPool, get_session_pool
 from .utils._common_type_hints import JsonType
 
 
@@ -55,6 +66,49 @@ def _get_api_key(api_key: Union[str, None] = None) -> str:
 
 
 @lru_cache
+def _get_base_params(api_key: Union[str, None] = None) -> Dict[str, Any]:
+    """Get the validated base parameters of the requests made with an API key."""
+    return BaseApiParameters(api_key=_get_api_key(api_key)).model_dump()
+
+
+@dataclass(frozen=True)
+class _RequestContext:
+    """The components used to make a request, and the validated base parameters of a `FredClient`."""
+
+    session_pool: SessionPool
+    cache: Optional[Cache]
+    rate_limiter: Optional[Limiter]
+    retry_policy: Optional[RetryPolicy]
+    coalescer: Optional[RequestCoalescer]
+    base_params: Optional[Dict[str, Any]] = None
+
+
+# Set while the methods of a `FredClient` run, so the request functions use its components.
+_client_context: ContextVar[Optional[_RequestContext]] = ContextVar(
+    "pyfredapi_client_context", default=None
+)
+
+
+def _request_context() -> _RequestContext:
+    """Get the components of the active `FredClient`, or else the global components."""
+    context = _client_context.get()
+    if context is not None:
+        return context
+    return _RequestContext(
+        session_pool=get_session_pool(),
+        cache=get_response_cache(),
+        rate_limiter=get_rate_limiter(),
+        retry_policy=get_retry_policy(),
+        coalescer=get_request_coalescer(),
+    )
+
+
+def _active_cache() -> Optional[Cache]:
+    """Get the response cache of the active `FredClient`, or else the global response cache."""
+    context = _client_context.get()
+    return get_response_cache() if context is None else context.cache
+
+
 def _get_request(
     endpoint: str,
     api_key: Union[str, None] = None,
@@ -63,7 +117,14 @@ def _get_request(
 ) -> JsonType:
     """Make a get request to a FRED web service endpoint and return the response as Json.
 
-    Base get request that child class methods utilize.
+    Base get request that child class methods utilize. Requests are made through the
+    pooled keep-alive session returned by `pyfredapi.session.get_session_pool`, and successful
+    responses are stored in the cache returned by `pyfredapi.cache.get_response_cache`. Requests
+    that are not served from the cache wait for the rate limiter returned by
+    `pyfredapi.rate_limit.get_rate_limiter`, and transient failures are retried according to the
+    policy returned by `pyfredapi.retry.get_retry_policy`. Concurrent identical requests are merged
+    into one by the coalescer returned by `pyfredapi.coalesce.get_request_coalescer`. Within the
+    methods of a `pyfredapi.FredClient`, the components of the client are used instead.
 
     Parameters
     ----------
@@ -71,8 +132,8 @@ def _get_request(
         The FRED API endpoint.
     api_key : str | None, optional
         FRED API key. Defaults to None. If None, will check for FRED_API_KEY in the environment.
-    params : Dict[str, Any] | None, optional
-        Dictionary of query parameters. Defaults to None.
+    params : frozenset | None, optional
+        Frozenset of query parameters. Defaults to None.
     base_url : str, optional
         Base fred url. Defaults to https://api.stlouisfed.org/fred.
 
@@ -83,31 +144,160 @@ def _get_request(
     Raises
     ------
     FredAPIRequestError
-        If the request fails.
+        If the request fails. The `attempts` attribute of the error lists every attempt.
 
     """
-    api_key = _get_api_key(api_key)
-    _base_params = BaseApiParameters(api_key=api_key)
+    if not hooks._hooks:
+        return _request(endpoint, api_key, params, base_url, None)
+
+    event = RequestEvent(endpoint=endpoint, base_url=base_url)
+    start = time.perf_counter()
+    try:
+        return _request(endpoint, api_key, params, base_url, event)
+    except BaseException as e:
+        event.error = e
+        if isinstance(e, FredAPIRequestError):
+            event.status_code = e.status_code
+        raise
+    finally:
+        event.duration = time.perf_counter() - start
+        _emit_request(event)
+
+
+def _request(
+    endpoint: str,
+    api_key: Union[str, None],
+    params: Union[frozenset, None],
+    base_url: str,
+    event: Optional[RequestEvent],
+) -> JsonType:
+    """Serve a request from the cache, or else fetch it. `event` is filled in if hooks are registered."""
+    # Only the cache is looked up before a cache hit, to keep the overhead of hits low.
+    client_context = _client_context.get()
+    cache = get_response_cache() if client_context is None else client_context.cache
+    key = _cache_key(endpoint, params, base_url)
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            if event is not None:
+                event.cache_hit = True
+                event.status_code = HTTPStatus.OK.value
+            return cached
+
+    context = client_context or _request_context()
+    coalescer = context.coalescer
+    if coalescer is None:
+        return _fetch(endpoint, api_key, params, base_url, key, context, event)
+    data = coalescer.run(
+        (key, api_key),
+        lambda: _fetch(endpoint, api_key, params, base_url, key, context, event),
+    )
+    if event is not None and not event.attempts:
+        # Another caller made the request.
+        event.coalesced = True
+        event.status_code = HTTPStatus.OK.value
+    return data
+
+
+def _fetch(
+    endpoint: str,
+    api_key: Union[str, None],
+    params: Union[frozenset, None],
+    base_url: str,
+    key: CacheKey,
+    context: _RequestContext,
+    event: Optional[RequestEvent] = None,
+) -> JsonType:
+    """Request a FRED web service endpoint that missed the cache, and store the response in the cache."""
+    limiter = context.rate_limiter
+    retry = _RetryState(context.retry_policy)
+    while True:
+        if limiter is not None:
+            limiter.acquire()
+        retry.begin()
+        if event is not None:
+            sent = time.perf_counter()
+            event.attempts += 1
+        try:
+            response = context.session_pool.get(
+                f"{base_url}/{endpoint}",
+                params=_build_request_params(api_key, params, context.base_params),
+                timeout=30,
+            )
+        except requests.exceptions.RequestException as e:
+            if event is not None:
+                event.latency += time.perf_counter() - sent
+            message = f"Error invoking Fred API: {e}"
+            wait = retry.failed(None, message)
+            if wait is None:
+                raise FredAPIRequestError(
+                    message=message, status_code=None, attempts=retry.attempts
+                ) from e
+        else:
+            if event is not None:
+                event.latency += time.perf_counter() - sent
+                event.status_code = response.status_code
+                event.bytes_received += len(response.content)
+            if response.status_code == HTTPStatus.OK:
+                retry.succeeded(response.status_code)
+                break
+            message = _error_message(response)
+            wait = retry.failed(response.status_code, message, response.headers)
+            if wait is None:
+                raise FredAPIRequestError(
+                    message=message,
+                    status_code=response.status_code,
+                    attempts=retry.attempts,
+                )
+        time.sleep(wait)
+
+    if event is None:
+        data = decode_json(response.content)
+    else:
+        decode_start = time.perf_counter()
+        data = decode_json(response.content)
+        event.decode_time = time.perf_counter() - decode_start
+    cache = context.cache
+    if cache is not None:
+        cache.set(
+            key,
+            data,
+            size=len(response.content),
+            ttl=cache.ttl_for(endpoint, params),
+            content=response.content,
+        )
+    return data
+
+
+def _build_request_params(
+    api_key: Union[str, None] = None,
+    params: Union[frozenset, None] = None,
+    base_params: Union[Dict[str, Any], None] = None,
+) -> Dict[str, Any]:
+    """Combine the base parameters and the endpoint parameters into the query parameters of a request.
+
+    `base_params` are base parameters that were validated ahead of time, e.g. by a `FredClient`.
+    They are used unless an `api_key` is given.
+    """
+    if api_key is not None or base_params is None:
+        base_params = _get_base_params(api_key)
 
     if not params:
         params = frozenset({}.items())
 
-    fparams = dict(params)
+    return {**base_params, **dict(params)}
+
 
+def _error_message(response: Any) -> str:
+    """Get the error message of a failed response from the FRED API.
+
+    FRED returns the error message as Json, but gateways in front of it can return HTML pages,
+    e.g. on 502 and 504 errors, so fall back to the status line of the response.
+    """
     try:
-        response = requests.get(
-            f"{base_url}/{endpoint}",
-            params={**_base_params.model_dump(), **fparams},
-            timeout=30,
+        return response.json()["error_message"]
+    except (ValueError, KeyError, TypeError):
+        reason = getattr(response, "reason", None) or getattr(
+            response, "reason_phrase", ""
         )
-    except requests.exceptions.RequestException as e:
-        raise FredAPIRequestError(
-            message=f"Error invoking Fred API: {e}", status_code=None
-        ) from e
-    if response.status_code != HTTPStatus.OK:
-        raise FredAPIRequestError(
-            message=response.json()["error_message"],
-            status_code=response.status_code,
-        )
-
-    return response.json()
+        return f"{response.status_code} {reason}".strip()
@@ -0,0 +1,187 @@
+"""The `_pagination` module requests every page of the FRED API endpoints that accept `limit` and `offset`.
+
+The first page is requested with the largest page size FRED allows. The total number of records is
+read from the `count` of the first page, and the remaining pages are requested concurrently. Every
+page goes through `_get_request`, so the pages share the response cache, the rate limiter, and the
+retry policy of the other request functions. The pages are requested in a copy of the context of the
+caller, so the pages of a `FredClient` method use the components of the client.
+
+`_iter_pages` yields the pages lazily instead. Only the next `prefetch` pages are requested in the
+background while the current page is processed, so memory stays bounded for large listings.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Union
+
+from ._base import _get_request, _request_context
+from .utils._common_type_hints import JsonType, ReturnTypes
+from .utils._convert_to_df import _convert_records
+from .utils.enums import ReturnFormat
+
+MAX_PAGE_SIZE = 1000
+DEFAULT_PREFETCH = 2
+
+
+def _first_page_params(params: Optional[frozenset]) -> Dict[str, Any]:
+    first_page_params = dict(params or frozenset())
+    first_page_params.setdefault("limit", MAX_PAGE_SIZE)
+    return first_page_params
+
+
+def _page_offsets(first_page: JsonType) -> range:
+    """Get the offsets of the pages after the first page."""
+    offset = int(first_page.get("offset", 0))
+    limit = int(first_page["limit"])
+    return range(offset + limit, int(first_page["count"]), limit)
+
+
+def _page_params(params: Dict[str, Any], offset: int) -> frozenset:
+    return frozenset({**params, "offset": offset}.items())
+
+
+def _merge_pages(
+    first_page: JsonType, pages: List[JsonType], records_key: str
+) -> JsonType:
+    """Merge the records of all pages into the first page."""
+    records = list(first_page[records_key])
+    for page in pages:
+        records.extend(page[records_key])
+    return {**first_page, "limit": len(records), records_key: records}
+
+
+def _get_all_pages(
+    endpoint: str,
+    records_key: str,
+    api_key: Union[str, None] = None,
+    params: Union[frozenset, None] = None,
+) -> JsonType:
+    """Request every page of a FRED API endpoint and merge them into a single response.
+
+    Parameters
+    ----------
+    endpoint : str
+        The FRED API endpoint.
+    records_key : str
+        Key of the list of records in the response, e.g. "seriess".
+    api_key : str | None, optional
+        FRED API key. Defaults to None. If None, will check for FRED_API_KEY in the environment.
+    params : frozenset | None, optional
+        Frozenset of query parameters. The `limit` is used as the page size and defaults to 1000.
+
+    Returns
+    -------
+    A dictionary representing the json response, with the records of every page.
+
+    """
+    params_dict = _first_page_params(params)
+    first_page = _get_request(
+        endpoint=endpoint, api_key=api_key, params=frozenset(params_dict.items())
+    )
+
+    offsets = _page_offsets(first_page)
+    if not offsets:
+        return first_page
+
+    max_workers = min(len(offsets), _request_context().session_pool.pool_size)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                copy_context().run,
+                _get_request,
+                endpoint=endpoint,
+                api_key=api_key,
+                params=_page_params(params_dict, offset),
+            )
+            for offset in offsets
+        ]
+        pages = [future.result() for future in futures]
+
+    return _merge_pages(first_page, pages, records_key)
+
+
+def _iter_pages(
+    endpoint: str,
+    api_key: Union[str, None] = None,
+    params: Union[frozenset, None] = None,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> Iterator[JsonType]:
+    """Lazily request the pages of a FRED API endpoint.
+
+    Parameters
+    ----------
+    endpoint : str
+        The FRED API endpoint.
+    api_key : str | None, optional
+        FRED API key. Defaults to None. If None, will check for FRED_API_KEY in the environment.
+    params : frozenset | None, optional
+        Frozenset of query parameters. The `limit` is used as the page size and defaults to 1000.
+    prefetch : int, optional
+        Number of pages to request in the background ahead of the consumer. Defaults to 2.
+        If 0, each page is requested when it is needed.
+
+    Yields
+    ------
+    A dictionary representing the json response of each page.
+
+    """
+    if prefetch < 0:
+        raise ValueError(f"`prefetch` must be a non-negative integer, not {prefetch}.")
+
+    params_dict = _first_page_params(params)
+    first_page = _get_request(
+        endpoint=endpoint, api_key=api_key, params=frozenset(params_dict.items())
+    )
+
+    offsets = iter(_page_offsets(first_page))
+    if prefetch == 0:
+        yield first_page
+        for offset in offsets:
+            yield _get_request(
+                endpoint=endpoint,
+                api_key=api_key,
+                params=_page_params(params_dict, offset),
+            )
+        return
+
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+
+    def submit(offset: int) -> Future:
+        return executor.submit(
+            copy_context().run,
+            _get_request,
+            endpoint=endpoint,
+            api_key=api_key,
+            params=_page_params(params_dict, offset),
+        )
+
+    # The next pages are requested while the consumer processes the current one.
+    pending: Deque[Future] = deque(submit(o) for o in islice(offsets, prefetch))
+    try:
+        yield first_page
+        while pending:
+            page = pending.popleft().result()
+            next_offset = next(offsets, None)
+            if next_offset is not None:
+                pending.append(submit(next_offset))
+            yield page
+    finally:
+        # Stop prefetching if the consumer stops early.
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _iter_records(
+    pages: Iterable[JsonType], records_key: str, return_format: ReturnFormat
+) -> Iterator[ReturnTypes]:
+    """Yield the records of each page, or a dataframe per page."""
+    for page in pages:
+        if return_format == ReturnFormat.json:
+            yield from page[records_key]
+        else:
+            yield _convert_records(page[records_key], return_format)
@@ -0,0 +1,141 @@
+"""pyfredapi.aio - asyncio client for the FRED API
+================================================.
+
+`pyfredapi.aio` provides awaitable versions of the request functions exported by `pyfredapi`.
+The coroutines share one pooled `httpx.AsyncClient` per event loop, so many requests can be made
+concurrently from a single event loop without a thread per request.
+
+Requires the `httpx` package, which can be installed with `pip install 'pyfredapi[aio]'`.
+
+>>> import asyncio
+>>> import pyfredapi.aio as pfa
+>>> async def main():
+...     return await asyncio.gather(*(pfa.get_series(s) for s in ["GDP", "CPIAUCSL"]))
+>>> gdp, cpi = asyncio.run(main())
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Like `pyfredapi`, the submodules are only loaded when one of their attributes is first accessed.
+_lazy_attrs = {
+    "get_category": "category",
+    "get_category_children": "category",
+    "get_category_related": "category",
+    "get_category_related_tags": "category",
+    "get_category_series": "category",
+    "get_category_tags": "category",
+    "iter_category_series": "category",
+    "get_geoseries": "maps",
+    "get_geoseries_info": "maps",
+    "get_shape_files": "maps",
+    "get_release": "releases",
+    "get_release_dates": "releases",
+    "get_release_related_tags": "releases",
+    "get_release_series": "releases",
+    "get_release_sources": "releases",
+    "get_release_tables": "releases",
+    "get_release_tags": "releases",
+    "get_releases": "releases",
+    "get_releases_dates": "releases",
+    "iter_release_series": "releases",
+    "iter_releases": "releases",
+    "get_series": "series",
+    "get_series_all_releases": "series",
+    "get_series_asof_date": "series",
+    "get_series_categories": "series",
+    "get_series_info": "series",
+    "get_series_initial_release": "series",
+    "get_series_releases": "series",
+    "get_series_tags": "series",
+    "get_series_updates": "series",
+    "get_series_vintagedates": "series",
+    "iter_search_series": "series",
+    "search_series": "series",
+    "search_series_related_tags": "series",
+    "search_series_tags": "series",
+    "AsyncSessionPool": "session",
+    "configure_session_pool": "session",
+    "get_session_pool": "session",
+    "get_source": "sources",
+    "get_source_release": "sources",
+    "get_sources": "sources",
+    "iter_sources": "sources",
+    "get_related_tags": "tags",
+    "get_series_matching_tags": "tags",
+    "get_tags": "tags",
+    "iter_series_matching_tags": "tags",
+    "iter_tags": "tags",
+}
+
+_submodules = {"category", "maps", "releases", "series", "session", "sources", "tags"}
+
+__all__ = sorted(_lazy_attrs)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+
+    module = _lazy_attrs.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_lazy_attrs, *_submodules})
+
+
+if TYPE_CHECKING:
+    from .category import (
+        get_category,
+        get_category_children,
+        get_category_related,
+        get_category_related_tags,
+        get_category_series,
+        get_category_tags,
+        iter_category_series,
+    )
+    from .maps import get_geoseries, get_geoseries_info, get_shape_files
+    from .releases import (
+        get_release,
+        get_release_dates,
+        get_release_related_tags,
+        get_release_series,
+        get_release_sources,
+        get_release_tables,
+        get_release_tags,
+        get_releases,
+        get_releases_dates,
+        iter_release_series,
+        iter_releases,
+    )
+    from .series import (
+        get_series,
+        get_series_all_releases,
+        get_series_asof_date,
+        get_series_categories,
+        get_series_info,
+        get_series_initial_release,
+        get_series_releases,
+        get_series_tags,
+        get_series_updates,
+        get_series_vintagedates,
+        iter_search_series,
+        search_series,
+        search_series_related_tags,
+        search_series_tags,
+    )
+    from .session import AsyncSessionPool, configure_session_pool, get_session_pool
+    from .sources import get_source, get_source_release, get_sources, iter_sources
+    from .tags import (
+        get_related_tags,
+        get_series_matching_tags,
+        get_tags,
+        iter_series_matching_tags,
+        iter_tags,
+    )
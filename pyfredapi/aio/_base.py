@@ -0,0 +1,198 @@
+"""The `aio._base` module contains the async get request function used in the `pyfredapi.aio` modules."""
+
+import asyncio
+import functools
+import time
+from http import HTTPStatus
+from typing import Any, Callable, Optional, Union
+
+from pyfredapi import hooks
+from pyfredapi._base import _build_request_params, _error_message
+from pyfredapi.cache import CacheKey, SQLiteCache, _cache_key, get_response_cache
+from pyfredapi.coalesce import get_request_coalescer
+from pyfredapi.decoder import decode_json
+from pyfredapi.exceptions import FredAPIRequestError
+from pyfredapi.hooks import RequestEvent, _emit_request
+from pyfredapi.rate_limit import SQLiteRateLimiter, get_rate_limiter
+from pyfredapi.retry import _RetryState, get_retry_policy
+from pyfredapi.utils._common_type_hints import JsonType
+
+from .session import _require_httpx, get_session_pool
+
+
+async def _get_request(
+    endpoint: str,
+    api_key: Union[str, None] = None,
+    params: Union[frozenset, None] = None,
+    base_url: str = "https://api.stlouisfed.org/fred",
+) -> JsonType:
+    """Make an async get request to a FRED web service endpoint and return the response as Json.
+
+    Successful responses are stored in the same cache, and requests share the same rate limiter,
+    as the sync request functions. Transient failures are retried according to the same retry policy.
+    Waiting for the rate limiter or between retries does not block the event loop, and a
+    `SQLiteCache` or `SQLiteRateLimiter` is used from a worker thread. Concurrent
+    identical requests in the same event loop are merged into one by the request coalescer.
+
+    Parameters
+    ----------
+    endpoint : str
+        The FRED API endpoint.
+    api_key : str | None, optional
+        FRED API key. Defaults to None. If None, will check for FRED_API_KEY in the environment.
+    params : frozenset | None, optional
+        Frozenset of query parameters. Defaults to None.
+    base_url : str, optional
+        Base fred url. Defaults to https://api.stlouisfed.org/fred.
+
+    Returns
+    -------
+    A dictionary representing the json response.
+
+    Raises
+    ------
+    FredAPIRequestError
+        If the request fails. The `attempts` attribute of the error lists every attempt.
+
+    """
+    _require_httpx()
+
+    if not hooks._hooks:
+        return await _request(endpoint, api_key, params, base_url, None)
+
+    event = RequestEvent(endpoint=endpoint, base_url=base_url)
+    start = time.perf_counter()
+    try:
+        return await _request(endpoint, api_key, params, base_url, event)
+    except BaseException as e:
+        event.error = e
+        if isinstance(e, FredAPIRequestError):
+            event.status_code = e.status_code
+        raise
+    finally:
+        event.duration = time.perf_counter() - start
+        _emit_request(event)
+
+
+async def _run_blocking(function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking call, e.g. to a SQLite database, in the default executor of the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, functools.partial(function, *args, **kwargs)
+    )
+
+
+async def _request(
+    endpoint: str,
+    api_key: Union[str, None],
+    params: Union[frozenset, None],
+    base_url: str,
+    event: Optional[RequestEvent],
+) -> JsonType:
+    """Serve a request from the cache, or else fetch it. `event` is filled in if hooks are registered."""
+    cache = get_response_cache()
+    key = _cache_key(endpoint, params, base_url)
+    if cache is not None:
+        if isinstance(cache, SQLiteCache):
+            cached = await _run_blocking(cache.get, key)
+        else:
+            cached = cache.get(key)
+        if cached is not None:
+            if event is not None:
+                event.cache_hit = True
+                event.status_code = HTTPStatus.OK.value
+            return cached
+
+    coalescer = get_request_coalescer()
+    if coalescer is None:
+        return await _fetch(endpoint, api_key, params, base_url, key, event)
+    data = await coalescer.arun(
+        (key, api_key),
+        lambda: _fetch(endpoint, api_key, params, base_url, key, event),
+    )
+    if event is not None and not event.attempts:
+        # Another caller made the request.
+        event.coalesced = True
+        event.status_code = HTTPStatus.OK.value
+    return data
+
+
+async def _fetch(
+    endpoint: str,
+    api_key: Union[str, None],
+    params: Union[frozenset, None],
+    base_url: str,
+    key: CacheKey,
+    event: Optional[RequestEvent] = None,
+) -> JsonType:
+    """Request a FRED web service endpoint that missed the cache, and store the response in the cache."""
+    import httpx
+
+    limiter = get_rate_limiter()
+    retry = _RetryState(get_retry_policy())
+    while True:
+        if limiter is not None:
+            if isinstance(limiter, SQLiteRateLimiter):
+                wait = await _run_blocking(limiter.reserve)
+            else:
+                wait = limiter.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        retry.begin()
+        if event is not None:
+            sent = time.perf_counter()
+            event.attempts += 1
+        try:
+            response = await get_session_pool().get(
+                f"{base_url}/{endpoint}",
+                params=_build_request_params(api_key, params),
+                timeout=30,
+            )
+        except httpx.HTTPError as e:
+            if event is not None:
+                event.latency += time.perf_counter() - sent
+            message = f"Error invoking Fred API: {e}"
+            retry_wait = retry.failed(None, message)
+            if retry_wait is None:
+                raise FredAPIRequestError(
+                    message=message, status_code=None, attempts=retry.attempts
+                ) from e
+        else:
+            if event is not None:
+                event.latency += time.perf_counter() - sent
+                event.status_code = response.status_code
+                event.bytes_received += len(response.content)
+            if response.status_code == HTTPStatus.OK:
+                retry.succeeded(response.status_code)
+                break
+            message = _error_message(response)
+            retry_wait = retry.failed(response.status_code, message, response.headers)
+            if retry_wait is None:
+                raise FredAPIRequestError(
+                    message=message,
+                    status_code=response.status_code,
+                    attempts=retry.attempts,
+                )
+        await asyncio.sleep(retry_wait)
+
+    if event is None:
+        data = decode_json(response.content)
+    else:
+        decode_start = time.perf_counter()
+        data = decode_json(response.content)
+        event.decode_time = time.perf_counter() - decode_start
+    cache = get_response_cache()
+    if cache is not None:
+        store = functools.partial(
+            cache.set,
+            key,
+            data,
+            size=len(response.content),
+            ttl=cache.ttl_for(endpoint, params),
+            content=response.content,
+        )
+        if isinstance(cache, SQLiteCache):
+            await _run_blocking(store)
+        else:
+            store()
+    return data
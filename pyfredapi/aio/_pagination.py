@@ -0,0 +1,107 @@
+"""The `aio._pagination` module requests every page of the FRED API endpoints that accept `limit` and `offset` concurrently."""
+
+import asyncio
+from collections import deque
+from itertools import islice
+from typing import AsyncIterator, Deque, Union
+
+from pyfredapi._pagination import (
+    DEFAULT_PREFETCH,
+    _first_page_params,
+    _merge_pages,
+    _page_offsets,
+    _page_params,
+)
+from pyfredapi.utils._common_type_hints import JsonType, ReturnTypes
+from pyfredapi.utils._convert_to_df import _convert_records
+from pyfredapi.utils.enums import ReturnFormat
+
+from ._base import _get_request
+
+
+async def _get_all_pages(
+    endpoint: str,
+    records_key: str,
+    api_key: Union[str, None] = None,
+    params: Union[frozenset, None] = None,
+) -> JsonType:
+    """Request every page of a FRED API endpoint and merge them into a single response. Async version of `pyfredapi._pagination._get_all_pages`."""
+    params_dict = _first_page_params(params)
+    first_page = await _get_request(
+        endpoint=endpoint, api_key=api_key, params=frozenset(params_dict.items())
+    )
+
+    pages = await asyncio.gather(
+        *(
+            _get_request(
+                endpoint=endpoint,
+                api_key=api_key,
+                params=_page_params(params_dict, offset),
+            )
+            for offset in _page_offsets(first_page)
+        )
+    )
+    if not pages:
+        return first_page
+    return _merge_pages(first_page, list(pages), records_key)
+
+
+async def _iter_pages(
+    endpoint: str,
+    api_key: Union[str, None] = None,
+    params: Union[frozenset, None] = None,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> AsyncIterator[JsonType]:
+    """Lazily request the pages of a FRED API endpoint. Async version of `pyfredapi._pagination._iter_pages`."""
+    if prefetch < 0:
+        raise ValueError(f"`prefetch` must be a non-negative integer, not {prefetch}.")
+
+    params_dict = _first_page_params(params)
+    first_page = await _get_request(
+        endpoint=endpoint, api_key=api_key, params=frozenset(params_dict.items())
+    )
+
+    offsets = iter(_page_offsets(first_page))
+    if prefetch == 0:
+        yield first_page
+        for offset in offsets:
+            yield await _get_request(
+                endpoint=endpoint,
+                api_key=api_key,
+                params=_page_params(params_dict, offset),
+            )
+        return
+
+    def schedule(offset: int) -> asyncio.Task:
+        return asyncio.ensure_future(
+            _get_request(
+                endpoint=endpoint,
+                api_key=api_key,
+                params=_page_params(params_dict, offset),
+            )
+        )
+
+    pending: Deque[asyncio.Task] = deque(schedule(o) for o in islice(offsets, prefetch))
+    try:
+        yield first_page
+        while pending:
+            page = await pending.popleft()
+            next_offset = next(offsets, None)
+            if next_offset is not None:
+                pending.append(schedule(next_offset))
+            yield page
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _iter_records(
+    pages: AsyncIterator[JsonType], records_key: str, return_format: ReturnFormat
+) -> AsyncIterator[ReturnTypes]:
+    """Yield the records of each page, or a dataframe per page. Async version of `pyfredapi._pagination._iter_records`."""
+    async for page in pages:
+        if return_format == ReturnFormat.json:
+            for record in page[records_key]:
+                yield record
+        else:
+            yield _convert_records(page[records_key], return_format)
@@ -0,0 +1,147 @@
+"""The `aio.category` module provides coroutines to request data from the [FRED API Categories endpoints](https://fred.stlouisfed.org/docs/api/fred/#Categories)."""
+
+from __future__ import annotations
+
+from typing import AsyncIterator, Dict, List, Optional
+
+from pyfredapi._pagination import DEFAULT_PREFETCH
+from pyfredapi.category import CategoryApiParameters
+from pyfredapi.series import SeriesInfo
+from pyfredapi.utils import _validated_params
+from pyfredapi.utils._common_type_hints import (
+    ApiKeyType,
+    JsonType,
+    KwargsType,
+    ReturnFormats,
+    ReturnTypes,
+)
+from pyfredapi.utils._convert_to_df import _convert_records
+from pyfredapi.utils.enums import ReturnFormat
+
+from ._base import _get_request
+from ._pagination import _get_all_pages, _iter_pages, _iter_records
+
+
+async def get_category(
+    category_id: Optional[int] = None, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> JsonType:
+    """Get category by ID. Async version of `pyfredapi.get_category`."""
+    params = _validated_params(CategoryApiParameters, category_id=category_id, **kwargs)
+    return await _get_request(
+        endpoint="category",
+        api_key=api_key,
+        params=params,
+    )
+
+
+async def get_category_children(
+    category_id: Optional[int] = None, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> JsonType:
+    """Get category children by category ID. Async version of `pyfredapi.get_category_children`."""
+    params = _validated_params(CategoryApiParameters, category_id=category_id, **kwargs)
+    return await _get_request(
+        endpoint="category/children",
+        api_key=api_key,
+        params=params,
+    )
+
+
+async def get_category_related(
+    category_id: int, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> JsonType:
+    """Get related categories by category ID. Async version of `pyfredapi.get_category_related`."""
+    params = _validated_params(CategoryApiParameters, category_id=category_id, **kwargs)
+    return await _get_request(
+        endpoint="category/related",
+        api_key=api_key,
+        params=params,
+    )
+
+
+async def get_category_series(
+    category_id: int,
+    api_key: ApiKeyType = None,
+    paginate: bool = False,
+    **kwargs: KwargsType,
+) -> Dict[str, SeriesInfo]:
+    """Get the series info for each series in a category. Async version of `pyfredapi.get_category_series`."""
+    params = _validated_params(CategoryApiParameters, category_id=category_id, **kwargs)
+    if paginate:
+        response = await _get_all_pages(
+            endpoint="category/series",
+            records_key="seriess",
+            api_key=api_key,
+            params=params,
+        )
+    else:
+        response = await _get_request(
+            endpoint="category/series",
+            api_key=api_key,
+            params=params,
+        )
+
+    return {series["id"]: SeriesInfo(**series) for series in response["seriess"]}
+
+
+async def iter_category_series(
+    category_id: int,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    prefetch: int = DEFAULT_PREFETCH,
+    **kwargs: KwargsType,
+) -> AsyncIterator[ReturnTypes]:
+    """Lazily iterate over the series in a category. Async version of `pyfredapi.iter_category_series`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(CategoryApiParameters, category_id=category_id, **kwargs)
+    pages = _iter_pages(
+        endpoint="category/series", api_key=api_key, params=params, prefetch=prefetch
+    )
+    async for item in _iter_records(pages, "seriess", return_format):
+        yield item
+
+
+async def get_category_tags(
+    category_id: Optional[int] = None,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    columns: Optional[List[str]] = None,
+    categorical: bool = False,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
+    """Get the FRED tags for a category. Async version of `pyfredapi.get_category_tags`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(CategoryApiParameters, category_id=category_id, **kwargs)
+    response = await _get_request(
+        endpoint="category/tags",
+        api_key=api_key,
+        params=params,
+    )
+
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["tags"], return_format, columns, categorical)
+
+
+async def get_category_related_tags(
+    category_id: Optional[int] = None,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    columns: Optional[List[str]] = None,
+    categorical: bool = False,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
+    """Get the related FRED tags for a category. Async version of `pyfredapi.get_category_related_tags`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(CategoryApiParameters, category_id=category_id, **kwargs)
+    response = await _get_request(
+        endpoint="category/related_tags",
+        api_key=api_key,
+        params=params,
+    )
+
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["tags"], return_format, columns, categorical)
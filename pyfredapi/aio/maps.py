@@ -0,0 +1,93 @@
+"""The `aio.maps` module provides coroutines to request data from the [FRED API Maps endpoints](https://fred.stlouisfed.org/docs/api/fred/#Maps)."""
+
+import asyncio
+from typing import Literal, Optional
+
+from pyfredapi.maps import (
+    GeoseriesData,
+    GeoseriesInfo,
+    MapApiParameters,
+    _geo_fred_url,
+)
+from pyfredapi.utils import _validated_params
+from pyfredapi.utils._common_type_hints import ApiKeyType, JsonType, ReturnFormats
+from pyfredapi.utils.enums import ReturnFormat
+
+from ._base import _get_request
+
+
+async def get_geoseries_info(
+    series_id: str, api_key: ApiKeyType = None
+) -> GeoseriesInfo:
+    """Request the metadata for a given geo series id. Async version of `pyfredapi.get_geoseries_info`."""
+    params = _validated_params(MapApiParameters, series_id=series_id)
+    response = await _get_request(
+        base_url=_geo_fred_url,
+        endpoint="series/group",
+        api_key=api_key,
+        params=params,
+    )
+    return GeoseriesInfo(**response["series_group"])
+
+
+async def get_shape_files(
+    shape: Literal[
+        "bea",
+        "msa",
+        "frb",
+        "necta",
+        "state",
+        "country",
+        "county",
+        "censusregion",
+        "censusdivision",
+    ],
+    api_key: ApiKeyType = None,
+) -> JsonType:
+    """Request shape files from FRED in Well-known text (WKT) format. Async version of `pyfredapi.get_shape_files`."""
+    params = _validated_params(MapApiParameters, shape=shape)
+    return await _get_request(
+        base_url=_geo_fred_url,
+        endpoint="shapes/file",
+        api_key=api_key,
+        params=params,
+    )
+
+
+async def get_geoseries(
+    series_id: str,
+    api_key: ApiKeyType = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    return_format: ReturnFormats = "pandas",
+) -> GeoseriesData:
+    """Request a cross section of regional data. Async version of `pyfredapi.get_geoseries`.
+
+    The geo series data and metadata are requested concurrently.
+    """
+    params = _validated_params(
+        MapApiParameters, series_id=series_id, date=end_date, start_date=start_date
+    )
+    response, geoseries_info = await asyncio.gather(
+        _get_request(
+            endpoint="series/data",
+            api_key=api_key,
+            params=params,
+            base_url=_geo_fred_url,
+        ),
+        get_geoseries_info(series_id=series_id, api_key=api_key),
+    )
+
+    if return_format == ReturnFormat.pandas:
+        import pandas as pd
+
+        dfs = []
+        for date, data in response["meta"]["data"].items():
+            t = pd.DataFrame.from_dict(data)
+            t["date"] = date
+            t["date"] = pd.to_datetime(t["date"])
+            dfs.append(t)
+
+        return GeoseriesData(info=geoseries_info, data=pd.concat(dfs))
+    else:
+        return GeoseriesData(info=geoseries_info, data=response["meta"]["data"])
@@ -0,0 +1,195 @@
+"""The `aio.releases` module provides coroutines to request data from the [FRED API Releases endpoints](https://fred.stlouisfed.org/docs/api/fred/#Releases)."""
+
+from typing import AsyncIterator
+
+from pyfredapi._pagination import DEFAULT_PREFETCH
+from pyfredapi.releases import ReleaseApiParameters
+from pyfredapi.utils import _validated_params
+from pyfredapi.utils._common_type_hints import (
+    ApiKeyType,
+    JsonType,
+    KwargsType,
+    ReturnFormats,
+    ReturnTypes,
+)
+from pyfredapi.utils._convert_to_df import _convert_records
+from pyfredapi.utils.enums import ReturnFormat
+
+from ._base import _get_request
+from ._pagination import _get_all_pages, _iter_pages, _iter_records
+
+
+async def get_releases(
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    paginate: bool = False,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
+    """Get all releases of economic data. Async version of `pyfredapi.get_releases`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(ReleaseApiParameters, **kwargs)
+    if paginate:
+        response = await _get_all_pages(
+            endpoint="releases",
+            records_key="releases",
+            api_key=api_key,
+            params=params,
+        )
+    else:
+        response = await _get_request(
+            endpoint="releases", api_key=api_key, params=params
+        )
+
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["releases"], return_format)
+
+
+async def iter_releases(
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    prefetch: int = DEFAULT_PREFETCH,
+    **kwargs: KwargsType,
+) -> AsyncIterator[ReturnTypes]:
+    """Lazily iterate over all releases of economic data. Async version of `pyfredapi.iter_releases`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(ReleaseApiParameters, **kwargs)
+    pages = _iter_pages(
+        endpoint="releases", api_key=api_key, params=params, prefetch=prefetch
+    )
+    async for item in _iter_records(pages, "releases", return_format):
+        yield item
+
+
+async def get_releases_dates(
+    api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> JsonType:
+    """Get release dates for all releases of economic data. Async version of `pyfredapi.get_releases_dates`."""
+    params = _validated_params(ReleaseApiParameters, **kwargs)
+    return await _get_request(
+        endpoint="releases/dates",
+        api_key=api_key,
+        params=params,
+    )
+
+
+async def get_release(
+    release_id: int, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> JsonType:
+    """Get a release of economic data. Async version of `pyfredapi.get_release`."""
+    params = _validated_params(ReleaseApiParameters, release_id=release_id, **kwargs)
+    return await _get_request(
+        endpoint="release",
+        api_key=api_key,
+        params=params,
+    )
+
+
+async def get_release_dates(
+    release_id: int, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> JsonType:
+    """Get release dates for a release of economic data. Async version of `pyfredapi.get_release_dates`."""
+    params = _validated_params(ReleaseApiParameters, release_id=release_id, **kwargs)
+    return await _get_request(
+        endpoint="release/dates",
+        api_key=api_key,
+        params=params,
+    )
+
+
+async def get_release_series(
+    release_id: int,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    paginate: bool = False,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
+    """Get the series on a release of economic data. Async version of `pyfredapi.get_release_series`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(ReleaseApiParameters, release_id=release_id, **kwargs)
+    if paginate:
+        response = await _get_all_pages(
+            endpoint="release/series",
+            records_key="seriess",
+            api_key=api_key,
+            params=params,
+        )
+    else:
+        response = await _get_request(
+            endpoint="release/series", api_key=api_key, params=params
+        )
+
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["seriess"], return_format)
+
+
+async def iter_release_series(
+    release_id: int,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    prefetch: int = DEFAULT_PREFETCH,
+    **kwargs: KwargsType,
+) -> AsyncIterator[ReturnTypes]:
+    """Lazily iterate over the series on a release of economic data. Async version of `pyfredapi.iter_release_series`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(ReleaseApiParameters, release_id=release_id, **kwargs)
+    pages = _iter_pages(
+        endpoint="release/series", api_key=api_key, params=params, prefetch=prefetch
+    )
+    async for item in _iter_records(pages, "seriess", return_format):
+        yield item
+
+
+async def get_release_sources(
+    release_id: int, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> JsonType:
+    """Get the sources for a release of economic data. Async version of `pyfredapi.get_release_sources`."""
+    params = _validated_params(ReleaseApiParameters, release_id=release_id, **kwargs)
+    return await _get_request(
+        endpoint="release/sources",
+        api_key=api_key,
+        params=params,
+    )
+
+
+async def get_release_tags(
+    release_id: int, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> JsonType:
+    """Get the FRED tags for a release. Async version of `pyfredapi.get_release_tags`."""
+    params = _validated_params(ReleaseApiParameters, release_id=release_id, **kwargs)
+    return await _get_request(
+        endpoint="release/tags",
+        api_key=api_key,
+        params=params,
+    )
+
+
+async def get_release_related_tags(
+    release_id: int, tag_names: str, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> JsonType:
+    """Get the related FRED tags within a release. Async version of `pyfredapi.get_release_related_tags`."""
+    params = _validated_params(
+        ReleaseApiParameters, release_id=release_id, tag_names=tag_names, **kwargs
+    )
+    return await _get_request(
+        endpoint="release/related_tags",
+        api_key=api_key,
+        params=params,
+    )
+
+
+async def get_release_tables(
+    release_id: int, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> JsonType:
+    """Get release table trees for a given release. Async version of `pyfredapi.get_release_tables`."""
+    params = _validated_params(ReleaseApiParameters, release_id=release_id, **kwargs)
+    return await _get_request(
+        endpoint="release/tables",
+        api_key=api_key,
+        params=params,
+    )
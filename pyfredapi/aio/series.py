@@ -0,0 +1,345 @@
+"""The `aio.series` module provides coroutines to request data from the [FRED API Series endpoints](https://fred.stlouisfed.org/docs/api/fred/#Series)."""
+
+from __future__ import annotations
+
+from typing import AsyncIterator, List, Literal, Optional
+
+from pyfredapi._pagination import DEFAULT_PREFETCH
+from pyfredapi.series import (
+    SeriesApiParameters,
+    SeriesInfo,
+    SeriesSearchParameters,
+    _earliest_realtime_start,
+    _has_realtime_params,
+    _latest_realtime_end,
+)
+from pyfredapi.utils import (
+    _validated_dict,
+    _validated_params,
+)
+from pyfredapi.utils._common_type_hints import (
+    ApiKeyType,
+    JsonType,
+    KwargsType,
+    ReturnFormats,
+    ReturnTypes,
+)
+from pyfredapi.utils._convert_to_df import (
+    _categorize,
+    _convert_observations,
+    _convert_records,
+)
+from pyfredapi.utils.enums import ReturnFormat
+
+from ._base import _get_request
+from ._pagination import _get_all_pages, _iter_pages, _iter_records
+
+
+async def get_series_info(
+    series_id: str, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> SeriesInfo:
+    """Get an economic data series information by ID. Async version of `pyfredapi.get_series_info`."""
+    params = _validated_params(SeriesApiParameters, series_id=series_id, **kwargs)
+    response = await _get_request(
+        endpoint="series",
+        api_key=api_key,
+        params=params,
+    )
+    return SeriesInfo(**response["seriess"][0])
+
+
+async def get_series_categories(
+    series_id: str, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> JsonType:
+    """Get the categories for an economic data series by ID. Async version of `pyfredapi.get_series_categories`."""
+    params = _validated_params(SeriesApiParameters, series_id=series_id, **kwargs)
+    return await _get_request(
+        endpoint="series/categories",
+        api_key=api_key,
+        params=params,
+    )
+
+
+async def get_series(
+    series_id: str,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "pandas",
+    columns: Optional[List[str]] = None,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
+    """Get the observations for an economic data series by ID. Async version of `pyfredapi.get_series`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(SeriesApiParameters, series_id=series_id, **kwargs)
+    response = await _get_request(
+        endpoint="series/observations",
+        api_key=api_key,
+        params=params,
+    )
+
+    if return_format == ReturnFormat.json:
+        return response["observations"]
+    return _convert_observations(
+        response["observations"],
+        return_format,
+        columns,
+        realtime=_has_realtime_params(params),
+    )
+
+
+async def get_series_releases(
+    series_id: str, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> JsonType:
+    """Get the FRED release for an economic data series by ID. Async version of `pyfredapi.get_series_releases`."""
+    params = _validated_params(SeriesApiParameters, series_id=series_id, **kwargs)
+    return await _get_request(
+        endpoint="series/release",
+        api_key=api_key,
+        params=params,
+    )
+
+
+async def get_series_tags(
+    series_id: str, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> JsonType:
+    """Get the FRED tags for an economic data series by ID. Async version of `pyfredapi.get_series_tags`."""
+    params = _validated_params(SeriesApiParameters, series_id=series_id, **kwargs)
+    return await _get_request(
+        endpoint="series/tags",
+        api_key=api_key,
+        params=params,
+    )
+
+
+async def get_series_updates(
+    series_id: str, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> JsonType:
+    """Get the FRED updates for an economic data series by ID. Async version of `pyfredapi.get_series_updates`."""
+    params = _validated_params(SeriesApiParameters, series_id=series_id, **kwargs)
+    return await _get_request(
+        endpoint="series/updates",
+        api_key=api_key,
+        params=params,
+    )
+
+
+async def get_series_vintagedates(
+    series_id: str, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> List[str]:
+    """Get the vintage dates of an economic data series. Async version of `pyfredapi.get_series_vintagedates`."""
+    params = _validated_params(SeriesApiParameters, series_id=series_id, **kwargs)
+    response = await _get_request(
+        endpoint="series/vintagedates",
+        api_key=api_key,
+        params=params,
+    )
+    return response["vintage_dates"]
+
+
+async def get_series_all_releases(
+    series_id: str,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "pandas",
+    columns: Optional[List[str]] = None,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
+    """Get the observations for all releases of an economic data series. Async version of `pyfredapi.get_series_all_releases`."""
+    _ = kwargs.pop("realtime_start", None)
+    _ = kwargs.pop("realtime_end", None)
+
+    params = _validated_dict(
+        SeriesApiParameters,
+        realtime_start=_earliest_realtime_start,
+        realtime_end=_latest_realtime_end,
+        **kwargs,
+    )
+
+    return await get_series(
+        series_id=series_id,
+        api_key=api_key,
+        return_format=return_format,
+        columns=columns,
+        **params,
+    )
+
+
+async def get_series_initial_release(
+    series_id: str,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "pandas",
+    columns: Optional[List[str]] = None,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
+    """Get the observations for the initial release of an economic data series. Async version of `pyfredapi.get_series_initial_release`."""
+    _ = kwargs.pop("realtime_start", None)
+    _ = kwargs.pop("output_type", None)
+
+    params = _validated_dict(
+        SeriesApiParameters,
+        realtime_start=_earliest_realtime_start,
+        output_type=4,
+        **kwargs,
+    )
+
+    return await get_series(
+        series_id=series_id,
+        api_key=api_key,
+        return_format=return_format,
+        columns=columns,
+        **params,
+    )
+
+
+async def get_series_asof_date(
+    series_id: str,
+    date: str,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "pandas",
+    columns: Optional[List[str]] = None,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
+    """Get the observations for an economic data series as of a date. Async version of `pyfredapi.get_series_asof_date`."""
+    _ = kwargs.pop("realtime_start", None)
+    _ = kwargs.pop("realtime_end", None)
+
+    params = _validated_dict(
+        SeriesApiParameters,
+        realtime_start=_earliest_realtime_start,
+        realtime_end=date,
+        **kwargs,
+    )
+
+    return await get_series(
+        series_id=series_id,
+        api_key=api_key,
+        return_format=return_format,
+        columns=columns,
+        **params,
+    )
+
+
+async def search_series(
+    search_text: str,
+    api_key: ApiKeyType = None,
+    search_type: Literal["full_text", "series_id"] = "full_text",
+    return_format: ReturnFormats = "pandas",
+    paginate: bool = False,
+    columns: Optional[List[str]] = None,
+    categorical: bool = False,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
+    """Get economic data series that match search text. Async version of `pyfredapi.search_series`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(
+        SeriesSearchParameters,
+        search_text=search_text,
+        search_type=search_type,
+        **kwargs,
+    )
+    if paginate:
+        response = await _get_all_pages(
+            endpoint="series/search",
+            records_key="seriess",
+            api_key=api_key,
+            params=params,
+        )
+    else:
+        response = await _get_request(
+            endpoint="series/search",
+            api_key=api_key,
+            params=params,
+        )
+
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["seriess"], return_format, columns, categorical)
+
+
+async def iter_search_series(
+    search_text: str,
+    search_type: Literal["full_text", "series_id"] = "full_text",
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    prefetch: int = DEFAULT_PREFETCH,
+    **kwargs: KwargsType,
+) -> AsyncIterator[ReturnTypes]:
+    """Lazily iterate over the economic data series that match search text. Async version of `pyfredapi.iter_search_series`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(
+        SeriesSearchParameters,
+        search_text=search_text,
+        search_type=search_type,
+        **kwargs,
+    )
+    pages = _iter_pages(
+        endpoint="series/search", api_key=api_key, params=params, prefetch=prefetch
+    )
+    async for item in _iter_records(pages, "seriess", return_format):
+        yield item
+
+
+async def search_series_tags(
+    search_text: str,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "pandas",
+    columns: Optional[List[str]] = None,
+    categorical: bool = False,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
+    """Get the FRED tags for a series search. Async version of `pyfredapi.search_series_tags`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_dict(SeriesSearchParameters, **kwargs)
+    fparams = frozenset(
+        {
+            "series_search_text": search_text,
+            **params,
+        }.items()
+    )
+    response = await _get_request(
+        endpoint="series/search/tags",
+        api_key=api_key,
+        params=fparams,
+    )
+
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["tags"], return_format, columns, categorical)
+
+
+async def search_series_related_tags(
+    search_text: str,
+    tag_names: str,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "pandas",
+    columns: Optional[List[str]] = None,
+    categorical: bool = False,
+    **kwargs,
+) -> ReturnTypes:
+    """Get the related FRED tags matching a series search. Async version of `pyfredapi.search_series_related_tags`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_dict(SeriesSearchParameters, **kwargs)
+    fparams = frozenset(
+        {
+            "series_search_text": search_text,
+            "tag_names": tag_names,
+            **params,
+        }.items()
+    )
+    response = await _get_request(
+        endpoint="series/search/related_tags",
+        api_key=api_key,
+        params=fparams,
+    )
+
+    if return_format == ReturnFormat.pandas:
+        import pandas as pd
+
+        df = pd.DataFrame(response["tags"], columns=columns)
+        return _categorize(df) if categorical else df
+    elif return_format != ReturnFormat.json:
+        return _convert_records(response["tags"], return_format, columns, categorical)
+    return response
@@ -0,0 +1,149 @@
+"""The `aio.session` module manages the pooled async HTTP connections used by `pyfredapi.aio`.
+
+All the coroutines in `pyfredapi.aio` share one `httpx.AsyncClient` per event loop, so hundreds of
+requests can run concurrently on a single event loop over a bounded set of keep-alive connections.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import weakref
+from typing import Any, Dict, Optional
+
+from pyfredapi.session import DEFAULT_POOL_SIZE, _reroot
+
+try:
+    import httpx
+
+    MISSING_HTTPX = False
+except ImportError:
+    MISSING_HTTPX = True
+
+
+def _require_httpx() -> None:
+    if MISSING_HTTPX:
+        raise ImportError(
+            "Unable to import httpx. Ensure you have the httpx package installed. You can install pyfredapi with httpx with `pip install 'pyfredapi[aio]'`"
+        )
+
+
+class AsyncSessionPool:
+    """A pool of keep-alive HTTP connections shared by the coroutines running on an event loop."""
+
+    def __init__(
+        self, pool_size: int = DEFAULT_POOL_SIZE, api_root: Optional[str] = None
+    ):
+        """Create an instance of AsyncSessionPool.
+
+        Parameters
+        ----------
+        pool_size : int, optional
+            Maximum number of concurrent connections per event loop. Defaults to 10.
+        api_root : str | None, optional
+            Send the requests for https://api.stlouisfed.org to this root url instead, e.g. the url
+            of a `pyfredapi.testing.MockFredServer`. Defaults to None.
+
+        """
+        if pool_size < 1:
+            raise ValueError(
+                f"`pool_size` must be a positive integer, not {pool_size}."
+            )
+
+        self.pool_size = pool_size
+        self.api_root = api_root.rstrip("/") if api_root is not None else None
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._pid = os.getpid()
+
+    def __repr__(self) -> str:
+        api_root = "" if self.api_root is None else f", api_root={self.api_root!r}"
+        return f"AsyncSessionPool(pool_size={self.pool_size}{api_root})"
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """Return the client owned by the running event loop, creating it if needed."""
+        _require_httpx()
+
+        if self._pid != os.getpid():
+            # Clients inherited from the parent process share its sockets.
+            self._clients = weakref.WeakKeyDictionary()
+            self._pid = os.getpid()
+
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                )
+            )
+            self._clients[loop] = client
+        return client
+
+    async def get(
+        self, url: str, params: Optional[Dict[str, Any]] = None, timeout: float = 30
+    ) -> "httpx.Response":
+        """Make a get request using a pooled connection.
+
+        Parameters
+        ----------
+        url : str
+            Url to request.
+        params : Dict[str, Any] | None, optional
+            Dictionary of query parameters. Defaults to None.
+        timeout : float, optional
+            Seconds to wait for the server to respond. Defaults to 30.
+
+        Returns
+        -------
+        httpx.Response
+
+        """
+        if self.api_root is not None:
+            url = _reroot(url, self.api_root)
+        return await self.client.get(url, params=params, timeout=timeout)
+
+    async def aclose(self) -> None:
+        """Close the connections held by the pool for the running event loop."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+_session_pool = AsyncSessionPool()
+
+
+def get_session_pool() -> AsyncSessionPool:
+    """Get the session pool used by the `pyfredapi.aio` coroutines.
+
+    Returns
+    -------
+    AsyncSessionPool
+
+    """
+    return _session_pool
+
+
+def configure_session_pool(
+    pool_size: int = DEFAULT_POOL_SIZE, api_root: Optional[str] = None
+) -> AsyncSessionPool:
+    """Replace the session pool used by the `pyfredapi.aio` coroutines.
+
+    Parameters
+    ----------
+    pool_size : int, optional
+        Maximum number of concurrent connections per event loop. Defaults to 10.
+    api_root : str | None, optional
+        Send the requests for https://api.stlouisfed.org to this root url instead. Defaults to None.
+
+    Returns
+    -------
+    AsyncSessionPool
+        The new session pool.
+
+    """
+    global _session_pool
+
+    _session_pool = AsyncSessionPool(pool_size=pool_size, api_root=api_root)
+    return _session_pool
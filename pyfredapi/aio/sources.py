@@ -0,0 +1,87 @@
+"""The `aio.sources` module provides coroutines to request data from the [FRED API Sources endpoints](https://fred.stlouisfed.org/docs/api/fred/#Sources)."""
+
+from typing import AsyncIterator
+
+from pyfredapi._pagination import DEFAULT_PREFETCH
+from pyfredapi.sources import SourceApiParameters
+from pyfredapi.utils import _validated_params
+from pyfredapi.utils._common_type_hints import (
+    ApiKeyType,
+    JsonType,
+    KwargsType,
+    ReturnFormats,
+    ReturnTypes,
+)
+from pyfredapi.utils._convert_to_df import _convert_records
+from pyfredapi.utils.enums import ReturnFormat
+
+from ._base import _get_request
+from ._pagination import _get_all_pages, _iter_pages, _iter_records
+
+
+async def get_sources(
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    paginate: bool = False,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
+    """Get all sources of economic data. Async version of `pyfredapi.get_sources`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(SourceApiParameters, **kwargs)
+    if paginate:
+        response = await _get_all_pages(
+            endpoint="sources",
+            records_key="sources",
+            api_key=api_key,
+            params=params,
+        )
+    else:
+        response = await _get_request(
+            endpoint="sources", api_key=api_key, params=params
+        )
+
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["sources"], return_format)
+
+
+async def iter_sources(
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    prefetch: int = DEFAULT_PREFETCH,
+    **kwargs: KwargsType,
+) -> AsyncIterator[ReturnTypes]:
+    """Lazily iterate over all sources of economic data. Async version of `pyfredapi.iter_sources`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(SourceApiParameters, **kwargs)
+    pages = _iter_pages(
+        endpoint="sources", api_key=api_key, params=params, prefetch=prefetch
+    )
+    async for item in _iter_records(pages, "sources", return_format):
+        yield item
+
+
+async def get_source(
+    source_id: int, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> JsonType:
+    """Get a source of economic data. Async version of `pyfredapi.get_source`."""
+    params = _validated_params(SourceApiParameters, source_id=source_id, **kwargs)
+    return await _get_request(
+        endpoint="source",
+        api_key=api_key,
+        params=params,
+    )
+
+
+async def get_source_release(
+    source_id: int, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> JsonType:
+    """Get the releases for a source. Async version of `pyfredapi.get_source_release`."""
+    params = _validated_params(SourceApiParameters, source_id=source_id, **kwargs)
+    return await _get_request(
+        endpoint="source/releases",
+        api_key=api_key,
+        params=params,
+    )
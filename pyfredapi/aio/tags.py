@@ -0,0 +1,137 @@
+"""The `aio.tags` module provides coroutines to request data from the [FRED API Tags endpoints](https://fred.stlouisfed.org/docs/api/fred/#Tags)."""
+
+from typing import AsyncIterator, List, Optional
+
+from pyfredapi._pagination import DEFAULT_PREFETCH
+from pyfredapi.tags import TagsApiParameters
+from pyfredapi.utils import (
+    _validated_dict,
+    _validated_params,
+)
+from pyfredapi.utils._common_type_hints import (
+    ApiKeyType,
+    JsonType,
+    KwargsType,
+    ReturnFormats,
+    ReturnTypes,
+)
+from pyfredapi.utils._convert_to_df import _convert_records
+from pyfredapi.utils.enums import ReturnFormat
+
+from ._base import _get_request
+from ._pagination import _get_all_pages, _iter_pages, _iter_records
+
+
+async def get_tags(
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    paginate: bool = False,
+    columns: Optional[List[str]] = None,
+    categorical: bool = False,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
+    """Get FRED tags. Async version of `pyfredapi.get_tags`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(TagsApiParameters, **kwargs)
+    if paginate:
+        response = await _get_all_pages(
+            endpoint="tags",
+            records_key="tags",
+            api_key=api_key,
+            params=params,
+        )
+    else:
+        response = await _get_request(endpoint="tags", api_key=api_key, params=params)
+
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["tags"], return_format, columns, categorical)
+
+
+async def iter_tags(
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    prefetch: int = DEFAULT_PREFETCH,
+    **kwargs: KwargsType,
+) -> AsyncIterator[ReturnTypes]:
+    """Lazily iterate over FRED tags. Async version of `pyfredapi.iter_tags`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(TagsApiParameters, **kwargs)
+    pages = _iter_pages(
+        endpoint="tags", api_key=api_key, params=params, prefetch=prefetch
+    )
+    async for item in _iter_records(pages, "tags", return_format):
+        yield item
+
+
+async def get_related_tags(
+    tag_names: str, api_key: ApiKeyType = None, **kwargs: KwargsType
+) -> JsonType:
+    """Get related FRED tags for one or more FRED tags. Async version of `pyfredapi.get_related_tags`."""
+    params = _validated_params(TagsApiParameters, tag_names=tag_names, **kwargs)
+    return await _get_request(
+        endpoint="related_tags",
+        api_key=api_key,
+        params=params,
+    )
+
+
+async def get_series_matching_tags(
+    tag_names: str,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    paginate: bool = False,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
+    """Get the series matching all tags in the tag_names parameter. Async version of `pyfredapi.get_series_matching_tags`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_dict(TagsApiParameters, **kwargs)
+    fparams = frozenset(
+        {
+            "tag_names": tag_names,
+            **params,
+        }.items()
+    )
+
+    if paginate:
+        response = await _get_all_pages(
+            endpoint="tags/series",
+            records_key="seriess",
+            api_key=api_key,
+            params=fparams,
+        )
+    else:
+        response = await _get_request(
+            endpoint="tags/series", api_key=api_key, params=fparams
+        )
+
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["seriess"], return_format)
+
+
+async def iter_series_matching_tags(
+    tag_names: str,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    prefetch: int = DEFAULT_PREFETCH,
+    **kwargs: KwargsType,
+) -> AsyncIterator[ReturnTypes]:
+    """Lazily iterate over the series matching all tags in the tag_names parameter. Async version of `pyfredapi.iter_series_matching_tags`."""
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_dict(TagsApiParameters, **kwargs)
+    fparams = frozenset(
+        {
+            "tag_names": tag_names,
+            **params,
+        }.items()
+    )
+    pages = _iter_pages(
+        endpoint="tags/series", api_key=api_key, params=fparams, prefetch=prefetch
+    )
+    async for item in _iter_records(pages, "seriess", return_format):
+        yield item
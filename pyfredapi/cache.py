@@ -0,0 +1,945 @@
+"""The `cache` module contains the response cache used by the pyfredapi request functions.
+
+Successful responses from the FRED API are kept in a bounded in-memory cache. The cache accounts for
+the size in bytes of each response, expires entries after a configurable time-to-live (which can be
+set per endpoint), and evicts the least recently used (LRU) or least frequently used (LFU) entries
+when it is full. Hit, miss, and eviction counts are available through `ResponseCache.stats`.
+
+Responses for a closed realtime period never change. For example, `get_series_asof_date` with an old
+`date`, or `get_series` with an explicit historic `realtime_end`. By default these responses are kept
+until they are evicted, while responses for the current vintage expire after the time-to-live.
+
+`ResponseCache` also keeps the dataframes converted from the cached responses, e.g. by
+`get_series(..., return_format="pandas")`, so a cache hit skips the conversion too. The dataframes
+are kept with their response: they expire, are invalidated, and are evicted with it, and their size
+counts towards the size of the cache.
+
+`SQLiteCache` is a persistent alternative that survives restarts and is shared by all the processes
+using the same database file.
+
+The cache used by the request functions can be replaced with `configure_response_cache` or
+`set_response_cache`. Passing `None` to `set_response_cache` disables caching.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .decoder import decode_json
+from .utils._common_type_hints import JsonType
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL = 60 * 60
+DEFAULT_PERSISTENT_MAX_SIZE = 1024 * 1024 * 1024
+
+CacheKey = Tuple[str, str, frozenset]
+
+
+def _cache_key(endpoint: str, params: Optional[frozenset], base_url: str) -> CacheKey:
+    """Create the cache key of a request. The API key is intentionally not part of the key."""
+    return (base_url, endpoint, params or frozenset())
+
+
+def _is_closed_realtime_window(
+    params: Optional[frozenset], today: Optional[date] = None
+) -> bool:
+    """Check if the realtime period of a request ended in the past.
+
+    FRED responses for a realtime period that has ended, e.g. an explicit historic
+    `realtime_end` or a list of historic `vintage_dates`, never change. The day before
+    today is used as the cutoff, so a request is never classified as closed because of
+    the time zone difference with St. Louis.
+    """
+    if not params:
+        return False
+
+    params_dict = dict(params)
+    if "realtime_end" in params_dict:
+        ends = [params_dict["realtime_end"]]
+    elif "vintage_dates" in params_dict:
+        ends = str(params_dict["vintage_dates"]).split(",")
+    else:
+        return False
+
+    cutoff = (today or date.today()) - timedelta(days=1)
+    try:
+        return all(
+            datetime.strptime(str(end).strip(), "%Y-%m-%d").date() < cutoff
+            for end in ends
+        )
+    except ValueError:
+        return False
+
+
+def _resolve_ttl(
+    cache: Union["ResponseCache", "SQLiteCache"],
+    endpoint: str,
+    params: Optional[frozenset],
+) -> Optional[float]:
+    ttl = cache.endpoint_ttl.get(endpoint, cache.ttl)
+    if ttl is not None and ttl <= 0:
+        return ttl
+    if cache.realtime_aware and _is_closed_realtime_window(params):
+        return cache.closed_window_ttl
+    return ttl
+
+
+@dataclass
+class CacheStats:
+    """Represents the counters of a response cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    size: int = 0
+    # Lookups of the dataframes converted from cached responses.
+    frame_hits: int = 0
+    frame_misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups that were served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    size: int
+    expires_at: Optional[float]
+    hits: int = 0
+    # Dataframes converted from the records of the response and their sizes, by conversion. The sizes
+    # are included in `size`.
+    frames: Dict[Hashable, Tuple[Any, int]] = field(default_factory=dict)
+
+
+def _record_lists(value: Any) -> List[list]:
+    """Get the lists of records of a response, e.g. the `observations` of a `series/observations` response."""
+    if isinstance(value, list):
+        return [value]
+    if isinstance(value, dict):
+        return [v for v in value.values() if isinstance(v, list)]
+    return []
+
+
+class ResponseCache:
+    """A bounded, thread-safe, in-memory cache of FRED API responses."""
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = DEFAULT_TTL,
+        policy: Literal["lru", "lfu"] = "lru",
+        endpoint_ttl: Optional[Dict[str, Optional[float]]] = None,
+        realtime_aware: bool = True,
+        closed_window_ttl: Optional[float] = None,
+        cache_frames: bool = True,
+    ):
+        """Create an instance of ResponseCache.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            Maximum total size of the cached responses in bytes. Defaults to 64 MiB.
+        max_entries : int | None, optional
+            Maximum number of cached responses. Defaults to 1024. If None, only `max_size` bounds the cache.
+        ttl : float | None, optional
+            Seconds a response stays fresh. Defaults to one hour. If None, responses never expire.
+        policy : Literal["lru", "lfu"], optional
+            Eviction policy used when the cache is full. Defaults to "lru".
+        endpoint_ttl : Dict[str, float | None] | None, optional
+            Time-to-live overrides by endpoint, e.g. ``{"series/observations": 600, "shapes/file": None}``.
+            A time-to-live of 0 disables caching for the endpoint.
+        realtime_aware : bool, optional
+            If `True`, responses for a realtime period that ended in the past use `closed_window_ttl`. Defaults to True.
+        closed_window_ttl : float | None, optional
+            Time-to-live of responses for a closed realtime period. Defaults to None, i.e. they never expire.
+        cache_frames : bool, optional
+            If `True`, the dataframes converted from the cached responses are cached with them. Defaults to True.
+
+        """
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"`policy` must be either 'lru' or 'lfu', not {policy}.")
+
+        self.max_size = max_size
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.policy = policy
+        self.endpoint_ttl = dict(endpoint_ttl or {})
+        self.realtime_aware = realtime_aware
+        self.closed_window_ttl = closed_window_ttl
+        self.cache_frames = cache_frames
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        # Key of the response of each cached list of records, by identity of the list.
+        self._record_keys: Dict[int, Hashable] = {}
+        self._lock = threading.RLock()
+        self._stats = CacheStats()
+
+    def __repr__(self) -> str:
+        return (
+            f"ResponseCache(max_size={self.max_size}, max_entries={self.max_entries}, "
+            f"ttl={self.ttl}, policy='{self.policy}')"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._is_expired(entry)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                entries=len(self._entries),
+                size=self._stats.size,
+                frame_hits=self._stats.frame_hits,
+                frame_misses=self._stats.frame_misses,
+            )
+
+    def ttl_for(
+        self, endpoint: str, params: Optional[frozenset] = None
+    ) -> Optional[float]:
+        """Get the time-to-live of the response to a request.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint of the request.
+        params : frozenset | None, optional
+            Query parameters of the request.
+
+        Returns
+        -------
+        float | None
+            Seconds the response stays fresh. None if it never expires, 0 if it should not be cached.
+
+        """
+        return _resolve_ttl(self, endpoint, params)
+
+    def get(self, key: Hashable) -> Optional[JsonType]:
+        """Get a cached response.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key of the request.
+
+        Returns
+        -------
+        dict | None
+            The cached response, or None if the response is not cached or has expired.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            if self._is_expired(entry):
+                self._remove(key)
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+
+            entry.hits += 1
+            self._stats.hits += 1
+            if self.policy == "lru":
+                self._entries.move_to_end(key)
+            return entry.value
+
+    def set(
+        self,
+        key: Hashable,
+        value: JsonType,
+        size: int,
+        ttl: Optional[float],
+        content: Optional[bytes] = None,
+    ) -> None:
+        """Add a response to the cache.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key of the request.
+        value : dict
+            The decoded response.
+        size : int
+            Size of the response body in bytes.
+        ttl : float | None
+            Seconds the response stays fresh. If None, the response never expires. If 0, the response is not cached.
+        content : bytes | None, optional
+            The raw response body. Unused by the in-memory cache.
+
+        """
+        if ttl is not None and ttl <= 0:
+            return
+        if size > self.max_size:
+            return
+
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _CacheEntry(
+                value=value, size=size, expires_at=expires_at
+            )
+            for records in _record_lists(value):
+                self._record_keys[id(records)] = key
+            self._stats.size += size
+            self._evict()
+
+    def get_frame(self, records: list, conversion: Hashable) -> Any:
+        """Get a dataframe converted from the records of a cached response.
+
+        Parameters
+        ----------
+        records : list
+            A list of records of a response returned by `get`, e.g. its `observations`.
+        conversion : Hashable
+            Key of the conversion, e.g. the return format and the converted columns.
+
+        Returns
+        -------
+        Any
+            The cached dataframe, or None if the records are not cached or were not converted this way.
+
+        """
+        with self._lock:
+            entry = self._records_entry(records)
+            if entry is None:
+                return None
+            cached = entry.frames.get(conversion)
+            if cached is None:
+                self._stats.frame_misses += 1
+                return None
+            self._stats.frame_hits += 1
+            return cached[0]
+
+    def set_frame(
+        self, records: list, conversion: Hashable, frame: Any, size: int
+    ) -> bool:
+        """Add a dataframe converted from the records of a cached response to the cache.
+
+        The dataframe is kept with the response, so it expires, is invalidated, and is evicted with it.
+
+        Parameters
+        ----------
+        records : list
+            A list of records of a response returned by `get`, e.g. its `observations`.
+        conversion : Hashable
+            Key of the conversion, e.g. the return format and the converted columns.
+        frame : Any
+            The converted dataframe. It must not be modified after it is cached.
+        size : int
+            Size of the dataframe in bytes.
+
+        Returns
+        -------
+        bool
+            `True` if the dataframe was cached, `False` if the records are not from a cached response.
+
+        """
+        if not self.cache_frames:
+            return False
+        with self._lock:
+            entry = self._records_entry(records)
+            if entry is None:
+                return False
+            _, previous_size = entry.frames.get(conversion, (None, 0))
+            entry.frames[conversion] = (frame, size)
+            entry.size += size - previous_size
+            self._stats.size += size - previous_size
+            self._evict()
+            return True
+
+    def invalidate(
+        self, endpoint: Optional[str] = None, params: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Remove responses from the cache.
+
+        Parameters
+        ----------
+        endpoint : str | None, optional
+            Remove the responses of this endpoint. If None, all responses are removed.
+        params : Dict[str, Any] | None, optional
+            Only remove the response of the request with these parameters.
+
+        Returns
+        -------
+        int
+            Number of responses removed.
+
+        Examples
+        --------
+        >>> import pyfredapi as pf
+        >>> pf.get_response_cache().invalidate("series/observations", {"series_id": "GDP"})
+
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if _key_matches(key, endpoint=endpoint, params=params)
+            ]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all responses from the cache and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._record_keys.clear()
+            self._stats = CacheStats()
+
+    def _is_expired(self, entry: _CacheEntry) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= time.monotonic()
+
+    def _records_entry(self, records: list) -> Optional[_CacheEntry]:
+        """Get the fresh entry of the response the records belong to."""
+        entry = self._entries.get(self._record_keys.get(id(records)))
+        if entry is None or self._is_expired(entry):
+            return None
+        # The entry keeps its records alive, so their identity is never reused while it is cached.
+        if not any(r is records for r in _record_lists(entry.value)):
+            return None
+        return entry
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        for records in _record_lists(entry.value):
+            if self._record_keys.get(id(records)) == key:
+                del self._record_keys[id(records)]
+        self._stats.size -= entry.size
+
+    def _evict(self) -> None:
+        def is_full() -> bool:
+            too_many = (
+                self.max_entries is not None and len(self._entries) > self.max_entries
+            )
+            return too_many or self._stats.size > self.max_size
+
+        if not is_full():
+            return
+
+        for key in [k for k, e in self._entries.items() if self._is_expired(e)]:
+            self._remove(key)
+            self._stats.expirations += 1
+
+        while is_full():
+            if self.policy == "lru":
+                key = next(iter(self._entries))
+            else:
+                key = min(self._entries, key=lambda k: self._entries[k].hits)
+            self._remove(key)
+            self._stats.evictions += 1
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    params TEXT NOT NULL,
+    value BLOB NOT NULL,
+    compressed INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE INDEX IF NOT EXISTS responses_endpoint ON responses (endpoint);
+CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at);
+-- Running total of the sizes of the responses, so writes do not scan the table.
+CREATE TABLE IF NOT EXISTS cache_size (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    size INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO cache_size SELECT 0, COALESCE(SUM(size), 0) FROM responses;
+CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN
+    UPDATE cache_size SET size = size + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN
+    UPDATE cache_size SET size = size - OLD.size;
+END;
+CREATE TRIGGER IF NOT EXISTS responses_update AFTER UPDATE OF size ON responses BEGIN
+    UPDATE cache_size SET size = size + NEW.size - OLD.size;
+END;
+"""
+
+
+def _canonical_params(params: Iterable[Tuple[str, Any]]) -> str:
+    return json.dumps(sorted(params), separators=(",", ":"), default=str)
+
+
+def _digest_key(key: CacheKey) -> str:
+    base_url, endpoint, params = key
+    canonical = json.dumps(
+        [base_url, endpoint, _canonical_params(params)], separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class SQLiteCache:
+    """A persistent cache of FRED API responses stored in a SQLite database.
+
+    The database runs in write-ahead logging (WAL) mode, so any number of threads and processes,
+    e.g. gunicorn or celery workers, can read and write the same cache file concurrently.
+    Responses are keyed on the base url, endpoint, and canonicalized query parameters of the request.
+
+    Cache hits only read the database. The access times used by the eviction are kept in memory
+    and written with the next response stored by the process, or when the cache is closed.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        max_size: int = DEFAULT_PERSISTENT_MAX_SIZE,
+        ttl: Optional[float] = DEFAULT_TTL,
+        endpoint_ttl: Optional[Dict[str, Optional[float]]] = None,
+        compress: bool = True,
+        timeout: float = 30,
+        realtime_aware: bool = True,
+        closed_window_ttl: Optional[float] = None,
+    ):
+        """Create an instance of SQLiteCache.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Path of the SQLite database file. The file is created if it does not exist.
+        max_size : int, optional
+            Maximum total size of the stored responses in bytes. Defaults to 1 GiB. The least
+            recently accessed responses are evicted first.
+        ttl : float | None, optional
+            Seconds a response stays fresh. Defaults to one hour. If None, responses never expire.
+        endpoint_ttl : Dict[str, float | None] | None, optional
+            Time-to-live overrides by endpoint. A time-to-live of 0 disables caching for the endpoint.
+        compress : bool, optional
+            If `True`, responses are compressed with zlib before they are stored. Defaults to True.
+        timeout : float, optional
+            Seconds to wait for a lock held by another connection. Defaults to 30.
+        realtime_aware : bool, optional
+            If `True`, responses for a realtime period that ended in the past use `closed_window_ttl`. Defaults to True.
+        closed_window_ttl : float | None, optional
+            Time-to-live of responses for a closed realtime period. Defaults to None, i.e. they never expire.
+
+        """
+        self.path = os.path.abspath(os.path.expanduser(os.fspath(path)))
+        self.max_size = max_size
+        self.ttl = ttl
+        self.endpoint_ttl = dict(endpoint_ttl or {})
+        self.realtime_aware = realtime_aware
+        self.closed_window_ttl = closed_window_ttl
+        self.compress = compress
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        # Access times of the cache hits that are not written to the database yet, by key.
+        self._accessed: Dict[str, float] = {}
+
+        # The running total is initialized in the same transaction as its triggers are created.
+        self._connection().executescript(f"BEGIN IMMEDIATE;{_SQLITE_SCHEMA}COMMIT;")
+
+    def __repr__(self) -> str:
+        return (
+            f"SQLiteCache(path='{self.path}', max_size={self.max_size}, ttl={self.ttl})"
+        )
+
+    def __len__(self) -> int:
+        (count,) = (
+            self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()
+        )
+        return count
+
+    def __contains__(self, key: CacheKey) -> bool:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT 1 FROM responses WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (_digest_key(key), time.time()),
+            )
+            .fetchone()
+        )
+        return row is not None
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters.
+
+        Hits, misses, evictions, and expirations are counted by this process. Entries and size cover the whole database.
+        """
+        entries, size = (
+            self._connection()
+            .execute(
+                "SELECT (SELECT COUNT(*) FROM responses), (SELECT size FROM cache_size)"
+            )
+            .fetchone()
+        )
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                entries=entries,
+                size=size,
+            )
+
+    def ttl_for(
+        self, endpoint: str, params: Optional[frozenset] = None
+    ) -> Optional[float]:
+        """Get the time-to-live of the response to a request.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint of the request.
+        params : frozenset | None, optional
+            Query parameters of the request.
+
+        Returns
+        -------
+        float | None
+            Seconds the response stays fresh. None if it never expires, 0 if it should not be cached.
+
+        """
+        return _resolve_ttl(self, endpoint, params)
+
+    def get(self, key: CacheKey) -> Optional[JsonType]:
+        """Get a cached response.
+
+        Parameters
+        ----------
+        key : Tuple[str, str, frozenset]
+            Cache key of the request.
+
+        Returns
+        -------
+        dict | None
+            The cached response, or None if the response is not cached or has expired.
+
+        """
+        digest = _digest_key(key)
+        now = time.time()
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT value, compressed, expires_at FROM responses WHERE key = ?",
+            (digest,),
+        ).fetchone()
+
+        if row is None or (row[2] is not None and row[2] <= now):
+            with self._lock:
+                self._stats.misses += 1
+                if row is not None:
+                    self._stats.expirations += 1
+            return None
+
+        value, compressed, _ = row
+        with self._lock:
+            self._stats.hits += 1
+            self._accessed[digest] = now
+
+        return decode_json(zlib.decompress(value) if compressed else value)
+
+    def set(
+        self,
+        key: CacheKey,
+        value: JsonType,
+        size: int,
+        ttl: Optional[float],
+        content: Optional[bytes] = None,
+    ) -> None:
+        """Add a response to the cache.
+
+        Parameters
+        ----------
+        key : Tuple[str, str, frozenset]
+            Cache key of the request.
+        value : dict
+            The decoded response. Only serialized if `content` is not provided.
+        size : int
+            Size of the response body in bytes.
+        ttl : float | None
+            Seconds the response stays fresh. If None, the response never expires. If 0, the response is not cached.
+        content : bytes | None, optional
+            The raw response body.
+
+        """
+        if ttl is not None and ttl <= 0:
+            return
+
+        if content is None:
+            content = json.dumps(value, separators=(",", ":")).encode()
+        blob = zlib.compress(content) if self.compress else content
+        if len(blob) > self.max_size:
+            return
+
+        base_url, endpoint, params = key
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    _digest_key(key),
+                    endpoint,
+                    _canonical_params(params),
+                    blob,
+                    int(self.compress),
+                    len(blob),
+                    None if ttl is None else now + ttl,
+                    now,
+                ),
+            )
+            self._write_accessed(conn)
+            self._evict(conn, now)
+
+    def invalidate(
+        self, endpoint: Optional[str] = None, params: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Remove responses from the cache.
+
+        Parameters
+        ----------
+        endpoint : str | None, optional
+            Remove the responses of this endpoint. If None, all responses are removed.
+        params : Dict[str, Any] | None, optional
+            Only remove the response of the request with these parameters.
+
+        Returns
+        -------
+        int
+            Number of responses removed.
+
+        """
+        with self._transaction() as conn:
+            if endpoint is None:
+                cursor = conn.execute("DELETE FROM responses")
+            elif params is None:
+                cursor = conn.execute(
+                    "DELETE FROM responses WHERE endpoint = ?", (endpoint,)
+                )
+            else:
+                cursor = conn.execute(
+                    "DELETE FROM responses WHERE endpoint = ? AND params = ?",
+                    (endpoint, _canonical_params(params.items())),
+                )
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        """Remove all responses from the cache and reset the counters."""
+        self.invalidate()
+        with self._lock:
+            self._stats = CacheStats()
+
+    def close(self) -> None:
+        """Write the pending access times and close the database connection of the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            if self._accessed:
+                with self._transaction() as conn:
+                    self._write_accessed(conn)
+            conn.close()
+        self._local.conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections are not shared across threads or forked processes.
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # The rows replaced by INSERT OR REPLACE fire the trigger that keeps the total size.
+            conn.execute("PRAGMA recursive_triggers=ON")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _write_accessed(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            accessed, self._accessed = self._accessed, {}
+        # Another process may have accessed the response more recently.
+        conn.executemany(
+            "UPDATE responses SET accessed_at = MAX(accessed_at, ?) WHERE key = ?",
+            [(at, digest) for digest, at in accessed.items()],
+        )
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        size = self._size(conn)
+        if size <= self.max_size:
+            return
+
+        expired = conn.execute(
+            "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (now,),
+        ).rowcount
+        size = self._size(conn)
+        # Read the least recently accessed responses until enough are found, then delete them.
+        keys = []
+        cursor = conn.execute("SELECT key, size FROM responses ORDER BY accessed_at")
+        for key, entry_size in cursor:
+            if size <= self.max_size:
+                break
+            keys.append((key,))
+            size -= entry_size
+        cursor.close()
+        conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+
+        with self._lock:
+            self._stats.expirations += expired
+            self._stats.evictions += len(keys)
+
+    @staticmethod
+    def _size(conn: sqlite3.Connection) -> int:
+        (size,) = conn.execute("SELECT size FROM cache_size").fetchone()
+        return size
+
+
+def _key_matches(
+    key: Hashable, endpoint: Optional[str], params: Optional[Dict[str, Any]]
+) -> bool:
+    if endpoint is None:
+        return True
+    if not isinstance(key, tuple) or key[1] != endpoint:
+        return False
+    return params is None or key[2] == frozenset(params.items())
+
+
+Cache = Union[ResponseCache, SQLiteCache]
+
+_response_cache: Optional[Cache] = ResponseCache()
+
+
+def get_response_cache() -> Optional[Cache]:
+    """Get the response cache used by the pyfredapi request functions.
+
+    Returns
+    -------
+    ResponseCache | SQLiteCache | None
+        The response cache, or None if caching is disabled.
+
+    """
+    return _response_cache
+
+
+def set_response_cache(cache: Optional[Cache]) -> None:
+    """Set the response cache used by the pyfredapi request functions.
+
+    Parameters
+    ----------
+    cache : ResponseCache | SQLiteCache | None
+        The response cache. If None, responses are not cached.
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> pf.set_response_cache(pf.SQLiteCache("~/.cache/pyfredapi.sqlite"))
+
+    """
+    global _response_cache
+
+    _response_cache = cache
+
+
+def configure_response_cache(
+    max_size: int = DEFAULT_MAX_SIZE,
+    max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+    ttl: Optional[float] = DEFAULT_TTL,
+    policy: Literal["lru", "lfu"] = "lru",
+    endpoint_ttl: Optional[Dict[str, Optional[float]]] = None,
+    realtime_aware: bool = True,
+    closed_window_ttl: Optional[float] = None,
+    cache_frames: bool = True,
+) -> ResponseCache:
+    """Replace the response cache used by the pyfredapi request functions.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        Maximum total size of the cached responses in bytes. Defaults to 64 MiB.
+    max_entries : int | None, optional
+        Maximum number of cached responses. Defaults to 1024.
+    ttl : float | None, optional
+        Seconds a response stays fresh. Defaults to one hour. If None, responses never expire.
+    policy : Literal["lru", "lfu"], optional
+        Eviction policy used when the cache is full. Defaults to "lru".
+    endpoint_ttl : Dict[str, float | None] | None, optional
+        Time-to-live overrides by endpoint. A time-to-live of 0 disables caching for the endpoint.
+    realtime_aware : bool, optional
+        If `True`, responses for a realtime period that ended in the past use `closed_window_ttl`. Defaults to True.
+    closed_window_ttl : float | None, optional
+        Time-to-live of responses for a closed realtime period. Defaults to None, i.e. they never expire.
+    cache_frames : bool, optional
+        If `True`, the dataframes converted from the cached responses are cached with them. Defaults to True.
+
+    Returns
+    -------
+    ResponseCache
+        The new response cache.
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> pf.configure_response_cache(max_size=256 * 1024 * 1024, endpoint_ttl={"shapes/file": None})
+
+    """
+    cache = ResponseCache(
+        max_size=max_size,
+        max_entries=max_entries,
+        ttl=ttl,
+        policy=policy,
+        endpoint_ttl=endpoint_ttl,
+        realtime_aware=realtime_aware,
+        closed_window_ttl=closed_window_ttl,
+        cache_frames=cache_frames,
+    )
+    set_response_cache(cache)
+    return cache
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Dict, Literal, Optional
+from typing import Dict, Iterator, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, PositiveInt
 
 from ._base import _get_request
+from ._pagination import (
+    DEFAULT_PREFETCH,
+    _get_all_pages,
+    _iter_pages,
+    _iter_records,
+)
 from .series import SeriesInfo
-from .utils import _convert_pydantic_model_to_frozenset
+from .utils import _validated_params
 from .utils._common_type_hints import (
     ApiKeyType,
     JsonType,
@@ -16,7 +22,7 @@ from .utils._common_type_hints import (
     ReturnFormats,
     ReturnTypes,
 )
-from .utils._convert_to_df import _convert_to_pandas, _convert_to_polars
+from .utils._convert_to_df import _convert_records
 from .utils.enums import ReturnFormat
 
 
@@ -80,9 +86,7 @@ def get_category(
     >>> pf.get_category(category_id=125)
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        CategoryApiParameters(category_id=category_id, **kwargs)
-    )
+    params = _validated_params(CategoryApiParameters, category_id=category_id, **kwargs)
 
     return _get_request(
         api_key=api_key,
@@ -116,9 +120,7 @@ def get_category_children(
     >>> pf.get_category_children(category_id=13)
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        CategoryApiParameters(category_id=category_id, **kwargs)
-    )
+    params = _validated_params(CategoryApiParameters, category_id=category_id, **kwargs)
     return _get_request(
         endpoint="category/children",
         api_key=api_key,
@@ -147,9 +149,7 @@ def get_category_related(
         Dictionary representing the json response.
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        CategoryApiParameters(category_id=category_id, **kwargs)
-    )
+    params = _validated_params(CategoryApiParameters, category_id=category_id, **kwargs)
     return _get_request(
         api_key=api_key,
         endpoint="category/related",
@@ -158,7 +158,10 @@ def get_category_related(
 
 
 def get_category_series(
-    category_id: int, api_key: ApiKeyType = None, **kwargs: KwargsType
+    category_id: int,
+    api_key: ApiKeyType = None,
+    paginate: bool = False,
+    **kwargs: KwargsType,
 ) -> Dict[str, SeriesInfo]:
     """Get the series info for each series in a category by category ID. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/category_series.html).
 
@@ -168,6 +171,8 @@ def get_category_series(
         Category id of interest.
     api_key : str | None, optional
         FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
+    paginate : bool, optional
+        If `True`, request all the pages of the response concurrently and merge them. The `limit` parameter is used as the page size. Defaults to False.
     **kwargs : dict, optional
         Additional parameters to FRED API ``category/children`` endpoint. Refer to the FRED documentation for a list of all possible parameters.
 
@@ -177,22 +182,74 @@ def get_category_series(
         A dictionary where the keys are series ids and the values for SeriesInfo objects.
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        CategoryApiParameters(category_id=category_id, **kwargs)
-    )
-    response = _get_request(
-        api_key=api_key,
-        endpoint="category/series",
-        params=params,
-    )
+    params = _validated_params(CategoryApiParameters, category_id=category_id, **kwargs)
+    if paginate:
+        response = _get_all_pages(
+            endpoint="category/series",
+            records_key="seriess",
+            api_key=api_key,
+            params=params,
+        )
+    else:
+        response = _get_request(
+            api_key=api_key,
+            endpoint="category/series",
+            params=params,
+        )
 
     return {series["id"]: SeriesInfo(**series) for series in response["seriess"]}
 
 
+def iter_category_series(
+    category_id: int,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    prefetch: int = DEFAULT_PREFETCH,
+    **kwargs: KwargsType,
+) -> Iterator[ReturnTypes]:
+    """Lazily iterate over the series in a category. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/category_series.html).
+
+    Pages are requested as they are consumed, and the next `prefetch` pages are requested in the background.
+
+    Parameters
+    ----------
+    category_id : int
+        Category id of interest.
+    api_key : str | None, optional
+        FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
+    return_format : Literal["json", "pandas", "polars", "polars_lazy", "arrow"] | ReturnFormat, optional
+        If 'json', yield each series as a dictionary. If 'pandas', 'polars', 'polars_lazy' or 'arrow', yield a dataframe or table per page. Defaults to 'json'.
+    prefetch : int, optional
+        Number of pages to request ahead of the consumer. Defaults to 2.
+    **kwargs : dict, optional
+        Additional parameters to FRED API ``category/series`` endpoint. The `limit` parameter is used as the page size.
+
+    Yields
+    ------
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> for series in pf.iter_category_series(category_id=125):
+    ...     print(series["id"])
+
+    """
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(CategoryApiParameters, category_id=category_id, **kwargs)
+    pages = _iter_pages(
+        endpoint="category/series", api_key=api_key, params=params, prefetch=prefetch
+    )
+    return _iter_records(pages, "seriess", return_format)
+
+
 def get_category_tags(
     category_id: Optional[int] = None,
     api_key: ApiKeyType = None,
     return_format: ReturnFormats = "json",
+    columns: Optional[List[str]] = None,
+    categorical: bool = False,
     **kwargs: KwargsType,
 ) -> ReturnTypes:
     """Get the FRED tags for a category by category ID.  [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/category_tags.html).
@@ -205,36 +262,38 @@ def get_category_tags(
         FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
     return_format : str | ReturnFormat
         Define how to return the response. Must be either 'json' or 'pandas'.
+    columns : List[str] | None, optional
+        Fields to convert, e.g. ["name", "series_count"]. The other fields are never parsed. Ignored if `return_format` is 'json'. Defaults to None, i.e. every field.
+    categorical : bool, optional
+        If `True`, string columns where most values repeat, e.g. `group_id`, are pandas `category` or polars `Categorical` columns. Arrow tables are always dictionary encoded. Ignored if `return_format` is 'json'. Defaults to False.
     **kwargs : dict, optional
         Additional parameters to FRED API ``category/children`` endpoint. Refer to the FRED documentation for a list of all possible parameters.
 
     Returns
     -------
-    dict | pd.DataFrame | pl.DataFrame
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table
 
     """
     return_format = ReturnFormat(return_format)
 
-    params = _convert_pydantic_model_to_frozenset(
-        CategoryApiParameters(category_id=category_id, **kwargs)
-    )
+    params = _validated_params(CategoryApiParameters, category_id=category_id, **kwargs)
     response = _get_request(
         api_key=api_key,
         endpoint="category/tags",
         params=params,
     )
 
-    if return_format == ReturnFormat.pandas:
-        return _convert_to_pandas(response["tags"])
-    if return_format == ReturnFormat.polars:
-        return _convert_to_polars(response["tags"])
-    return response
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["tags"], return_format, columns, categorical)
 
 
 def get_category_related_tags(
     category_id: Optional[int] = None,
     api_key: ApiKeyType = None,
     return_format: ReturnFormats = "json",
+    columns: Optional[List[str]] = None,
+    categorical: bool = False,
     **kwargs: KwargsType,
 ) -> ReturnTypes:
     """Get the related FRED tags for a category by category ID. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/category_related_tags.html).
@@ -247,27 +306,27 @@ def get_category_related_tags(
         FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
     return_format : str | ReturnFormat
         Define how to return the response. Must be either 'json' or 'pandas'.
+    columns : List[str] | None, optional
+        Fields to convert, e.g. ["name", "series_count"]. The other fields are never parsed. Ignored if `return_format` is 'json'. Defaults to None, i.e. every field.
+    categorical : bool, optional
+        If `True`, string columns where most values repeat, e.g. `group_id`, are pandas `category` or polars `Categorical` columns. Arrow tables are always dictionary encoded. Ignored if `return_format` is 'json'. Defaults to False.
     **kwargs : dict, optional
         Additional parameters to FRED API ``category/children`` endpoint. Refer to the FRED documentation for a list of all possible parameters.
 
     Returns
     -------
-    dict | pd.DataFrame | pl.DataFrame
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table
 
     """
     return_format = ReturnFormat(return_format)
 
-    params = _convert_pydantic_model_to_frozenset(
-        CategoryApiParameters(category_id=category_id, **kwargs)
-    )
+    params = _validated_params(CategoryApiParameters, category_id=category_id, **kwargs)
     response = _get_request(
         api_key=api_key,
         endpoint="category/related_tags",
         params=params,
     )
 
-    if return_format == ReturnFormat.pandas:
-        return _convert_to_pandas(response["tags"])
-    if return_format == ReturnFormat.polars:
-        return _convert_to_polars(response["tags"])
-    return response
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["tags"], return_format, columns, categorical)
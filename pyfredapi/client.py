@@ -0,0 +1,239 @@
+"""The `client` module contains `FredClient`, a FRED API client that does not use global state.
+
+The request functions of pyfredapi share the global session pool, response cache, rate limiter,
+retry policy, and request coalescer, and validate the API key on every call. A `FredClient`
+validates its API key once and holds its own components, so several clients with different API
+keys or configurations can be used side by side in one process.
+
+Every endpoint function of pyfredapi is available as a method of `FredClient`, with the same
+parameters. The `api_key` parameter of the methods defaults to the API key of the client.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from contextvars import copy_context
+from enum import Enum
+from typing import Any, Callable, Iterator, Optional, TypeVar, Union
+
+from . import category, maps, releases, series, sources, tags
+from ._base import (
+    BaseApiParameters,
+    _client_context,
+    _get_api_key,
+    _RequestContext,
+)
+from .cache import Cache, ResponseCache
+from .coalesce import RequestCoalescer
+from .rate_limit import Limiter, RateLimiter
+from .retry import RetryPolicy
+from .session import SessionPool
+
+T = TypeVar("T")
+
+
+class _Default(Enum):
+    token = 0
+
+
+_DEFAULT = _Default.token
+
+
+def _as_method(fn: Callable[..., Any], method: Callable[..., T]) -> Callable[..., T]:
+    """Copy the name, docstring, and signature of an endpoint function to a method."""
+    functools.update_wrapper(method, fn)
+    signature = inspect.signature(fn)
+    self_param = inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    # Without `__wrapped__`, `inspect.signature` drops `self` from bound methods only.
+    del method.__wrapped__  # type: ignore[attr-defined]
+    method.__signature__ = signature.replace(  # type: ignore[attr-defined]
+        parameters=[self_param, *signature.parameters.values()]
+    )
+    return method
+
+
+def _client_method(fn: Callable[..., T]) -> Callable[..., T]:
+    """Turn an endpoint function into a method that makes its requests with the client components."""
+
+    def method(self: FredClient, *args: Any, **kwargs: Any) -> T:
+        token = _client_context.set(self._context)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _client_context.reset(token)
+
+    return _as_method(fn, method)
+
+
+def _client_iter_method(fn: Callable[..., Iterator[T]]) -> Callable[..., Iterator[T]]:
+    """Turn a lazy paginator into a method that makes its requests with the client components."""
+
+    def method(self: FredClient, *args: Any, **kwargs: Any) -> Iterator[T]:
+        # The pages are requested while the iterator is consumed, so every step runs
+        # in a context where the client is active.
+        context = copy_context()
+        context.run(_client_context.set, self._context)
+        iterator = context.run(fn, *args, **kwargs)
+        while True:
+            try:
+                item = context.run(next, iterator)
+            except StopIteration:
+                return
+            yield item
+
+    return _as_method(fn, method)
+
+
+class FredClient:
+    """A FRED API client with its own API key, connection pool, response cache, rate limiter, and retry policy.
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> client = pf.FredClient(api_key="...", rate_limiter=pf.RateLimiter(rate=1))
+    >>> gdp = client.get_series("GDP")
+
+    """
+
+    def __init__(
+        self,
+        api_key: Union[str, None] = None,
+        *,
+        session_pool: Optional[SessionPool] = None,
+        cache: Union[Cache, None, _Default] = _DEFAULT,
+        rate_limiter: Union[Limiter, None, _Default] = _DEFAULT,
+        retry_policy: Union[RetryPolicy, None, _Default] = _DEFAULT,
+        coalescer: Union[RequestCoalescer, None, _Default] = _DEFAULT,
+    ):
+        """Create an instance of FredClient.
+
+        Parameters
+        ----------
+        api_key : str | None, optional
+            FRED API key. Defaults to None. If None, will check for FRED_API_KEY in the environment.
+        session_pool : SessionPool | None, optional
+            Pool of the HTTP connections of the client. Defaults to a new `SessionPool`.
+        cache : ResponseCache | SQLiteCache | None, optional
+            Response cache of the client. Defaults to a new `ResponseCache`. If None, responses are not cached.
+        rate_limiter : RateLimiter | SQLiteRateLimiter | None, optional
+            Rate limiter of the client. Defaults to a new `RateLimiter`. If None, requests are not
+            throttled. FRED's quota applies per API key, so clients using the same API key should share
+            a rate limiter.
+        retry_policy : RetryPolicy | None, optional
+            Retry policy of the client. Defaults to a new `RetryPolicy`. If None, failed requests are not retried.
+        coalescer : RequestCoalescer | None, optional
+            Request coalescer of the client. Defaults to a new `RequestCoalescer`. If None, concurrent
+            identical requests are not coalesced.
+
+        Raises
+        ------
+        APIKeyNotFound
+            If the api_key is None and FRED_API_KEY is not in the environment.
+        InvalidAPIKey
+            If the api_key is not a 32 character alphanumeric string.
+
+        """
+        self.api_key = _get_api_key(api_key)
+        self._context = _RequestContext(
+            session_pool=session_pool if session_pool is not None else SessionPool(),
+            cache=ResponseCache() if cache is _DEFAULT else cache,
+            rate_limiter=RateLimiter() if rate_limiter is _DEFAULT else rate_limiter,
+            retry_policy=RetryPolicy() if retry_policy is _DEFAULT else retry_policy,
+            coalescer=RequestCoalescer() if coalescer is _DEFAULT else coalescer,
+            base_params=BaseApiParameters(api_key=self.api_key).model_dump(),
+        )
+
+    def __repr__(self) -> str:
+        return f"FredClient(api_key='{self.api_key[:4]}...')"
+
+    def __enter__(self) -> FredClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def session_pool(self) -> SessionPool:
+        """The session pool of the client."""
+        return self._context.session_pool
+
+    @property
+    def cache(self) -> Optional[Cache]:
+        """The response cache of the client."""
+        return self._context.cache
+
+    @property
+    def rate_limiter(self) -> Optional[Limiter]:
+        """The rate limiter of the client."""
+        return self._context.rate_limiter
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """The retry policy of the client."""
+        return self._context.retry_policy
+
+    @property
+    def coalescer(self) -> Optional[RequestCoalescer]:
+        """The request coalescer of the client."""
+        return self._context.coalescer
+
+    def close(self) -> None:
+        """Close the connections held by the session pool of the client."""
+        self._context.session_pool.close()
+
+    # category
+    get_category = _client_method(category.get_category)
+    get_category_children = _client_method(category.get_category_children)
+    get_category_related = _client_method(category.get_category_related)
+    get_category_series = _client_method(category.get_category_series)
+    get_category_tags = _client_method(category.get_category_tags)
+    get_category_related_tags = _client_method(category.get_category_related_tags)
+    iter_category_series = _client_iter_method(category.iter_category_series)
+
+    # maps
+    get_geoseries_info = _client_method(maps.get_geoseries_info)
+    get_shape_files = _client_method(maps.get_shape_files)
+    get_geoseries = _client_method(maps.get_geoseries)
+
+    # releases
+    get_releases = _client_method(releases.get_releases)
+    get_releases_dates = _client_method(releases.get_releases_dates)
+    get_release = _client_method(releases.get_release)
+    get_release_dates = _client_method(releases.get_release_dates)
+    get_release_series = _client_method(releases.get_release_series)
+    get_release_sources = _client_method(releases.get_release_sources)
+    get_release_tags = _client_method(releases.get_release_tags)
+    get_release_related_tags = _client_method(releases.get_release_related_tags)
+    get_release_tables = _client_method(releases.get_release_tables)
+    iter_releases = _client_iter_method(releases.iter_releases)
+    iter_release_series = _client_iter_method(releases.iter_release_series)
+
+    # series
+    get_series_info = _client_method(series.get_series_info)
+    get_series_categories = _client_method(series.get_series_categories)
+    get_series = _client_method(series.get_series)
+    get_series_releases = _client_method(series.get_series_releases)
+    get_series_tags = _client_method(series.get_series_tags)
+    get_series_updates = _client_method(series.get_series_updates)
+    get_series_vintagedates = _client_method(series.get_series_vintagedates)
+    get_series_all_releases = _client_method(series.get_series_all_releases)
+    get_series_initial_release = _client_method(series.get_series_initial_release)
+    get_series_asof_date = _client_method(series.get_series_asof_date)
+    search_series = _client_method(series.search_series)
+    search_series_tags = _client_method(series.search_series_tags)
+    search_series_related_tags = _client_method(series.search_series_related_tags)
+    iter_search_series = _client_iter_method(series.iter_search_series)
+
+    # sources
+    get_sources = _client_method(sources.get_sources)
+    get_source = _client_method(sources.get_source)
+    get_source_release = _client_method(sources.get_source_release)
+    iter_sources = _client_iter_method(sources.iter_sources)
+
+    # tags
+    get_tags = _client_method(tags.get_tags)
+    get_related_tags = _client_method(tags.get_related_tags)
+    get_series_matching_tags = _client_method(tags.get_series_matching_tags)
+    iter_tags = _client_iter_method(tags.iter_tags)
+    iter_series_matching_tags = _client_iter_method(tags.iter_series_matching_tags)
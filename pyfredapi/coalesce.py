@@ -0,0 +1,178 @@
+"""The `coalesce` module merges concurrent identical requests to the FRED API into one.
+
+When several threads ask for the same data at the same time, e.g. the workers of a dashboard
+backend after a restart, the response cache is still empty and every thread would make its own
+request. The request coalescer lets the first caller make the request while the concurrent
+duplicates wait for its result. Requests are identical when they have the same endpoint,
+parameters, base url, and API key.
+
+Coalescing only applies to requests that are in flight at the same time. Later requests are
+served by the response cache returned by `pyfredapi.cache.get_response_cache`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class CoalesceStats:
+    """Statistics of a request coalescer.
+
+    Attributes
+    ----------
+    requests : int
+        Number of requests made by a first caller.
+    coalesced : int
+        Number of calls that waited for the request of a first caller instead of making their own.
+
+    """
+
+    requests: int = 0
+    coalesced: int = 0
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """Run a single request for concurrent calls with the same key, in threads or coroutines."""
+
+    def __init__(self) -> None:
+        """Create an instance of RequestCoalescer."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Future]
+        ] = weakref.WeakKeyDictionary()
+        self._stats = CoalesceStats()
+
+    @property
+    def stats(self) -> CoalesceStats:
+        """Snapshot of the coalescer statistics."""
+        with self._lock:
+            return CoalesceStats(**vars(self._stats))
+
+    def run(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Call `fn`, or wait for the result of a concurrent call with the same key.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key identifying the request.
+        fn : Callable[[], T]
+            Function making the request.
+
+        Returns
+        -------
+        The result of `fn`. If `fn` raises, the exception is raised in every waiting caller.
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            first = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._stats.requests += 1
+            else:
+                self._stats.coalesced += 1
+
+        if not first:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def arun(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await `fn`, or wait for the result of a concurrent call with the same key.
+
+        Calls are only coalesced within the same event loop. The request runs in its own task,
+        so cancelling the first caller does not cancel the request for the other callers.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key identifying the request.
+        fn : Callable[[], Awaitable[T]]
+            Coroutine function making the request.
+
+        Returns
+        -------
+        The result of `fn`. If `fn` raises, the exception is raised in every waiting caller.
+
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            tasks = self._tasks.setdefault(loop, {})
+            task = tasks.get(key)
+            if task is None:
+                task = tasks[key] = asyncio.ensure_future(fn())
+                task.add_done_callback(lambda t: _forget(tasks, key, t))
+                self._stats.requests += 1
+            else:
+                self._stats.coalesced += 1
+        return await asyncio.shield(task)
+
+
+def _forget(tasks: Dict[Hashable, asyncio.Future], key: Hashable, task: Any) -> None:
+    tasks.pop(key, None)
+    if not task.cancelled():
+        # Mark the exception as retrieved in case every caller was cancelled.
+        task.exception()
+
+
+_request_coalescer: Optional[RequestCoalescer] = RequestCoalescer()
+
+
+def get_request_coalescer() -> Optional[RequestCoalescer]:
+    """Get the request coalescer used by the pyfredapi request functions.
+
+    Returns
+    -------
+    RequestCoalescer | None
+        The request coalescer, or None if concurrent identical requests are not coalesced.
+
+    """
+    return _request_coalescer
+
+
+def set_request_coalescer(coalescer: Optional[RequestCoalescer]) -> None:
+    """Set the request coalescer used by the pyfredapi request functions.
+
+    Parameters
+    ----------
+    coalescer : RequestCoalescer | None
+        The request coalescer. If None, every call makes its own request.
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> pf.set_request_coalescer(None)
+
+    """
+    global _request_coalescer
+
+    _request_coalescer = coalescer
@@ -0,0 +1,133 @@
+"""The `decoder` module decodes the Json responses of the FRED API.
+
+Decoding is a significant part of the CPU time of large `series/observations` responses. If
+[msgspec](https://jcristharif.com/msgspec/) or [orjson](https://github.com/ijl/orjson) is installed,
+it is used instead of the standard library `json` module, in that order of preference. The backend is detected automatically and
+can be chosen with `set_json_backend`.
+
+All the backends return the same dictionaries, including any fields that FRED adds to its responses.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Literal
+
+try:
+    import orjson
+
+    MISSING_ORJSON = False
+except ImportError:
+    MISSING_ORJSON = True
+
+try:
+    import msgspec
+
+    MISSING_MSGSPEC = False
+except ImportError:
+    MISSING_MSGSPEC = True
+
+JsonBackend = Literal["orjson", "msgspec", "json"]
+
+
+def _detect_backend() -> JsonBackend:
+    if not MISSING_MSGSPEC:
+        return "msgspec"
+    if not MISSING_ORJSON:
+        return "orjson"
+    return "json"
+
+
+def _make_decoder(backend: JsonBackend) -> Callable[[bytes], Any]:
+    if backend == "orjson":
+        if MISSING_ORJSON:
+            raise ImportError(
+                "Unable to import orjson. Install it with `pip install 'pyfredapi[orjson]'`."
+            )
+
+        def decode_orjson(content: bytes) -> Any:
+            return orjson.loads(content)
+
+        return decode_orjson
+
+    if backend == "msgspec":
+        if MISSING_MSGSPEC:
+            raise ImportError(
+                "Unable to import msgspec. Install it with `pip install 'pyfredapi[msgspec]'`."
+            )
+        decoder = msgspec.json.Decoder()
+
+        def decode_msgspec(content: bytes) -> Any:
+            return decoder.decode(content)
+
+        return decode_msgspec
+
+    if backend == "json":
+
+        def decode_stdlib(content: bytes) -> Any:
+            return json.loads(content)
+
+        return decode_stdlib
+
+    raise ValueError(
+        f"`backend` must be one of 'auto', 'orjson', 'msgspec', or 'json', not {backend!r}."
+    )
+
+
+_backend: JsonBackend = _detect_backend()
+_decode = _make_decoder(_backend)
+
+
+def get_json_backend() -> JsonBackend:
+    """Get the name of the library used to decode the FRED API responses.
+
+    Returns
+    -------
+    Literal["orjson", "msgspec", "json"]
+        The Json backend.
+
+    """
+    return _backend
+
+
+def set_json_backend(backend: Literal["auto", "orjson", "msgspec", "json"]) -> None:
+    """Set the library used to decode the FRED API responses.
+
+    Parameters
+    ----------
+    backend : Literal["auto", "orjson", "msgspec", "json"]
+        The Json backend. If "auto", use msgspec or orjson if one of them is installed, else
+        the standard library `json` module.
+
+    Raises
+    ------
+    ImportError
+        If the library of the backend is not installed.
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> pf.set_json_backend("msgspec")
+
+    """
+    global _backend, _decode
+
+    resolved: JsonBackend = _detect_backend() if backend == "auto" else backend  # type: ignore[assignment]
+    _decode = _make_decoder(resolved)
+    _backend = resolved
+
+
+def decode_json(content: bytes) -> Any:
+    """Decode the content of a FRED API response with the current Json backend.
+
+    Parameters
+    ----------
+    content : bytes
+        The raw content of the response.
+
+    Returns
+    -------
+    The decoded Json.
+
+    """
+    return _decode(content)
@@ -27,10 +27,11 @@ class APIKeyNotFound(BaseFredAPIError):
 
 
 class FredAPIRequestError(BaseFredAPIError):
-    def __init__(self, message, status_code):
+    def __init__(self, message, status_code, attempts=None):
         """Error raised when a request to the FRED API fails."""
         super().__init__(message)
         self.status_code = status_code
+        self.attempts = list(attempts or [])
 
     def __str__(self):
         return f"HTTP response code: {self.status_code} - {self.message}"
@@ -0,0 +1,477 @@
+"""The `hooks` module reports where the time goes in the pyfredapi request functions.
+
+Every call to a FRED API endpoint emits a `RequestEvent` with the endpoint, the status code, the
+number of attempts, the number of bytes received, the time spent waiting for the network, the time
+spent decoding the Json, and whether the response was served from the cache. Every conversion of
+records to a dataframe emits a `ConversionEvent`.
+
+Events are passed to the hooks registered with `add_hook`. A hook is a subclass of `Hook` that
+overrides `on_request`, `on_conversion`, or both. Ready-made hooks are available for `logging`
+(`LoggingHook`), Prometheus (`PrometheusHook`), and OpenTelemetry (`OpenTelemetryHook`).
+
+When no hook is registered, no event is created and no time is measured.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+MISSING_PROMETHEUS = find_spec("prometheus_client") is None
+MISSING_OPENTELEMETRY = find_spec("opentelemetry") is None
+
+logger = logging.getLogger("pyfredapi")
+
+
+@dataclass
+class RequestEvent:
+    """A call to a FRED API endpoint.
+
+    Attributes
+    ----------
+    endpoint : str
+        The FRED API endpoint, e.g. "series/observations".
+    base_url : str
+        Base url of the request.
+    started : float
+        Time at which the call started, in seconds since the epoch.
+    duration : float
+        Total time of the call in seconds, including waiting for the rate limiter and between retries.
+    cache_hit : bool
+        Whether the response was served from the response cache.
+    coalesced : bool
+        Whether the call waited for a concurrent identical request instead of making its own.
+    status_code : int | None
+        Status code of the last response, or 200 if the response was served from the cache or by a
+        concurrent identical request. None if no response was received.
+    attempts : int
+        Number of requests made, including retries.
+    bytes_received : int
+        Number of bytes of the response bodies received over all the attempts.
+    latency : float
+        Time spent waiting for the responses in seconds, summed over all the attempts.
+    decode_time : float
+        Time spent decoding the Json response in seconds.
+    error : BaseException | None
+        The exception raised by the call, if any.
+
+    """
+
+    endpoint: str
+    base_url: str
+    started: float = field(default_factory=time.time)
+    duration: float = 0.0
+    cache_hit: bool = False
+    coalesced: bool = False
+    status_code: Optional[int] = None
+    attempts: int = 0
+    bytes_received: int = 0
+    latency: float = 0.0
+    decode_time: float = 0.0
+    error: Optional[BaseException] = None
+
+    @property
+    def retries(self) -> int:
+        """Number of retries of the call."""
+        return max(self.attempts - 1, 0)
+
+
+@dataclass
+class ConversionEvent:
+    """A conversion of FRED records to a dataframe.
+
+    Attributes
+    ----------
+    return_format : str
+        The return format, e.g. "pandas", "polars", "arrow", or "numpy".
+    started : float
+        Time at which the conversion started, in seconds since the epoch.
+    duration : float
+        Time of the conversion in seconds.
+    rows : int
+        Number of rows of the dataframe.
+    columns : int
+        Number of columns of the dataframe.
+
+    """
+
+    return_format: str
+    started: float
+    duration: float
+    rows: int
+    columns: int
+
+
+class Hook:
+    """Base class of the hooks. Subclasses override the methods of the events they observe."""
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Observe a call to a FRED API endpoint."""
+
+    def on_conversion(self, event: ConversionEvent) -> None:
+        """Observe a conversion of FRED records to a dataframe."""
+
+
+_lock = threading.Lock()
+# Replaced rather than mutated, so the request functions read it without taking the lock.
+_hooks: Tuple[Hook, ...] = ()
+
+
+def get_hooks() -> Tuple[Hook, ...]:
+    """Get the hooks observing the pyfredapi request functions.
+
+    Returns
+    -------
+    Tuple[Hook, ...]
+        The registered hooks.
+
+    """
+    return _hooks
+
+
+def set_hooks(hooks: Optional[Sequence[Hook]]) -> None:
+    """Replace the hooks observing the pyfredapi request functions.
+
+    Parameters
+    ----------
+    hooks : Sequence[Hook] | None
+        The hooks. If None or empty, the request functions are not observed.
+
+    """
+    global _hooks
+
+    with _lock:
+        _hooks = tuple(hooks or ())
+
+
+def add_hook(hook: Hook) -> Hook:
+    """Register a hook observing the pyfredapi request functions.
+
+    Parameters
+    ----------
+    hook : Hook
+        The hook.
+
+    Returns
+    -------
+    Hook
+        The hook, so it can be removed later with `remove_hook`.
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> hook = pf.add_hook(pf.LoggingHook())
+
+    """
+    global _hooks
+
+    with _lock:
+        _hooks = (*_hooks, hook)
+    return hook
+
+
+def remove_hook(hook: Hook) -> None:
+    """Unregister a hook added with `add_hook`.
+
+    Parameters
+    ----------
+    hook : Hook
+        The hook.
+
+    Raises
+    ------
+    ValueError
+        If the hook is not registered.
+
+    """
+    global _hooks
+
+    with _lock:
+        if hook not in _hooks:
+            raise ValueError(f"{hook!r} is not a registered hook.")
+        _hooks = tuple(h for h in _hooks if h is not hook)
+
+
+def _emit_request(event: RequestEvent) -> None:
+    for hook in _hooks:
+        try:
+            hook.on_request(event)
+        except Exception:
+            # A broken hook must not break the request.
+            logger.exception("Hook %r failed on a request event.", hook)
+
+
+def _emit_conversion(event: ConversionEvent) -> None:
+    for hook in _hooks:
+        try:
+            hook.on_conversion(event)
+        except Exception:
+            logger.exception("Hook %r failed on a conversion event.", hook)
+
+
+def _shape(df: Any) -> Tuple[int, int]:
+    """Get the number of rows and columns of a dataframe, arrow table, or structured array."""
+    if len(df.shape) == 1:
+        return df.shape[0], len(df.dtype.names or ())
+    return df.shape
+
+
+def _observe_conversion(return_format: str) -> Callable[[F], F]:
+    """Emit a `ConversionEvent` for each call of a dataframe conversion function."""
+
+    def decorator(convert: F) -> F:
+        @functools.wraps(convert)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _hooks:
+                return convert(*args, **kwargs)
+
+            started = time.time()
+            start = time.perf_counter()
+            df = convert(*args, **kwargs)
+            rows, columns = _shape(df)
+            _emit_conversion(
+                ConversionEvent(
+                    return_format=return_format,
+                    started=started,
+                    duration=time.perf_counter() - start,
+                    rows=rows,
+                    columns=columns,
+                )
+            )
+            return df
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _cache_label(event: RequestEvent) -> str:
+    if event.cache_hit:
+        return "hit"
+    if event.coalesced:
+        return "coalesced"
+    return "miss"
+
+
+class LoggingHook(Hook):
+    """Log every event with the `logging` module."""
+
+    def __init__(
+        self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG
+    ):
+        """Create an instance of LoggingHook.
+
+        Parameters
+        ----------
+        logger : logging.Logger | None, optional
+            The logger. Defaults to the "pyfredapi" logger.
+        level : int, optional
+            The level of the log records. Defaults to `logging.DEBUG`.
+
+        """
+        self.logger = logger or logging.getLogger("pyfredapi")
+        self.level = level
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Log a call to a FRED API endpoint."""
+        self.logger.log(
+            self.level,
+            "GET %s status=%s cache=%s attempts=%d bytes=%d latency=%.4fs decode=%.4fs duration=%.4fs%s",
+            event.endpoint,
+            event.status_code,
+            _cache_label(event),
+            event.attempts,
+            event.bytes_received,
+            event.latency,
+            event.decode_time,
+            event.duration,
+            f" error={event.error!r}" if event.error is not None else "",
+        )
+
+    def on_conversion(self, event: ConversionEvent) -> None:
+        """Log a conversion of FRED records to a dataframe."""
+        self.logger.log(
+            self.level,
+            "convert %s rows=%d columns=%d duration=%.4fs",
+            event.return_format,
+            event.rows,
+            event.columns,
+            event.duration,
+        )
+
+
+class PrometheusHook(Hook):
+    """Record the events as Prometheus counters and histograms.
+
+    Requires the `prometheus_client` package, which can be installed with
+    `pip install 'pyfredapi[prometheus]'`.
+
+    The metrics are:
+
+    - `{namespace}_requests_total`, labelled by endpoint, status, and cache ("hit", "miss", or "coalesced").
+    - `{namespace}_retries_total`, labelled by endpoint.
+    - `{namespace}_received_bytes_total`, labelled by endpoint.
+    - `{namespace}_request_duration_seconds`, `{namespace}_network_latency_seconds`, and
+      `{namespace}_decode_duration_seconds` histograms, labelled by endpoint.
+    - `{namespace}_conversion_duration_seconds` histogram, labelled by format.
+    """
+
+    def __init__(self, registry: Any = None, namespace: str = "pyfredapi"):
+        """Create an instance of PrometheusHook.
+
+        Parameters
+        ----------
+        registry : prometheus_client.CollectorRegistry | None, optional
+            Registry of the metrics. Defaults to the default registry of `prometheus_client`.
+        namespace : str, optional
+            Prefix of the metric names. Defaults to "pyfredapi".
+
+        Raises
+        ------
+        ImportError
+            If `prometheus_client` is not installed.
+
+        """
+        if MISSING_PROMETHEUS:
+            raise ImportError(
+                "Unable to import prometheus_client. Install it with `pip install 'pyfredapi[prometheus]'`."
+            )
+        from prometheus_client import REGISTRY, Counter, Histogram
+
+        registry = REGISTRY if registry is None else registry
+        options: Any = dict(namespace=namespace, registry=registry)
+        self.requests = Counter(
+            "requests",
+            "Calls to the FRED API endpoints.",
+            ["endpoint", "status", "cache"],
+            **options,
+        )
+        self.retries = Counter(
+            "retries", "Retried FRED API requests.", ["endpoint"], **options
+        )
+        self.received_bytes = Counter(
+            "received_bytes",
+            "Bytes received from the FRED API.",
+            ["endpoint"],
+            **options,
+        )
+        self.duration = Histogram(
+            "request_duration_seconds",
+            "Total time of the calls to the FRED API endpoints.",
+            ["endpoint"],
+            **options,
+        )
+        self.latency = Histogram(
+            "network_latency_seconds",
+            "Time spent waiting for the FRED API responses.",
+            ["endpoint"],
+            **options,
+        )
+        self.decode = Histogram(
+            "decode_duration_seconds",
+            "Time spent decoding the FRED API responses.",
+            ["endpoint"],
+            **options,
+        )
+        self.conversion = Histogram(
+            "conversion_duration_seconds",
+            "Time spent converting FRED records to dataframes.",
+            ["format"],
+            **options,
+        )
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Record a call to a FRED API endpoint."""
+        status = "error" if event.status_code is None else str(event.status_code)
+        endpoint = event.endpoint
+        self.requests.labels(endpoint, status, _cache_label(event)).inc()
+        self.duration.labels(endpoint).observe(event.duration)
+        if event.attempts:
+            self.retries.labels(endpoint).inc(event.retries)
+            self.received_bytes.labels(endpoint).inc(event.bytes_received)
+            self.latency.labels(endpoint).observe(event.latency)
+        if event.decode_time:
+            self.decode.labels(endpoint).observe(event.decode_time)
+
+    def on_conversion(self, event: ConversionEvent) -> None:
+        """Record a conversion of FRED records to a dataframe."""
+        self.conversion.labels(event.return_format).observe(event.duration)
+
+
+class OpenTelemetryHook(Hook):
+    """Record every event as an OpenTelemetry span.
+
+    Requires the `opentelemetry-api` package, which can be installed with
+    `pip install 'pyfredapi[opentelemetry]'`. The spans are children of the span that is current
+    when the request function is called.
+    """
+
+    def __init__(self, tracer: Any = None):
+        """Create an instance of OpenTelemetryHook.
+
+        Parameters
+        ----------
+        tracer : opentelemetry.trace.Tracer | None, optional
+            The tracer creating the spans. Defaults to the "pyfredapi" tracer of the global tracer provider.
+
+        Raises
+        ------
+        ImportError
+            If `opentelemetry-api` is not installed.
+
+        """
+        if MISSING_OPENTELEMETRY:
+            raise ImportError(
+                "Unable to import opentelemetry. Install it with `pip install 'pyfredapi[opentelemetry]'`."
+            )
+        from opentelemetry import trace
+
+        self._trace = trace
+        self.tracer = trace.get_tracer("pyfredapi") if tracer is None else tracer
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Record a call to a FRED API endpoint as a span."""
+        attributes: Dict[str, Any] = {
+            "http.request.method": "GET",
+            "url.full": f"{event.base_url}/{event.endpoint}",
+            "pyfredapi.endpoint": event.endpoint,
+            "pyfredapi.cache": _cache_label(event),
+            "pyfredapi.attempts": event.attempts,
+            "pyfredapi.retries": event.retries,
+            "pyfredapi.received_bytes": event.bytes_received,
+            "pyfredapi.network_latency": event.latency,
+            "pyfredapi.decode_time": event.decode_time,
+        }
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+
+        span = self.tracer.start_span(
+            f"GET {event.endpoint}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes=attributes,
+            start_time=int(event.started * 1e9),
+        )
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end(end_time=int((event.started + event.duration) * 1e9))
+
+    def on_conversion(self, event: ConversionEvent) -> None:
+        """Record a conversion of FRED records to a dataframe as a span."""
+        span = self.tracer.start_span(
+            f"convert {event.return_format}",
+            attributes={
+                "pyfredapi.return_format": event.return_format,
+                "pyfredapi.rows": event.rows,
+                "pyfredapi.columns": event.columns,
+            },
+            start_time=int(event.started * 1e9),
+        )
+        span.end(end_time=int((event.started + event.duration) * 1e9))
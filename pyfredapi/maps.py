@@ -4,19 +4,34 @@ The FRED Maps API is a web service that allows developers to write programs and
 in the FRED website hosted by the Economic Research Division of the Federal Reserve Bank of St. Louis. Not all series that are in FRED have geographical data.
 """
 
-from typing import Any, Dict, List, Literal, Optional, Union
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
 
-import pandas as pd
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PlainValidator
+from typing_extensions import Annotated
 
 from ._base import _get_request
-from .utils import _convert_pydantic_model_to_frozenset
+from .utils import _validated_params
 from .utils._common_type_hints import ApiKeyType, JsonType, ReturnFormats
 from .utils.enums import ReturnFormat
 
 _geo_fred_url = "https://api.stlouisfed.org/geofred/"
 
 
+def _validate_dataframe(value: Any) -> Any:
+    # A value can only be a dataframe if pandas was imported, so pandas is never imported here.
+    pd = sys.modules.get("pandas")
+    if pd is None or not isinstance(value, pd.DataFrame):
+        raise ValueError("Input should be an instance of pandas.DataFrame")
+    return value
+
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+else:
+    DataFrame = Annotated[Any, PlainValidator(_validate_dataframe)]
+
+
 class MapApiParameters(BaseModel):
     """Represents the parameters accepted by the FRED Maps endpoints."""
 
@@ -58,10 +73,8 @@ class GeoseriesInfo(BaseModel):
 class GeoseriesData(BaseModel):
     """Represents metadata about an economics data series. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/series.html)."""
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
     info: GeoseriesInfo
-    data: Union[Dict[str, List[Dict[str, Any]]], pd.DataFrame]
+    data: Union[Dict[str, List[Dict[str, Any]]], DataFrame]
 
 
 def get_geoseries_info(series_id: str, api_key: ApiKeyType = None) -> GeoseriesInfo:
@@ -80,7 +93,7 @@ def get_geoseries_info(series_id: str, api_key: ApiKeyType = None) -> GeoseriesI
         An instance of GeoseriesInfo.
 
     """
-    params = _convert_pydantic_model_to_frozenset(MapApiParameters(series_id=series_id))
+    params = _validated_params(MapApiParameters, series_id=series_id)
     response = _get_request(
         base_url=_geo_fred_url,
         endpoint="series/group",
@@ -119,7 +132,7 @@ def get_shape_files(
         Dictionary representing the json response.
 
     """
-    params = _convert_pydantic_model_to_frozenset(MapApiParameters(shape=shape))
+    params = _validated_params(MapApiParameters, shape=shape)
     return _get_request(
         base_url=_geo_fred_url,
         endpoint="shapes/file",
@@ -159,8 +172,8 @@ def get_geoseries(
         GeoseriesData object containing the geoseries data and metadata.
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        MapApiParameters(series_id=series_id, date=end_date, start_date=start_date)
+    params = _validated_params(
+        MapApiParameters, series_id=series_id, date=end_date, start_date=start_date
     )
     response = _get_request(
         endpoint="series/data",
@@ -172,6 +185,8 @@ def get_geoseries(
     geoseries_info = get_geoseries_info(series_id=series_id)
 
     if return_format == ReturnFormat.pandas:
+        import pandas as pd
+
         dfs = []
         for date, data in response["meta"]["data"].items():
             t = pd.DataFrame.from_dict(data)
@@ -0,0 +1,298 @@
+"""The `rate_limit` module throttles the requests made to the FRED API.
+
+FRED limits the number of requests per API key to 120 per minute. Every request that is not
+served from the response cache takes a token from a token bucket first. The bucket is refilled at
+`rate` tokens per second and holds at most `burst` tokens, so short bursts run at full speed while
+the long-run request rate never exceeds the quota.
+
+`RateLimiter` is shared by all the threads of a process. `SQLiteRateLimiter` stores the bucket
+in a SQLite database, so every process using the same database file, e.g. the workers of a
+multiprocessing pipeline, shares a single quota.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, Union
+
+DEFAULT_RATE = 2.0
+DEFAULT_BURST = 5
+
+
+def _validate(rate: float, burst: int) -> None:
+    if rate <= 0:
+        raise ValueError(f"`rate` must be a positive number, not {rate}.")
+    if burst < 1:
+        raise ValueError(f"`burst` must be a positive integer, not {burst}.")
+
+
+class RateLimiter:
+    """A thread-safe token bucket rate limiter."""
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        """Create an instance of RateLimiter.
+
+        Parameters
+        ----------
+        rate : float, optional
+            Number of requests allowed per second. Defaults to 2, i.e. FRED's quota of 120 requests per minute.
+        burst : int, optional
+            Maximum number of requests that can be made at once. Defaults to 5.
+
+        """
+        _validate(rate, burst)
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(rate={self.rate}, burst={self.burst})"
+
+    def reserve(self, tokens: int = 1) -> float:
+        """Take tokens from the bucket and return the seconds to wait before using them.
+
+        The tokens are reserved even if the bucket is empty, so callers are served in order.
+
+        Parameters
+        ----------
+        tokens : int, optional
+            Number of tokens to take. Defaults to 1.
+
+        Returns
+        -------
+        float
+            Seconds to wait before making the request.
+
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.burst), self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens: int = 1) -> float:
+        """Block until tokens are available.
+
+        Parameters
+        ----------
+        tokens : int, optional
+            Number of tokens to take. Defaults to 1.
+
+        Returns
+        -------
+        float
+            Seconds spent waiting.
+
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class SQLiteRateLimiter:
+    """A token bucket rate limiter shared across processes through a SQLite database."""
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        name: str = "default",
+        timeout: float = 30,
+    ):
+        """Create an instance of SQLiteRateLimiter.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Path of the SQLite database file. The file is created if it does not exist.
+        rate : float, optional
+            Number of requests allowed per second. Defaults to 2, i.e. FRED's quota of 120 requests per minute.
+        burst : int, optional
+            Maximum number of requests that can be made at once. Defaults to 5.
+        name : str, optional
+            Name of the bucket. Limiters with the same database file and name share a quota. Defaults to "default".
+        timeout : float, optional
+            Seconds to wait for a lock held by another connection. Defaults to 30.
+
+        """
+        _validate(rate, burst)
+        self.path = os.path.abspath(os.path.expanduser(os.fspath(path)))
+        self.rate = rate
+        self.burst = burst
+        self.name = name
+        self.timeout = timeout
+        self._local = threading.local()
+
+        self._connection().executescript(_SQLITE_SCHEMA)
+
+    def __repr__(self) -> str:
+        return (
+            f"SQLiteRateLimiter(path='{self.path}', rate={self.rate}, "
+            f"burst={self.burst}, name='{self.name}')"
+        )
+
+    def reserve(self, tokens: int = 1) -> float:
+        """Take tokens from the bucket and return the seconds to wait before using them.
+
+        Parameters
+        ----------
+        tokens : int, optional
+            Number of tokens to take. Defaults to 1.
+
+        Returns
+        -------
+        float
+            Seconds to wait before making the request.
+
+        """
+        with self._transaction() as conn:
+            now = time.time()
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM buckets WHERE name = ?", (self.name,)
+            ).fetchone()
+            if row is None:
+                available = float(self.burst)
+            else:
+                available = min(
+                    float(self.burst), row[0] + max(0.0, now - row[1]) * self.rate
+                )
+            available -= tokens
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (name, tokens, updated_at) VALUES (?, ?, ?)",
+                (self.name, available, now),
+            )
+        return max(0.0, -available / self.rate)
+
+    def acquire(self, tokens: int = 1) -> float:
+        """Block until tokens are available.
+
+        Parameters
+        ----------
+        tokens : int, optional
+            Number of tokens to take. Defaults to 1.
+
+        Returns
+        -------
+        float
+            Seconds spent waiting.
+
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def close(self) -> None:
+        """Close the database connection of the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections are not shared across threads or forked processes.
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
+Limiter = Union[RateLimiter, SQLiteRateLimiter]
+
+_rate_limiter: Optional[Limiter] = RateLimiter()
+
+
+def get_rate_limiter() -> Optional[Limiter]:
+    """Get the rate limiter used by the pyfredapi request functions.
+
+    Returns
+    -------
+    RateLimiter | SQLiteRateLimiter | None
+        The rate limiter, or None if requests are not throttled.
+
+    """
+    return _rate_limiter
+
+
+def set_rate_limiter(limiter: Optional[Limiter]) -> None:
+    """Set the rate limiter used by the pyfredapi request functions.
+
+    Parameters
+    ----------
+    limiter : RateLimiter | SQLiteRateLimiter | None
+        The rate limiter. If None, requests are not throttled.
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> pf.set_rate_limiter(pf.SQLiteRateLimiter("~/.cache/pyfredapi-quota.sqlite"))
+
+    """
+    global _rate_limiter
+
+    _rate_limiter = limiter
+
+
+def configure_rate_limiter(
+    rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST
+) -> RateLimiter:
+    """Replace the rate limiter used by the pyfredapi request functions.
+
+    Parameters
+    ----------
+    rate : float, optional
+        Number of requests allowed per second. Defaults to 2, i.e. FRED's quota of 120 requests per minute.
+    burst : int, optional
+        Maximum number of requests that can be made at once. Defaults to 5.
+
+    Returns
+    -------
+    RateLimiter
+        The new rate limiter.
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> pf.configure_rate_limiter(rate=1, burst=10)
+
+    """
+    limiter = RateLimiter(rate=rate, burst=burst)
+    set_rate_limiter(limiter)
+    return limiter
@@ -0,0 +1,174 @@
+"""The `realtime` module controls how the realtime periods of observations are represented in pandas dataframes.
+
+FRED marks the end of the realtime period of the current vintage of an observation with 9999-12-31,
+which is outside the range of the `datetime64[ns]` timestamps of pandas. By default, the realtime
+columns are `datetime64[ns]` and 9999-12-31 is coerced to NaT, so an open period cannot be told
+apart from a missing date. `set_realtime_dates` selects a lossless representation instead:
+
+- "coerce": `datetime64[ns]`, dates outside the range of pandas are NaT. The default.
+- "datetime": `datetime64[s]`, which holds every FRED date. Requires pandas 2.
+- "days": `int32` numbers of days since 1970-01-01. 9999-12-31 is `REALTIME_OPEN`, which is
+  larger than every other date, so open periods need no special case in comparisons.
+
+The polars `Date` type holds every FRED date, so polars dataframes are not affected.
+
+`filter_asof` selects the vintage of each observation that was current on a date, with a vectorized
+interval query that works with every representation.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+RealtimeDates = Literal["coerce", "datetime", "days"]
+
+REALTIME_OPEN = (dt.date(9999, 12, 31) - dt.date(1970, 1, 1)).days
+
+# First and last days that fit in a datetime64[ns]. Dates outside are converted to NaT.
+PANDAS_MIN_DAY = "1677-09-22"
+PANDAS_MAX_DAY = "2262-04-11"
+
+_realtime_dates: RealtimeDates = "coerce"
+
+
+def get_realtime_dates() -> RealtimeDates:
+    """Get the representation of the realtime columns of pandas dataframes.
+
+    Returns
+    -------
+    Literal["coerce", "datetime", "days"]
+
+    """
+    return _realtime_dates
+
+
+def set_realtime_dates(representation: RealtimeDates) -> None:
+    """Set the representation of the realtime columns of pandas dataframes.
+
+    Parameters
+    ----------
+    representation : Literal["coerce", "datetime", "days"]
+        "coerce" for `datetime64[ns]` with the dates outside the range of pandas coerced to NaT,
+        "datetime" for `datetime64[s]`, or "days" for `int32` days since 1970-01-01.
+
+    Raises
+    ------
+    ValueError
+        If the representation is unknown, or is "datetime" and pandas is older than 2.0.
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> pf.set_realtime_dates("datetime")
+    >>> df = pf.get_series_all_releases("GDP")
+    >>> df["realtime_end"].max()
+    Timestamp('9999-12-31 00:00:00')
+
+    """
+    global _realtime_dates
+
+    if representation not in ("coerce", "datetime", "days"):
+        raise ValueError(
+            f"`representation` must be one of 'coerce', 'datetime', or 'days', not {representation!r}."
+        )
+    if representation == "datetime":
+        import pandas as pd
+
+        if int(pd.__version__.split(".")[0]) < 2:
+            raise ValueError(
+                "The 'datetime' representation requires pandas 2.0 or later. Use 'days' instead."
+            )
+    _realtime_dates = representation
+
+
+def _realtime_column(
+    days: np.ndarray, representation: Optional[RealtimeDates] = None
+) -> np.ndarray:
+    """Convert a datetime64[D] array of dates to a representation, by default the current one."""
+    import numpy as np
+
+    representation = representation or _realtime_dates
+    if representation == "days":
+        return days.astype(np.int32)
+    if representation == "datetime":
+        return days.astype("datetime64[s]")
+    days = days.copy()
+    days[
+        (days < np.datetime64(PANDAS_MIN_DAY)) | (days > np.datetime64(PANDAS_MAX_DAY))
+    ] = np.datetime64("NaT")
+    return days.astype("datetime64[ns]")
+
+
+def to_realtime_days(dates: Any) -> Union[int, np.ndarray]:
+    """Convert YYYY-MM-DD dates to the days since 1970-01-01 of the "days" representation.
+
+    Parameters
+    ----------
+    dates : str | datetime.date | Sequence[str]
+        A date, or a sequence of dates.
+
+    Returns
+    -------
+    int | np.ndarray
+        The number of days of a date, or an `int32` array for a sequence of dates.
+
+    """
+    import numpy as np
+
+    if isinstance(dates, (str, dt.date)):
+        return int(np.datetime64(dates, "D").astype(np.int64))
+    return np.asarray(dates, dtype="datetime64[D]").astype(np.int32)
+
+
+def filter_asof(df: Any, date: Union[str, dt.date]) -> Any:
+    """Select the rows of a dataframe whose realtime period contains a date.
+
+    Applied to the observations of all the releases of a series, e.g. from
+    `get_series_all_releases`, it selects the vintage of each observation that was current on
+    the date. A NaT `realtime_end`, i.e. 9999-12-31 in the "coerce" representation, is treated as
+    an open period.
+
+    Parameters
+    ----------
+    df : pd.DataFrame | pl.DataFrame | pl.LazyFrame
+        Dataframe with `realtime_start` and `realtime_end` columns in any representation.
+    date : str | datetime.date
+        YYYY-MM-DD date.
+
+    Returns
+    -------
+    pd.DataFrame | pl.DataFrame | pl.LazyFrame
+        The selected rows.
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> df = pf.get_series_all_releases("GDP")
+    >>> pf.filter_asof(df, "2020-06-01")
+
+    """
+    import numpy as np
+
+    if type(df).__module__.startswith("polars"):
+        import polars as pl
+
+        date = dt.date.fromisoformat(date) if isinstance(date, str) else date
+        return df.filter(
+            (pl.col("realtime_start") <= date) & (pl.col("realtime_end") >= date)
+        )
+
+    start = df["realtime_start"].to_numpy()
+    end = df["realtime_end"].to_numpy()
+    if start.dtype.kind == "i":
+        days = to_realtime_days(date)
+        return df[(start <= days) & (end >= days)]
+
+    # Compare days, so 9999-12-31 does not overflow the nanoseconds of the columns.
+    start = start.astype("datetime64[D]")
+    end = end.astype("datetime64[D]")
+    day = np.datetime64(date, "D")
+    return df[(start <= day) & ((end >= day) | np.isnat(end))]
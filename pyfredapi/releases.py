@@ -1,12 +1,26 @@
 """The `releases` module provides functions to request data from the [FRED API Releases endpoints](https://fred.stlouisfed.org/docs/api/fred/#Releases)."""
 
-from typing import Literal, Optional
+from typing import Iterator, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, PositiveInt
 
 from ._base import _get_request
-from .utils import _convert_pydantic_model_to_frozenset
-from .utils._common_type_hints import ApiKeyType, JsonType, KwargsType
+from ._pagination import (
+    DEFAULT_PREFETCH,
+    _get_all_pages,
+    _iter_pages,
+    _iter_records,
+)
+from .utils import _validated_params
+from .utils._common_type_hints import (
+    ApiKeyType,
+    JsonType,
+    KwargsType,
+    ReturnFormats,
+    ReturnTypes,
+)
+from .utils._convert_to_df import _convert_records
+from .utils.enums import ReturnFormat
 
 
 class ReleaseApiParameters(BaseModel):
@@ -42,27 +56,84 @@ class ReleaseApiParameters(BaseModel):
     tag_names: Optional[str] = None
 
 
-def get_releases(api_key: ApiKeyType = None, **kwargs: KwargsType) -> JsonType:
+def get_releases(
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    paginate: bool = False,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
     """Get all releases of economic data. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/releases.html).
 
     Parameters
     ----------
     api_key : str | None, optional
         FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
+    return_format : Literal["json", "pandas", "polars", "polars_lazy", "arrow"] | ReturnFormat, optional
+        In what format to return the response. Defaults to 'json'.
+    paginate : bool, optional
+        If `True`, request all the pages of the response concurrently and merge them. The `limit` parameter is used as the page size. Defaults to False.
     **kwargs : dict, optional
         Additional parameters to FRED API ``releases/`` endpoint. Refer to the FRED documentation for a list of all possible parameters.
 
     Returns
     -------
-    Dictionary representing the Json response
+    Dictionary representing the Json response, or a dataframe of the releases.
 
     """
-    params = _convert_pydantic_model_to_frozenset(ReleaseApiParameters(**kwargs))
-    return _get_request(
-        endpoint="releases",
-        api_key=api_key,
-        params=params,
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(ReleaseApiParameters, **kwargs)
+    if paginate:
+        response = _get_all_pages(
+            endpoint="releases", records_key="releases", api_key=api_key, params=params
+        )
+    else:
+        response = _get_request(endpoint="releases", api_key=api_key, params=params)
+
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["releases"], return_format)
+
+
+def iter_releases(
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    prefetch: int = DEFAULT_PREFETCH,
+    **kwargs: KwargsType,
+) -> Iterator[ReturnTypes]:
+    """Lazily iterate over all releases of economic data. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/releases.html).
+
+    Pages are requested as they are consumed, and the next `prefetch` pages are requested in the background.
+
+    Parameters
+    ----------
+    api_key : str | None, optional
+        FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
+    return_format : Literal["json", "pandas", "polars", "polars_lazy", "arrow"] | ReturnFormat, optional
+        If 'json', yield each release as a dictionary. If 'pandas', 'polars', 'polars_lazy' or 'arrow', yield a dataframe or table per page. Defaults to 'json'.
+    prefetch : int, optional
+        Number of pages to request ahead of the consumer. Defaults to 2.
+    **kwargs : dict, optional
+        Additional parameters to FRED API ``releases`` endpoint. The `limit` parameter is used as the page size.
+
+    Yields
+    ------
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> for df in pf.iter_releases(return_format="pandas"):
+    ...     print(len(df))
+
+    """
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(ReleaseApiParameters, **kwargs)
+    pages = _iter_pages(
+        endpoint="releases", api_key=api_key, params=params, prefetch=prefetch
     )
+    return _iter_records(pages, "releases", return_format)
 
 
 def get_releases_dates(api_key: ApiKeyType = None, **kwargs: KwargsType) -> JsonType:
@@ -80,7 +151,7 @@ def get_releases_dates(api_key: ApiKeyType = None, **kwargs: KwargsType) -> Json
     Dictionary representing the Json response
 
     """
-    params = _convert_pydantic_model_to_frozenset(ReleaseApiParameters(**kwargs))
+    params = _validated_params(ReleaseApiParameters, **kwargs)
     return _get_request(
         endpoint="releases/dates",
         api_key=api_key,
@@ -111,9 +182,7 @@ def get_release(
     >>> release_info = get_release(release_id=53)
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        ReleaseApiParameters(release_id=release_id, **kwargs)
-    )
+    params = _validated_params(ReleaseApiParameters, release_id=release_id, **kwargs)
     return _get_request(
         endpoint="release",
         api_key=api_key,
@@ -140,9 +209,7 @@ def get_release_dates(
     Dictionary representing the Json response.
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        ReleaseApiParameters(release_id=release_id, **kwargs)
-    )
+    params = _validated_params(ReleaseApiParameters, release_id=release_id, **kwargs)
     return _get_request(
         endpoint="release/dates",
         api_key=api_key,
@@ -151,8 +218,12 @@ def get_release_dates(
 
 
 def get_release_series(
-    release_id: int, api_key: ApiKeyType = None, **kwargs: KwargsType
-) -> JsonType:
+    release_id: int,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    paginate: bool = False,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
     """Get the series on a release of economic data. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/release_series.html).
 
     Parameters
@@ -161,22 +232,85 @@ def get_release_series(
         Release id of interest.
     api_key : str | None, optional
         FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
+    return_format : Literal["json", "pandas", "polars", "polars_lazy", "arrow"] | ReturnFormat, optional
+        In what format to return the response. Defaults to 'json'.
+    paginate : bool, optional
+        If `True`, request all the pages of the response concurrently and merge them. The `limit` parameter is used as the page size. Defaults to False.
     **kwargs : dict, optional
         Additional parameters to FRED API release/release_series/ endpoint. Refer to the FRED documentation for a list of all possible parameters.
 
     Returns
     -------
-    Dictionary representing the Json response.
+    Dictionary representing the Json response, or a dataframe of the series.
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> pf.get_release_series(release_id=51, return_format="pandas", paginate=True)
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        ReleaseApiParameters(release_id=release_id, **kwargs)
-    )
-    return _get_request(
-        endpoint="release/series",
-        api_key=api_key,
-        params=params,
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(ReleaseApiParameters, release_id=release_id, **kwargs)
+    if paginate:
+        response = _get_all_pages(
+            endpoint="release/series",
+            records_key="seriess",
+            api_key=api_key,
+            params=params,
+        )
+    else:
+        response = _get_request(
+            endpoint="release/series", api_key=api_key, params=params
+        )
+
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["seriess"], return_format)
+
+
+def iter_release_series(
+    release_id: int,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    prefetch: int = DEFAULT_PREFETCH,
+    **kwargs: KwargsType,
+) -> Iterator[ReturnTypes]:
+    """Lazily iterate over the series on a release of economic data. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/release_series.html).
+
+    Pages are requested as they are consumed, and the next `prefetch` pages are requested in the background.
+
+    Parameters
+    ----------
+    release_id : int
+        Release id of interest.
+    api_key : str | None, optional
+        FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
+    return_format : Literal["json", "pandas", "polars", "polars_lazy", "arrow"] | ReturnFormat, optional
+        If 'json', yield each series as a dictionary. If 'pandas', 'polars', 'polars_lazy' or 'arrow', yield a dataframe or table per page. Defaults to 'json'.
+    prefetch : int, optional
+        Number of pages to request ahead of the consumer. Defaults to 2.
+    **kwargs : dict, optional
+        Additional parameters to FRED API ``release/series`` endpoint. The `limit` parameter is used as the page size.
+
+    Yields
+    ------
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> for series in pf.iter_release_series(release_id=51):
+    ...     print(series["id"])
+
+    """
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(ReleaseApiParameters, release_id=release_id, **kwargs)
+    pages = _iter_pages(
+        endpoint="release/series", api_key=api_key, params=params, prefetch=prefetch
     )
+    return _iter_records(pages, "seriess", return_format)
 
 
 def get_release_sources(
@@ -198,9 +332,7 @@ def get_release_sources(
     Dictionary representing the Json response.
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        ReleaseApiParameters(release_id=release_id, **kwargs)
-    )
+    params = _validated_params(ReleaseApiParameters, release_id=release_id, **kwargs)
     return _get_request(
         endpoint="release/sources",
         api_key=api_key,
@@ -227,9 +359,7 @@ def get_release_tags(
     Dictionary representing the Json response.
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        ReleaseApiParameters(release_id=release_id, **kwargs)
-    )
+    params = _validated_params(ReleaseApiParameters, release_id=release_id, **kwargs)
     return _get_request(
         endpoint="release/tags",
         api_key=api_key,
@@ -258,8 +388,8 @@ def get_release_related_tags(
     Dictionary representing the Json response.
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        ReleaseApiParameters(release_id=release_id, tag_names=tag_names, **kwargs)
+    params = _validated_params(
+        ReleaseApiParameters, release_id=release_id, tag_names=tag_names, **kwargs
     )
     return _get_request(
         endpoint="release/related_tags",
@@ -287,9 +417,7 @@ def get_release_tables(
     Dictionary representing the Json response.
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        ReleaseApiParameters(release_id=release_id, **kwargs)
-    )
+    params = _validated_params(ReleaseApiParameters, release_id=release_id, **kwargs)
     return _get_request(
         endpoint="release/tables",
         api_key=api_key,
@@ -0,0 +1,323 @@
+"""The `retry` module retries FRED API requests that fail with a transient error.
+
+Connection errors, timeouts, and responses with a retryable status code (429 Too Many Requests
+and 5xx gateway errors by default) are retried with exponential backoff and jitter until the
+maximum number of attempts or the total deadline is reached. A `Retry-After` header sent by the
+server takes precedence over the computed backoff.
+
+Every attempt is recorded as a `RetryAttempt`. The attempts of a failed request are available on
+the `attempts` attribute of the raised `FredAPIRequestError`, and aggregated counters are available
+through `RetryPolicy.stats`.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Iterable, List, Mapping, Optional
+
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_MAX_BACKOFF = 30.0
+DEFAULT_DEADLINE = 120.0
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass
+class RetryAttempt:
+    """A single attempt of a request to the FRED API."""
+
+    attempt: int
+    status_code: Optional[int]
+    error: Optional[str]
+    elapsed: float
+    wait: Optional[float] = None
+
+
+@dataclass
+class RetryStats:
+    """Counters of the requests made with a retry policy."""
+
+    requests: int = 0
+    attempts: int = 0
+    retries: int = 0
+    failures: int = 0
+    wait: float = 0.0
+
+
+class RetryPolicy:
+    """Decide if and when a failed request to the FRED API is retried."""
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        respect_retry_after: bool = True,
+        deadline: Optional[float] = DEFAULT_DEADLINE,
+    ):
+        """Create an instance of RetryPolicy.
+
+        Parameters
+        ----------
+        max_attempts : int, optional
+            Maximum number of attempts per request, including the first one. Defaults to 4.
+        backoff_factor : float, optional
+            Backoff before the n-th retry is `backoff_factor * 2 ** (n - 1)` seconds. Defaults to 0.5.
+        max_backoff : float, optional
+            Maximum backoff between two attempts in seconds. Defaults to 30.
+        jitter : bool, optional
+            If `True`, the backoff is drawn uniformly between 0 and the exponential backoff ("full jitter"),
+            so concurrent clients do not retry in lockstep. Defaults to True.
+        retry_statuses : Iterable[int], optional
+            HTTP status codes that are retried. Defaults to 429, 500, 502, 503, and 504.
+        respect_retry_after : bool, optional
+            If `True`, wait for the duration of the `Retry-After` header when the server sends one. Defaults to True.
+        deadline : float | None, optional
+            Maximum total time in seconds spent on a request, including the waits between attempts.
+            Defaults to 120. If None, only `max_attempts` limits the retries.
+
+        """
+        if max_attempts < 1:
+            raise ValueError(
+                f"`max_attempts` must be a positive integer, not {max_attempts}."
+            )
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.deadline = deadline
+        self._lock = threading.Lock()
+        self._stats = RetryStats()
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, backoff_factor={self.backoff_factor}, "
+            f"deadline={self.deadline})"
+        )
+
+    @property
+    def stats(self) -> RetryStats:
+        """Return a snapshot of the retry counters."""
+        with self._lock:
+            return RetryStats(**vars(self._stats))
+
+    def backoff(self, retry: int) -> float:
+        """Get the backoff before a retry.
+
+        Parameters
+        ----------
+        retry : int
+            Number of the retry, starting at 1.
+
+        Returns
+        -------
+        float
+            Seconds to wait before the retry.
+
+        """
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** (retry - 1))
+        if self.jitter:
+            return random.uniform(0, backoff)  # noqa: S311
+        return backoff
+
+    def next_wait(
+        self,
+        attempt: int,
+        status_code: Optional[int],
+        headers: Optional[Mapping[str, Any]],
+        elapsed: float,
+    ) -> Optional[float]:
+        """Get the seconds to wait before retrying a failed attempt.
+
+        Parameters
+        ----------
+        attempt : int
+            Number of the failed attempt, starting at 1.
+        status_code : int | None
+            HTTP status code of the response, or None if no response was received.
+        headers : Mapping[str, Any] | None
+            Headers of the response.
+        elapsed : float
+            Seconds spent on the request so far.
+
+        Returns
+        -------
+        float | None
+            Seconds to wait before the next attempt, or None if the request should not be retried.
+
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if status_code is not None and status_code not in self.retry_statuses:
+            return None
+
+        wait = self.backoff(attempt)
+        if self.respect_retry_after and headers:
+            retry_after = _parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                wait = retry_after
+
+        if self.deadline is not None and elapsed + wait > self.deadline:
+            return None
+        return wait
+
+    def _record(self, attempts: List[RetryAttempt], failed: bool) -> None:
+        with self._lock:
+            self._stats.requests += 1
+            self._stats.attempts += len(attempts)
+            self._stats.retries += len(attempts) - 1
+            self._stats.failures += failed
+            self._stats.wait += sum(a.wait or 0.0 for a in attempts)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+@dataclass
+class _RetryState:
+    """Track the attempts of a single request."""
+
+    policy: Optional[RetryPolicy]
+    started: float = field(default_factory=time.monotonic)
+    attempts: List[RetryAttempt] = field(default_factory=list)
+    _attempt_started: float = 0.0
+
+    def begin(self) -> None:
+        self._attempt_started = time.monotonic()
+
+    def succeeded(self, status_code: int) -> None:
+        self._append(status_code, None)
+        if self.policy is not None:
+            self.policy._record(self.attempts, failed=False)
+
+    def failed(
+        self,
+        status_code: Optional[int],
+        error: str,
+        headers: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[float]:
+        """Record a failed attempt and return the seconds to wait before retrying, or None to give up."""
+        attempt = self._append(status_code, error)
+        if self.policy is None:
+            return None
+
+        attempt.wait = self.policy.next_wait(
+            attempt.attempt, status_code, headers, time.monotonic() - self.started
+        )
+        if attempt.wait is None:
+            self.policy._record(self.attempts, failed=True)
+        return attempt.wait
+
+    def _append(self, status_code: Optional[int], error: Optional[str]) -> RetryAttempt:
+        attempt = RetryAttempt(
+            attempt=len(self.attempts) + 1,
+            status_code=status_code,
+            error=error,
+            elapsed=time.monotonic() - self._attempt_started,
+        )
+        self.attempts.append(attempt)
+        return attempt
+
+
+_retry_policy: Optional[RetryPolicy] = RetryPolicy()
+
+
+def get_retry_policy() -> Optional[RetryPolicy]:
+    """Get the retry policy used by the pyfredapi request functions.
+
+    Returns
+    -------
+    RetryPolicy | None
+        The retry policy, or None if failed requests are not retried.
+
+    """
+    return _retry_policy
+
+
+def set_retry_policy(policy: Optional[RetryPolicy]) -> None:
+    """Set the retry policy used by the pyfredapi request functions.
+
+    Parameters
+    ----------
+    policy : RetryPolicy | None
+        The retry policy. If None, failed requests are not retried.
+
+    """
+    global _retry_policy
+
+    _retry_policy = policy
+
+
+def configure_retry_policy(
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    max_backoff: float = DEFAULT_MAX_BACKOFF,
+    jitter: bool = True,
+    retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+    respect_retry_after: bool = True,
+    deadline: Optional[float] = DEFAULT_DEADLINE,
+) -> RetryPolicy:
+    """Replace the retry policy used by the pyfredapi request functions.
+
+    Parameters
+    ----------
+    max_attempts : int, optional
+        Maximum number of attempts per request, including the first one. Defaults to 4.
+    backoff_factor : float, optional
+        Backoff before the n-th retry is `backoff_factor * 2 ** (n - 1)` seconds. Defaults to 0.5.
+    max_backoff : float, optional
+        Maximum backoff between two attempts in seconds. Defaults to 30.
+    jitter : bool, optional
+        If `True`, the backoff is drawn uniformly between 0 and the exponential backoff. Defaults to True.
+    retry_statuses : Iterable[int], optional
+        HTTP status codes that are retried. Defaults to 429, 500, 502, 503, and 504.
+    respect_retry_after : bool, optional
+        If `True`, wait for the duration of the `Retry-After` header when the server sends one. Defaults to True.
+    deadline : float | None, optional
+        Maximum total time in seconds spent on a request. Defaults to 120.
+
+    Returns
+    -------
+    RetryPolicy
+        The new retry policy.
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> pf.configure_retry_policy(max_attempts=8, deadline=600)
+
+    """
+    policy = RetryPolicy(
+        max_attempts=max_attempts,
+        backoff_factor=backoff_factor,
+        max_backoff=max_backoff,
+        jitter=jitter,
+        retry_statuses=retry_statuses,
+        respect_retry_after=respect_retry_after,
+        deadline=deadline,
+    )
+    set_retry_policy(policy)
+    return policy
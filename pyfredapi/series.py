@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import webbrowser
-from typing import List, Literal, Optional
+from typing import Iterator, List, Literal, Optional
 
-import pandas as pd
 from pydantic import BaseModel, ConfigDict, PositiveInt
 
 from ._base import _get_request
-from .utils import _convert_pydantic_model_to_dict, _convert_pydantic_model_to_frozenset
+from ._pagination import (
+    DEFAULT_PREFETCH,
+    _get_all_pages,
+    _iter_pages,
+    _iter_records,
+)
+from .utils import _validated_dict, _validated_params
 from .utils._common_type_hints import (
     ApiKeyType,
     JsonType,
@@ -17,12 +22,19 @@ from .utils._common_type_hints import (
     ReturnFormats,
     ReturnTypes,
 )
-from .utils._convert_to_df import _convert_to_pandas, _convert_to_polars
+from .utils._convert_to_df import _categorize, _convert_observations, _convert_records
 from .utils.enums import ReturnFormat
 
 _earliest_realtime_start: str = "1776-07-04"
 _latest_realtime_end: str = "9999-12-31"
 
+# Parameters that select a realtime period, so the observations can have different realtime periods.
+_realtime_params = frozenset({"realtime_start", "realtime_end", "vintage_dates"})
+
+
+def _has_realtime_params(params: frozenset) -> bool:
+    return any(key in _realtime_params for key, _ in params)
+
 
 class SeriesApiParameters(BaseModel):
     """Represents the parameters accepted by the FRED Series endpoints."""
@@ -159,9 +171,7 @@ def get_series_info(
         An instance of SeriesInfo.
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        SeriesApiParameters(series_id=series_id, **kwargs)
-    )
+    params = _validated_params(SeriesApiParameters, series_id=series_id, **kwargs)
     response = _get_request(
         api_key=api_key,
         endpoint="series",
@@ -190,9 +200,7 @@ def get_series_categories(
         Dictionary representing the json response.
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        SeriesApiParameters(series_id=series_id, **kwargs)
-    )
+    params = _validated_params(SeriesApiParameters, series_id=series_id, **kwargs)
     return _get_request(
         api_key=api_key,
         endpoint="series/categories",
@@ -204,6 +212,7 @@ def get_series(
     series_id: str,
     api_key: ApiKeyType = None,
     return_format: ReturnFormats = "pandas",
+    columns: Optional[List[str]] = None,
     **kwargs: KwargsType,
 ) -> ReturnTypes:
     """Get the observations or data values for an economic data series by ID. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/series_observations.html).
@@ -214,33 +223,36 @@ def get_series(
         Series id of interest.
     api_key : str | None, optional
         FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
-    return_format : Literal[json, pandas] | ReturnFormat, optional
-        Define how to return the response. Must be either 'json' or 'pandas'. Defaults to 'pandas'.
+    return_format : Literal["json", "pandas", "polars", "polars_lazy", "arrow", "numpy"] | ReturnFormat, optional
+        Define how to return the response. Defaults to 'pandas'. 'numpy' returns a structured array with `date` and `value`
+        fields, plus `realtime_start` and `realtime_end` fields if a realtime period or vintage dates are requested.
+    columns : List[str] | None, optional
+        Fields to convert, e.g. ["date", "value"]. The other fields are never parsed. Ignored if `return_format` is 'json'. Defaults to None, i.e. every field.
     **kwargs : dict, optional
         Additional parameters to FRED API ``series/observations`` endpoint. Refer to the FRED documentation for a list of all possible parameters.
 
     Returns
     -------
-    dict | pd.DataFrame | pl.DataFrame
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table | np.ndarray
 
     """
     return_format = ReturnFormat(return_format)
 
-    params = _convert_pydantic_model_to_frozenset(
-        SeriesApiParameters(series_id=series_id, **kwargs)
-    )
+    params = _validated_params(SeriesApiParameters, series_id=series_id, **kwargs)
     response = _get_request(
         api_key=api_key,
         endpoint="series/observations",
         params=params,
     )
 
-    if return_format == ReturnFormat.pandas:
-        return _convert_to_pandas(response["observations"])
-    if return_format == ReturnFormat.polars:
-        return _convert_to_polars(response["observations"])
-
-    return response["observations"]
+    if return_format == ReturnFormat.json:
+        return response["observations"]
+    return _convert_observations(
+        response["observations"],
+        return_format,
+        columns,
+        realtime=_has_realtime_params(params),
+    )
 
 
 def get_series_releases(
@@ -263,9 +275,7 @@ def get_series_releases(
         Dictionary representing the json response.
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        SeriesApiParameters(series_id=series_id, **kwargs)
-    )
+    params = _validated_params(SeriesApiParameters, series_id=series_id, **kwargs)
     return _get_request(
         endpoint="series/release",
         api_key=api_key,
@@ -293,9 +303,7 @@ def get_series_tags(
         Dictionary representing the json response.
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        SeriesApiParameters(series_id=series_id, **kwargs)
-    )
+    params = _validated_params(SeriesApiParameters, series_id=series_id, **kwargs)
     return _get_request(
         endpoint="series/tags",
         api_key=api_key,
@@ -323,9 +331,7 @@ def get_series_updates(
         Dictionary representing the json response.
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        SeriesApiParameters(series_id=series_id, **kwargs)
-    )
+    params = _validated_params(SeriesApiParameters, series_id=series_id, **kwargs)
     return _get_request(
         endpoint="series/updates",
         api_key=api_key,
@@ -355,9 +361,7 @@ def get_series_vintagedates(
         List of strings representing the the available vintage dates
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        SeriesApiParameters(series_id=series_id, **kwargs)
-    )
+    params = _validated_params(SeriesApiParameters, series_id=series_id, **kwargs)
     response = _get_request(
         endpoint="series/vintagedates",
         api_key=api_key,
@@ -370,6 +374,7 @@ def get_series_all_releases(
     series_id: str,
     api_key: ApiKeyType = None,
     return_format: ReturnFormats = "pandas",
+    columns: Optional[List[str]] = None,
     **kwargs: KwargsType,
 ) -> ReturnTypes:
     """Get the observations or data values for all releases an economic data series by ID.
@@ -380,14 +385,17 @@ def get_series_all_releases(
         Series id of interest.
     api_key : str | None, optional
         FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
-    return_format : Literal["json", "pandas", "polars"] | ReturnFormat, optional
-        In what format to return the response. Must be either 'json' or 'pandas'. Defaults to 'pandas'.
+    return_format : Literal["json", "pandas", "polars", "polars_lazy", "arrow", "numpy"] | ReturnFormat, optional
+        In what format to return the response. Defaults to 'pandas'. 'numpy' returns a structured array with `date`, `value`,
+        `realtime_start`, and `realtime_end` fields.
+    columns : List[str] | None, optional
+        Fields to convert, e.g. ["date", "value"]. The other fields are never parsed. Ignored if `return_format` is 'json'. Defaults to None, i.e. every field.
     **kwargs : dict, optional
         Additional parameters to FRED API ``series/observation`` endpoint. Refer to the FRED documentation for a list of all possible parameters.
 
     Returns
     -------
-    dict | pd.DataFrame | pl.DataFrame
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table | np.ndarray
 
     """
     return_format = ReturnFormat(return_format)
@@ -397,18 +405,18 @@ def get_series_all_releases(
     _ = kwargs.pop("realtime_start", None)
     _ = kwargs.pop("realtime_end", None)
 
-    params = _convert_pydantic_model_to_dict(
-        SeriesApiParameters(
-            realtime_start=_earliest_realtime_start,
-            realtime_end=_latest_realtime_end,
-            **kwargs,
-        )
+    params = _validated_dict(
+        SeriesApiParameters,
+        realtime_start=_earliest_realtime_start,
+        realtime_end=_latest_realtime_end,
+        **kwargs,
     )
 
     return get_series(
         series_id=series_id,
         api_key=api_key,
         return_format=return_format,
+        columns=columns,
         **params,
     )
 
@@ -417,6 +425,7 @@ def get_series_initial_release(
     series_id: str,
     api_key: ApiKeyType = None,
     return_format: ReturnFormats = "pandas",
+    columns: Optional[List[str]] = None,
     **kwargs: KwargsType,
 ) -> ReturnTypes:
     """Get the observations or data values for the initial release of an economic data series.
@@ -429,14 +438,17 @@ def get_series_initial_release(
         Series id of interest.
     api_key : str | None, optional
         FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
-    return_format : Literal["json", "pandas", "polars"] | ReturnFormat, optional
-        In what format to return the response. Must be either 'json' or 'pandas'. Defaults to 'pandas'.
+    return_format : Literal["json", "pandas", "polars", "polars_lazy", "arrow", "numpy"] | ReturnFormat, optional
+        In what format to return the response. Defaults to 'pandas'. 'numpy' returns a structured array with `date`, `value`,
+        `realtime_start`, and `realtime_end` fields.
+    columns : List[str] | None, optional
+        Fields to convert, e.g. ["date", "value"]. The other fields are never parsed. Ignored if `return_format` is 'json'. Defaults to None, i.e. every field.
     **kwargs : dict, optional
         Additional parameters to FRED API ``series/observation`` endpoint. Refer to the FRED documentation for a list of all possible parameters.
 
     Returns
     -------
-    dict | pd.DataFrame | pl.DataFrame
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table | np.ndarray
 
     """
     return_format = ReturnFormat(return_format)
@@ -446,16 +458,18 @@ def get_series_initial_release(
     _ = kwargs.pop("realtime_start", None)
     _ = kwargs.pop("output_type", None)
 
-    params = _convert_pydantic_model_to_dict(
-        SeriesApiParameters(
-            realtime_start=_earliest_realtime_start, output_type=4, **kwargs
-        )
+    params = _validated_dict(
+        SeriesApiParameters,
+        realtime_start=_earliest_realtime_start,
+        output_type=4,
+        **kwargs,
     )
 
     return get_series(
         series_id=series_id,
         api_key=api_key,
         return_format=return_format,
+        columns=columns,
         **params,
     )
 
@@ -465,6 +479,7 @@ def get_series_asof_date(
     date: str,
     api_key: ApiKeyType = None,
     return_format: ReturnFormats = "pandas",
+    columns: Optional[List[str]] = None,
     **kwargs: KwargsType,
 ) -> ReturnTypes:
     """Get the observations or data values for an economic data series made on or before a specific date.
@@ -480,14 +495,17 @@ def get_series_asof_date(
         Include only data revisions made on or before this date.
     api_key : str | None, optional
         FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
-    return_format : Literal["json", "pandas"] | ReturnFormat, optional
-        In what format to return the response. Must be either 'json' or 'pandas'. Defaults to 'pandas'.
+    return_format : Literal["json", "pandas", "polars", "polars_lazy", "arrow", "numpy"] | ReturnFormat, optional
+        In what format to return the response. Defaults to 'pandas'. 'numpy' returns a structured array with `date`, `value`,
+        `realtime_start`, and `realtime_end` fields.
+    columns : List[str] | None, optional
+        Fields to convert, e.g. ["date", "value"]. The other fields are never parsed. Ignored if `return_format` is 'json'. Defaults to None, i.e. every field.
     **kwargs : dict, optional
         Additional parameters to FRED API ``series/observation`` endpoint. Refer to the FRED documentation for a list of all possible parameters.
 
     Returns
     -------
-    dict | pd.DataFrame | pl.DataFrame
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table | np.ndarray
 
     """
     return_format = ReturnFormat(return_format)
@@ -497,16 +515,18 @@ def get_series_asof_date(
     _ = kwargs.pop("realtime_start", None)
     _ = kwargs.pop("realtime_end", None)
 
-    params = _convert_pydantic_model_to_dict(
-        SeriesApiParameters(
-            realtime_start=_earliest_realtime_start, realtime_end=date, **kwargs
-        )
+    params = _validated_dict(
+        SeriesApiParameters,
+        realtime_start=_earliest_realtime_start,
+        realtime_end=date,
+        **kwargs,
     )
 
     return get_series(
         series_id=series_id,
         api_key=api_key,
         return_format=return_format,
+        columns=columns,
         **params,
     )
 
@@ -516,6 +536,9 @@ def search_series(
     api_key: ApiKeyType = None,
     search_type: Literal["full_text", "series_id"] = "full_text",
     return_format: ReturnFormats = "pandas",
+    paginate: bool = False,
+    columns: Optional[List[str]] = None,
+    categorical: bool = False,
     **kwargs: KwargsType,
 ) -> ReturnTypes:
     """Get economic data series that match search text. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/series_search.html).
@@ -529,43 +552,108 @@ def search_series(
     search_type : Literal["full_text", "series_id"]
         Defines which type of search to preform. One of the following strings: 'full_text', 'series_id'.
         [Parameter docs](https://fred.stlouisfed.org/docs/api/fred/series_search.html#search_type).
-    return_format : : Literal["json", "pandas", "polars"] | ReturnFormat, optional
+    return_format : : Literal["json", "pandas", "polars", "polars_lazy", "arrow"] | ReturnFormat, optional
         In what format to return the response. Must be either 'json' or 'pandas'. Defaults to 'pandas'.
+    paginate : bool, optional
+        If `True`, request all the pages of the response concurrently and merge them. The `limit` parameter is used as the page size. Defaults to False.
+    columns : List[str] | None, optional
+        Fields to convert, e.g. ["id", "title"]. The other fields are never parsed. Ignored if `return_format` is 'json'. Defaults to None, i.e. every field.
+    categorical : bool, optional
+        If `True`, string columns where most values repeat, e.g. `frequency` and `units`, are pandas `category` or polars `Categorical` columns. Arrow tables are always dictionary encoded. Ignored if `return_format` is 'json'. Defaults to False.
     **kwargs : dict, optional
         Additional parameters to FRED API ``series/observation`` endpoint. Refer to the FRED documentation for a list of all possible parameters.
 
     Returns
     -------
-    dict | pd.DataFrame | pl.DataFrame
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table
 
     """
     return_format = ReturnFormat(return_format)
 
-    params = _convert_pydantic_model_to_frozenset(
-        SeriesSearchParameters(
-            search_text=search_text,
-            search_type=search_type,
-            **kwargs,
-        )
+    params = _validated_params(
+        SeriesSearchParameters,
+        search_text=search_text,
+        search_type=search_type,
+        **kwargs,
     )
 
-    response = _get_request(
-        endpoint="series/search",
-        api_key=api_key,
-        params=params,
-    )
+    if paginate:
+        response = _get_all_pages(
+            endpoint="series/search",
+            records_key="seriess",
+            api_key=api_key,
+            params=params,
+        )
+    else:
+        response = _get_request(
+            endpoint="series/search",
+            api_key=api_key,
+            params=params,
+        )
 
-    if return_format == ReturnFormat.pandas:
-        return _convert_to_pandas(response["seriess"])
-    elif return_format == ReturnFormat.polars:
-        return _convert_to_polars(response["seriess"])
-    return response
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["seriess"], return_format, columns, categorical)
+
+
+def iter_search_series(
+    search_text: str,
+    search_type: Literal["full_text", "series_id"] = "full_text",
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    prefetch: int = DEFAULT_PREFETCH,
+    **kwargs: KwargsType,
+) -> Iterator[ReturnTypes]:
+    """Lazily iterate over the economic data series that match search text. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/series_search.html).
+
+    Pages are requested as they are consumed, and the next `prefetch` pages are requested in the background.
+
+    Parameters
+    ----------
+    search_text : str
+        The text to match against.
+    search_type : Literal["full_text", "series_id"]
+        Defines which type of search to preform. One of the following strings: 'full_text', 'series_id'.
+    api_key : str | None, optional
+        FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
+    return_format : Literal["json", "pandas", "polars", "polars_lazy", "arrow"] | ReturnFormat, optional
+        If 'json', yield each series as a dictionary. If 'pandas', 'polars', 'polars_lazy' or 'arrow', yield a dataframe or table per page. Defaults to 'json'.
+    prefetch : int, optional
+        Number of pages to request ahead of the consumer. Defaults to 2.
+    **kwargs : dict, optional
+        Additional parameters to FRED API ``series/search`` endpoint. The `limit` parameter is used as the page size.
+
+    Yields
+    ------
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> for series in pf.iter_search_series("unemployment rate"):
+    ...     print(series["id"])
+
+    """
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(
+        SeriesSearchParameters,
+        search_text=search_text,
+        search_type=search_type,
+        **kwargs,
+    )
+    pages = _iter_pages(
+        endpoint="series/search", api_key=api_key, params=params, prefetch=prefetch
+    )
+    return _iter_records(pages, "seriess", return_format)
 
 
 def search_series_tags(
     search_text: str,
     api_key: ApiKeyType = None,
     return_format: ReturnFormats = "pandas",
+    columns: Optional[List[str]] = None,
+    categorical: bool = False,
     **kwargs: KwargsType,
 ) -> ReturnTypes:
     """Get the FRED tags for a series search. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/series_search_related_tags.html).
@@ -576,19 +664,23 @@ def search_series_tags(
         The text to match against.
     api_key : str | None, optional, optional
         FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
-    return_format : : Literal["json", "pandas", "polars"] | ReturnFormat, optional
+    return_format : : Literal["json", "pandas", "polars", "polars_lazy", "arrow"] | ReturnFormat, optional
         In what format to return the response. Must be either 'json' or 'pandas'. Defaults to 'pandas'.
+    columns : List[str] | None, optional
+        Fields to convert, e.g. ["name", "series_count"]. The other fields are never parsed. Ignored if `return_format` is 'json'. Defaults to None, i.e. every field.
+    categorical : bool, optional
+        If `True`, string columns where most values repeat, e.g. `group_id`, are pandas `category` or polars `Categorical` columns. Arrow tables are always dictionary encoded. Ignored if `return_format` is 'json'. Defaults to False.
     **kwargs : dict, optional
         Additional parameters to FRED API ``series/observation`` endpoint. Refer to the FRED documentation for a list of all possible parameters.
 
     Returns
     -------
-    dict | pd.DataFrame | pl.DataFrame
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table
 
     """
     return_format = ReturnFormat(return_format)
 
-    params = _convert_pydantic_model_to_dict(SeriesSearchParameters(**kwargs))
+    params = _validated_dict(SeriesSearchParameters, **kwargs)
     fparams = frozenset(
         {
             "series_search_text": search_text,
@@ -602,12 +694,9 @@ def search_series_tags(
         params=fparams,
     )
 
-    if return_format == ReturnFormat.pandas:
-        return _convert_to_pandas(response["tags"])
-    elif return_format == ReturnFormat.polars:
-        return _convert_to_polars(response["tags"])
-
-    return response
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["tags"], return_format, columns, categorical)
 
 
 def search_series_related_tags(
@@ -615,6 +704,8 @@ def search_series_related_tags(
     tag_names: str,
     api_key: ApiKeyType = None,
     return_format: ReturnFormats = "pandas",
+    columns: Optional[List[str]] = None,
+    categorical: bool = False,
     **kwargs,
 ) -> ReturnTypes:
     """Get the related FRED tags for one or more FRED tags matching a series search. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/series_search_related_tags.html).
@@ -627,19 +718,23 @@ def search_series_related_tags(
         A semicolon delimited list of tag names that series match all of.
     api_key : str | None, optional
         FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
-    return_format : : Literal["json", "pandas", "polars"] | ReturnFormat, optional
+    return_format : : Literal["json", "pandas", "polars", "polars_lazy", "arrow"] | ReturnFormat, optional
         In what format to return the response. Must be either 'json' or 'pandas'. Defaults to 'pandas'.
+    columns : List[str] | None, optional
+        Fields to convert, e.g. ["name", "series_count"]. The other fields are never parsed. Ignored if `return_format` is 'json'. Defaults to None, i.e. every field.
+    categorical : bool, optional
+        If `True`, string columns where most values repeat, e.g. `group_id`, are pandas `category` or polars `Categorical` columns. Arrow tables are always dictionary encoded. Ignored if `return_format` is 'json'. Defaults to False.
     **kwargs : dict, optional
         Additional parameters to FRED API ``series/observation`` endpoint. Refer to the FRED documentation for a list of all possible parameters.
 
     Returns
     -------
-    dict | pd.DataFrame | pl.DataFrame
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table
 
     """
     return_format = ReturnFormat(return_format)
 
-    params = _convert_pydantic_model_to_dict(SeriesSearchParameters(**kwargs))
+    params = _validated_dict(SeriesSearchParameters, **kwargs)
     fparams = frozenset(
         {
             "series_search_text": search_text,
@@ -655,7 +750,10 @@ def search_series_related_tags(
     )
 
     if return_format == ReturnFormat.pandas:
-        return pd.DataFrame.from_dict(response["tags"])
-    elif return_format == ReturnFormat.polars:
-        return _convert_to_polars(response["tags"])
+        import pandas as pd
+
+        df = pd.DataFrame(response["tags"], columns=columns)
+        return _categorize(df) if categorical else df
+    elif return_format != ReturnFormat.json:
+        return _convert_records(response["tags"], return_format, columns, categorical)
     return response
@@ -6,18 +6,20 @@ SeriesCollection is meant to make handling multiple series easier. Often users o
 
 import time
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Sequence, Union
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Union
 
+import numpy as np
 import pandas as pd
 
 from pyfredapi._base import _get_api_key
 from pyfredapi.series import SeriesInfo, get_series, get_series_info
 
-try:
-    import plotly.express as px
+if TYPE_CHECKING:
     from plotly.graph_objects import Figure
-except ImportError:
-    MISSING_PLOTLY = True
+
+# plotly is imported when the first plot is created.
+MISSING_PLOTLY = find_spec("plotly") is None
 
 date_cols = ["date", "realtime_start", "realtime_end"]
 
@@ -62,6 +64,8 @@ class SeriesData:
                 "Plots can only be created when data is returned as a pandas dataframe."
             )
 
+        import plotly.express as px
+
         value_col = [c for c in self.df.columns.tolist() if c not in date_cols]
 
         def format_title(title, start_date: str, end_date: str, subtitle=None):
@@ -120,6 +124,14 @@ def _rename_series(
     return series_name
 
 
+def _repeat(values: pd.Series, rows: np.ndarray, categorical: bool) -> Any:
+    """Take the values of the series of each row, as a categorical if the values are strings."""
+    if categorical and values.dtype == "object":
+        codes, categories = pd.factorize(values)
+        return pd.Categorical.from_codes(codes[rows], categories=categories)
+    return values.to_numpy()[rows]
+
+
 class SeriesCollection:
     """A collection of `pyfredapi.SeriesData` objects.
 
@@ -133,7 +145,7 @@ class SeriesCollection:
         api_key: Union[str, None] = None,
         rename: Union[Dict[str, str], Callable[[str], str], None] = None,
         drop_realtime: bool = True,
-        sleep: float = 0.1,
+        sleep: float = 0.0,
         **kwargs,
     ):
         """Create an instance of SeriesCollection.
@@ -149,7 +161,7 @@ class SeriesCollection:
         rename : Union[Dict[str, str], Callable[[str], str], None], optional
             Label to give series. Defaults to series ID.
         sleep : float, optional
-            Time to sleep between requests. Defaults to 0.1.
+            Time to sleep between requests. Defaults to 0. Requests are throttled by the rate limiter returned by `pyfredapi.get_rate_limiter`.
         **kwargs : dict, optional
             Additional parameters to FRED API `series/` endpoint.
             Refer to the FRED documentation for a list of all possible parameters.
@@ -164,6 +176,7 @@ class SeriesCollection:
 
         if isinstance(series_id, str):
             series_id = [series_id]
+        kwargs.setdefault("columns", self._columns)
 
         for sid in series_id:
             time.sleep(sleep)
@@ -179,10 +192,6 @@ class SeriesCollection:
 
             series_data = SeriesData(info=series_info, df=series_df)
 
-            if drop_realtime:
-                series_data.df.drop(
-                    ["realtime_start", "realtime_end"], inplace=True, axis=1
-                )
             if rename:
                 series_name = _rename_series(series_data, rename)
             else:
@@ -192,6 +201,11 @@ class SeriesCollection:
             self._data.append(series_data)
             setattr(self, sid, series_data)
 
+    @property
+    def _columns(self) -> Optional[List[str]]:
+        # The realtime columns are never parsed when they are dropped.
+        return ["date", "value"] if self.drop_realtime else None
+
     def __getitem__(self, key):
         return [s for s in self._data if s.info.id == key].pop()
 
@@ -250,6 +264,7 @@ class SeriesCollection:
         """
         if isinstance(series_id, str):
             series_id = [series_id]
+        kwargs.setdefault("columns", self._columns)
 
         for sid in series_id:
             time.sleep(self.sleep)
@@ -265,10 +280,6 @@ class SeriesCollection:
 
             series_data = SeriesData(info=info, df=df)
 
-            if self.drop_realtime:
-                series_data.df.drop(
-                    ["realtime_start", "realtime_end"], inplace=True, axis=1
-                )
             if self.rename:
                 series_name = _rename_series(series_data, self.rename)
             else:
@@ -301,7 +312,10 @@ class SeriesCollection:
             print(f"Removed series {sid}")
 
     def merge_long(
-        self, col_name: Union[str, None] = None, include_info_attrs: bool = False
+        self,
+        col_name: Union[str, None] = None,
+        include_info_attrs: bool = False,
+        categorical: bool = True,
     ) -> pd.DataFrame:
         """Merge the series in the collection into a long pandas dataframe.
 
@@ -312,6 +326,9 @@ class SeriesCollection:
         include_info_attrs : bool, optional
             If `True`, all the attributes from the `SeriesInfo` will be included
             on the dataframe.
+        categorical : bool, optional
+            If `True`, the series label and the string attributes from the `SeriesInfo`, which
+            repeat on every row of a series, are `category` columns. Defaults to True.
 
         Returns
         -------
@@ -323,30 +340,31 @@ class SeriesCollection:
             col_name = "series"
 
         long_df_prep = []
+        series_names = []
         for series in self._data:
             series_name = [
                 c for c in series.df.columns.tolist() if c not in date_cols
             ].pop()
-            long_df = series.df.copy()
-            long_df = long_df.rename(columns={series_name: "value"})
-            long_df[col_name] = series_name
-
-            if include_info_attrs:
-                # info = series.info.model_dump()
-                series_info = series.info.dict()
-                series_info_df = pd.DataFrame({k: [v] for k, v in series_info.items()})
-
-                # Add a constant column to both DataFrames for cross join
-                long_df["key"] = 1
-                series_info_df["key"] = 1
-
-                # Perform the cross join using pd.merge()
-                long_df = pd.merge(long_df, series_info_df, on="key")
-                long_df = long_df.drop("key", axis=1)
-
-            long_df_prep.append(long_df)
-
-        return pd.concat(long_df_prep, axis=0).reset_index(drop=True)
+            long_df_prep.append(series.df.rename(columns={series_name: "value"}))
+            series_names.append(series_name)
+
+        long_df = pd.concat(long_df_prep, axis=0).reset_index(drop=True)
+
+        # Position of the series of each row. The repeated columns are taken from one row per series.
+        rows = np.repeat(np.arange(len(long_df_prep)), [len(df) for df in long_df_prep])
+        long_df[col_name] = _repeat(pd.Series(series_names), rows, categorical)
+
+        if include_info_attrs:
+            series_info_df = self.series_info_to_df()
+            for c in series_info_df.columns:
+                name = c
+                if c in long_df.columns:
+                    # Same suffixes as a merge of the dataframes.
+                    long_df = long_df.rename(columns={c: f"{c}_x"})
+                    name = f"{c}_y"
+                long_df[name] = _repeat(series_info_df[c], rows, categorical)
+
+        return long_df
 
     def merge_wide(self) -> pd.DataFrame:
         """Merge the series in the collection into a wide pandas dataframe. Only works if all the series in the collection share the same date index.
@@ -0,0 +1,195 @@
+"""The `session` module manages the pooled HTTP connections used to make requests to the FRED API.
+
+All the request functions in pyfredapi share a single keep-alive `requests.Session`, so consecutive
+requests to api.stlouisfed.org reuse open TCP+TLS connections instead of paying for a new handshake
+on every call. The size of the connection pool can be configured with `configure_session_pool`.
+
+The pool is thread-safe and fork-safe. A forked child process lazily creates its own session and
+never shares sockets with its parent.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import weakref
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 10
+FRED_API_ROOT = "https://api.stlouisfed.org"
+
+_pools: weakref.WeakSet = weakref.WeakSet()
+
+
+class SessionPool:
+    """A thread-safe and fork-safe pool of keep-alive HTTP connections."""
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        pool_block: bool = False,
+        api_root: Optional[str] = None,
+    ):
+        """Create an instance of SessionPool.
+
+        Parameters
+        ----------
+        pool_size : int, optional
+            Maximum number of connections to keep open per host. Defaults to 10.
+        pool_block : bool, optional
+            If `True`, requests will wait for a free connection when the pool is exhausted
+            instead of opening a throwaway connection. Defaults to False.
+        api_root : str | None, optional
+            Send the requests for https://api.stlouisfed.org to this root url instead, e.g. the url
+            of a `pyfredapi.testing.MockFredServer`. Defaults to None.
+
+        """
+        if pool_size < 1:
+            raise ValueError(
+                f"`pool_size` must be a positive integer, not {pool_size}."
+            )
+
+        self.pool_size = pool_size
+        self.pool_block = pool_block
+        self.api_root = api_root.rstrip("/") if api_root is not None else None
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._pid: Optional[int] = None
+        _pools.add(self)
+
+    def __repr__(self) -> str:
+        api_root = "" if self.api_root is None else f", api_root={self.api_root!r}"
+        return f"SessionPool(pool_size={self.pool_size}, pool_block={self.pool_block}{api_root})"
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the session owned by the current process, creating it if needed."""
+        pid = os.getpid()
+        session = self._session
+        if session is None or self._pid != pid:
+            with self._lock:
+                if self._session is None or self._pid != pid:
+                    self._session = self._create_session()
+                    self._pid = pid
+                session = self._session
+        return session
+
+    def _create_session(self) -> requests.Session:
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            pool_block=self.pool_block,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def get(
+        self, url: str, params: Optional[Dict[str, Any]] = None, timeout: float = 30
+    ) -> requests.Response:
+        """Make a get request using a pooled connection.
+
+        Parameters
+        ----------
+        url : str
+            Url to request.
+        params : Dict[str, Any] | None, optional
+            Dictionary of query parameters. Defaults to None.
+        timeout : float, optional
+            Seconds to wait for the server to respond. Defaults to 30.
+
+        Returns
+        -------
+        requests.Response
+
+        """
+        if self.api_root is not None:
+            url = _reroot(url, self.api_root)
+        return self.session.get(url, params=params, timeout=timeout)
+
+    def close(self) -> None:
+        """Close all the connections held by the pool."""
+        with self._lock:
+            if self._session is not None and self._pid == os.getpid():
+                self._session.close()
+            self._session = None
+            self._pid = None
+
+    def _reset_after_fork(self) -> None:
+        # The inherited session shares its sockets with the parent process, so it
+        # is dropped without being closed. The lock may have been held by another
+        # thread at the time of the fork, so it is replaced as well.
+        self._lock = threading.Lock()
+        self._session = None
+        self._pid = None
+
+
+def _reroot(url: str, api_root: str) -> str:
+    if url.startswith(FRED_API_ROOT):
+        return api_root + url[len(FRED_API_ROOT) :]
+    return url
+
+
+def _reset_pools_after_fork() -> None:
+    for pool in list(_pools):
+        pool._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
+_session_pool = SessionPool()
+
+
+def get_session_pool() -> SessionPool:
+    """Get the session pool used by the pyfredapi request functions.
+
+    Returns
+    -------
+    SessionPool
+
+    """
+    return _session_pool
+
+
+def configure_session_pool(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    pool_block: bool = False,
+    api_root: Optional[str] = None,
+) -> SessionPool:
+    """Replace the session pool used by the pyfredapi request functions.
+
+    Connections held by the previous pool are closed.
+
+    Parameters
+    ----------
+    pool_size : int, optional
+        Maximum number of connections to keep open per host. Defaults to 10.
+    pool_block : bool, optional
+        If `True`, requests will wait for a free connection when the pool is exhausted. Defaults to False.
+    api_root : str | None, optional
+        Send the requests for https://api.stlouisfed.org to this root url instead. Defaults to None.
+
+    Returns
+    -------
+    SessionPool
+        The new session pool.
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> pf.configure_session_pool(pool_size=32)
+
+    """
+    global _session_pool
+
+    previous, _session_pool = _session_pool, SessionPool(
+        pool_size=pool_size, pool_block=pool_block, api_root=api_root
+    )
+    previous.close()
+    return _session_pool
@@ -3,13 +3,27 @@
 The FRED database contains many sources of data. The sources module provides functions to query the FRED database for information about the available sources.
 """
 
-from typing import Literal, Optional
+from typing import Iterator, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, PositiveInt
 
 from ._base import _get_request
-from .utils import _convert_pydantic_model_to_frozenset
-from .utils._common_type_hints import ApiKeyType, JsonType, KwargsType
+from ._pagination import (
+    DEFAULT_PREFETCH,
+    _get_all_pages,
+    _iter_pages,
+    _iter_records,
+)
+from .utils import _validated_params
+from .utils._common_type_hints import (
+    ApiKeyType,
+    JsonType,
+    KwargsType,
+    ReturnFormats,
+    ReturnTypes,
+)
+from .utils._convert_to_df import _convert_records
+from .utils.enums import ReturnFormat
 
 
 class SourceApiParameters(BaseModel):
@@ -28,27 +42,84 @@ class SourceApiParameters(BaseModel):
     sort_order: Optional[Literal["asc", "desc"]] = None
 
 
-def get_sources(api_key: ApiKeyType = None, **kwargs: KwargsType) -> JsonType:
+def get_sources(
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    paginate: bool = False,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
     """Get all sources of economic data. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/sources.html).
 
     Parameters
     ----------
     api_key : str | None, optional
         FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
+    return_format : Literal["json", "pandas", "polars", "polars_lazy", "arrow"] | ReturnFormat, optional
+        In what format to return the response. Defaults to 'json'.
+    paginate : bool, optional
+        If `True`, request all the pages of the response concurrently and merge them. The `limit` parameter is used as the page size. Defaults to False.
     **kwargs : dict, optional
         Additional parameters to FRED API ``sources/`` endpoint. Refer to the FRED documentation for a list of all possible parameters.
 
     Returns
     -------
-    Dictionary representing the Json response
+    Dictionary representing the Json response, or a dataframe of the sources.
 
     """
-    params = _convert_pydantic_model_to_frozenset(SourceApiParameters(**kwargs))
-    return _get_request(
-        endpoint="sources",
-        api_key=api_key,
-        params=params,
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(SourceApiParameters, **kwargs)
+    if paginate:
+        response = _get_all_pages(
+            endpoint="sources", records_key="sources", api_key=api_key, params=params
+        )
+    else:
+        response = _get_request(endpoint="sources", api_key=api_key, params=params)
+
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["sources"], return_format)
+
+
+def iter_sources(
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    prefetch: int = DEFAULT_PREFETCH,
+    **kwargs: KwargsType,
+) -> Iterator[ReturnTypes]:
+    """Lazily iterate over all sources of economic data. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/sources.html).
+
+    Pages are requested as they are consumed, and the next `prefetch` pages are requested in the background.
+
+    Parameters
+    ----------
+    api_key : str | None, optional
+        FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
+    return_format : Literal["json", "pandas", "polars", "polars_lazy", "arrow"] | ReturnFormat, optional
+        If 'json', yield each source as a dictionary. If 'pandas', 'polars', 'polars_lazy' or 'arrow', yield a dataframe or table per page. Defaults to 'json'.
+    prefetch : int, optional
+        Number of pages to request ahead of the consumer. Defaults to 2.
+    **kwargs : dict, optional
+        Additional parameters to FRED API ``sources`` endpoint. The `limit` parameter is used as the page size.
+
+    Yields
+    ------
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> for source in pf.iter_sources():
+    ...     print(source["name"])
+
+    """
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(SourceApiParameters, **kwargs)
+    pages = _iter_pages(
+        endpoint="sources", api_key=api_key, params=params, prefetch=prefetch
     )
+    return _iter_records(pages, "sources", return_format)
 
 
 def get_source(
@@ -70,9 +141,7 @@ def get_source(
     Dictionary representing the Json response
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        SourceApiParameters(source_id=source_id, **kwargs)
-    )
+    params = _validated_params(SourceApiParameters, source_id=source_id, **kwargs)
     return _get_request(
         endpoint="source",
         api_key=api_key,
@@ -100,9 +169,7 @@ def get_source_release(
     Dictionary representing the Json response
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        SourceApiParameters(source_id=source_id, **kwargs)
-    )
+    params = _validated_params(SourceApiParameters, source_id=source_id, **kwargs)
     return _get_request(
         endpoint="source/releases",
         api_key=api_key,
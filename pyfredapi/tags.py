@@ -9,13 +9,27 @@ FRED tags are assigned to series. Tags define a characteristic about the series.
 Categories are organized in a hierarchical structure where parent categories contain children categories. All categories are children of the root category (category_id = 0).
 """
 
-from typing import Literal, Optional
+from typing import Iterator, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, PositiveInt
 
 from ._base import _get_request
-from .utils import _convert_pydantic_model_to_dict, _convert_pydantic_model_to_frozenset
-from .utils._common_type_hints import ApiKeyType, JsonType, KwargsType
+from ._pagination import (
+    DEFAULT_PREFETCH,
+    _get_all_pages,
+    _iter_pages,
+    _iter_records,
+)
+from .utils import _validated_dict, _validated_params
+from .utils._common_type_hints import (
+    ApiKeyType,
+    JsonType,
+    KwargsType,
+    ReturnFormats,
+    ReturnTypes,
+)
+from .utils._convert_to_df import _convert_records
+from .utils.enums import ReturnFormat
 
 
 class TagsApiParameters(BaseModel):
@@ -39,28 +53,91 @@ class TagsApiParameters(BaseModel):
     exclude_tag_names: Optional[str] = None
 
 
-def get_tags(api_key: ApiKeyType = None, **kwargs: KwargsType) -> JsonType:
+def get_tags(
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    paginate: bool = False,
+    columns: Optional[List[str]] = None,
+    categorical: bool = False,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
     """Get FRED tags.[Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/tags.html).
 
     Parameters
     ----------
     api_key : str | None, optional
         FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
+    return_format : Literal["json", "pandas", "polars", "polars_lazy", "arrow"] | ReturnFormat, optional
+        In what format to return the response. Defaults to 'json'.
+    paginate : bool, optional
+        If `True`, request all the pages of the response concurrently and merge them. The `limit` parameter is used as the page size. Defaults to False.
+    columns : List[str] | None, optional
+        Fields to convert, e.g. ["name", "series_count"]. The other fields are never parsed. Ignored if `return_format` is 'json'. Defaults to None, i.e. every field.
+    categorical : bool, optional
+        If `True`, string columns where most values repeat, e.g. `group_id`, are pandas `category` or polars `Categorical` columns. Arrow tables are always dictionary encoded. Ignored if `return_format` is 'json'. Defaults to False.
     **kwargs : dict, optional
         Additional parameters to FRED API ``tags/`` endpoint. Refer to the FRED documentation for a list of all possible parameters.
 
     Returns
     -------
-    dict
-        A dictionary representing the json response.
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table
+        A dictionary representing the json response, or a dataframe of the tags.
 
     """
-    params = _convert_pydantic_model_to_frozenset(TagsApiParameters(**kwargs))
-    return _get_request(
-        endpoint="tags",
-        api_key=api_key,
-        params=params,
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(TagsApiParameters, **kwargs)
+    if paginate:
+        response = _get_all_pages(
+            endpoint="tags", records_key="tags", api_key=api_key, params=params
+        )
+    else:
+        response = _get_request(endpoint="tags", api_key=api_key, params=params)
+
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["tags"], return_format, columns, categorical)
+
+
+def iter_tags(
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    prefetch: int = DEFAULT_PREFETCH,
+    **kwargs: KwargsType,
+) -> Iterator[ReturnTypes]:
+    """Lazily iterate over FRED tags. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/tags.html).
+
+    Pages are requested as they are consumed, and the next `prefetch` pages are requested in the background.
+
+    Parameters
+    ----------
+    api_key : str | None, optional
+        FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
+    return_format : Literal["json", "pandas", "polars", "polars_lazy", "arrow"] | ReturnFormat, optional
+        If 'json', yield each tag as a dictionary. If 'pandas', 'polars', 'polars_lazy' or 'arrow', yield a dataframe or table per page. Defaults to 'json'.
+    prefetch : int, optional
+        Number of pages to request ahead of the consumer. Defaults to 2.
+    **kwargs : dict, optional
+        Additional parameters to FRED API ``tags`` endpoint. The `limit` parameter is used as the page size.
+
+    Yields
+    ------
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> for tag in pf.iter_tags(tag_group_id="geo"):
+    ...     print(tag["name"])
+
+    """
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_params(TagsApiParameters, **kwargs)
+    pages = _iter_pages(
+        endpoint="tags", api_key=api_key, params=params, prefetch=prefetch
     )
+    return _iter_records(pages, "tags", return_format)
 
 
 def get_related_tags(
@@ -83,9 +160,7 @@ def get_related_tags(
         A dictionary representing the json response.
 
     """
-    params = _convert_pydantic_model_to_frozenset(
-        TagsApiParameters(tag_names=tag_names, **kwargs)
-    )
+    params = _validated_params(TagsApiParameters, tag_names=tag_names, **kwargs)
     return _get_request(
         endpoint="related_tags",
         api_key=api_key,
@@ -94,8 +169,12 @@ def get_related_tags(
 
 
 def get_series_matching_tags(
-    tag_names: str, api_key: ApiKeyType = None, **kwargs: KwargsType
-) -> JsonType:
+    tag_names: str,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    paginate: bool = False,
+    **kwargs: KwargsType,
+) -> ReturnTypes:
     """Get the series matching all tags in the tag_names parameter. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/tags_series.html).
 
     Parameters
@@ -104,25 +183,88 @@ def get_series_matching_tags(
         A semicolon delimited list of tag names that series match all of.
     api_key : str | None, optional
         FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
+    return_format : Literal["json", "pandas", "polars", "polars_lazy", "arrow"] | ReturnFormat, optional
+        In what format to return the response. Defaults to 'json'.
+    paginate : bool, optional
+        If `True`, request all the pages of the response concurrently and merge them. The `limit` parameter is used as the page size. Defaults to False.
     **kwargs : dict, optional
         Additional parameters to FRED API ``tags/series`` endpoint. Refer to the FRED documentation for a list of all possible parameters.
 
     Returns
     -------
-    dict
-        A dictionary representing the json response.
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table
+        A dictionary representing the json response, or a dataframe of the series.
 
     """
-    params = _convert_pydantic_model_to_dict(TagsApiParameters(**kwargs))
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_dict(TagsApiParameters, **kwargs)
     fparams = frozenset(
         {
             "tag_names": tag_names,
             **params,
         }.items()
     )
+    if paginate:
+        response = _get_all_pages(
+            endpoint="tags/series",
+            records_key="seriess",
+            api_key=api_key,
+            params=fparams,
+        )
+    else:
+        response = _get_request(endpoint="tags/series", api_key=api_key, params=fparams)
 
-    return _get_request(
-        endpoint="tags/series",
-        api_key=api_key,
-        params=fparams,
+    if return_format == ReturnFormat.json:
+        return response
+    return _convert_records(response["seriess"], return_format)
+
+
+def iter_series_matching_tags(
+    tag_names: str,
+    api_key: ApiKeyType = None,
+    return_format: ReturnFormats = "json",
+    prefetch: int = DEFAULT_PREFETCH,
+    **kwargs: KwargsType,
+) -> Iterator[ReturnTypes]:
+    """Lazily iterate over the series matching all tags in the tag_names parameter. [Endpoint documentation](https://fred.stlouisfed.org/docs/api/fred/tags_series.html).
+
+    Pages are requested as they are consumed, and the next `prefetch` pages are requested in the background.
+
+    Parameters
+    ----------
+    tag_names : str
+        A semicolon delimited list of tag names that series match all of.
+    api_key : str | None, optional
+        FRED API key. Defaults to None. If None, will search for FRED_API_KEY in environment variables.
+    return_format : Literal["json", "pandas", "polars", "polars_lazy", "arrow"] | ReturnFormat, optional
+        If 'json', yield each series as a dictionary. If 'pandas', 'polars', 'polars_lazy' or 'arrow', yield a dataframe or table per page. Defaults to 'json'.
+    prefetch : int, optional
+        Number of pages to request ahead of the consumer. Defaults to 2.
+    **kwargs : dict, optional
+        Additional parameters to FRED API ``tags/series`` endpoint. The `limit` parameter is used as the page size.
+
+    Yields
+    ------
+    dict | pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table
+
+    Examples
+    --------
+    >>> import pyfredapi as pf
+    >>> for df in pf.iter_series_matching_tags(tag_names="usa;monthly", return_format="pandas"):
+    ...     print(len(df))
+
+    """
+    return_format = ReturnFormat(return_format)
+
+    params = _validated_dict(TagsApiParameters, **kwargs)
+    fparams = frozenset(
+        {
+            "tag_names": tag_names,
+            **params,
+        }.items()
+    )
+    pages = _iter_pages(
+        endpoint="tags/series", api_key=api_key, params=fparams, prefetch=prefetch
     )
+    return _iter_records(pages, "seriess", return_format)
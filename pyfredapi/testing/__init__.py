@@ -0,0 +1,28 @@
+"""pyfredapi.testing - an offline imitation of the FRED API
+=========================================================.
+
+`pyfredapi.testing` runs a local HTTP server that replays the VCR cassettes of the test suite and
+generates large observation sets, many-page listings and big shape files. It can inject latency,
+429 Too Many Requests and 5xx errors, so the throughput, retry and concurrency features of
+pyfredapi can be load tested without a network or a FRED API key.
+
+Replaying cassettes requires the `pyyaml` package, which can be installed with
+`pip install 'pyfredapi[testing]'`.
+
+>>> from pyfredapi.testing import Faults, MockFredServer
+>>> with MockFredServer("tests/vhs", faults=Faults(latency=0.05, rate_limit_rate=0.1)) as server:
+...     client = server.client()
+...     gdp = client.get_series("GDP")
+
+The server can also be run from the command line with `python -m pyfredapi.testing`.
+"""
+
+from .server import Faults, MockFredServer, MockResponse, ServedRequest, load_cassettes
+
+__all__ = [
+    "Faults",
+    "MockFredServer",
+    "MockResponse",
+    "ServedRequest",
+    "load_cassettes",
+]
@@ -0,0 +1,75 @@
+"""Run a `MockFredServer` from the command line.
+
+>>> python -m pyfredapi.testing --cassettes tests/vhs --latency 0.05 --rate-limit-rate 0.1
+"""
+
+import argparse
+import time
+from typing import List, Optional
+
+from .server import Faults, MockFredServer
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Parse the command line arguments and serve requests until interrupted."""
+    parser = argparse.ArgumentParser(
+        prog="python -m pyfredapi.testing",
+        description="Run a local HTTP server that imitates the FRED API.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--cassettes", help="Directory of VCR cassettes to replay.")
+    parser.add_argument(
+        "--no-synthetic",
+        dest="synthetic",
+        action="store_false",
+        help="Do not generate the responses that are not in the cassettes.",
+    )
+    parser.add_argument("--observations", type=int, default=1000)
+    parser.add_argument("--listing-size", type=int, default=2500)
+    parser.add_argument("--shape-features", type=int, default=100)
+    parser.add_argument("--geo-regions", type=int, default=50)
+    parser.add_argument("--geo-dates", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float)
+    parser.add_argument("--max-requests-per-second", type=float)
+    parser.add_argument("--server-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    server = MockFredServer(
+        args.cassettes,
+        faults=Faults(
+            latency=args.latency,
+            jitter=args.jitter,
+            rate_limit_rate=args.rate_limit_rate,
+            retry_after=args.retry_after,
+            max_requests_per_second=args.max_requests_per_second,
+            server_error_rate=args.server_error_rate,
+            seed=args.seed,
+        ),
+        synthetic=args.synthetic,
+        observations=args.observations,
+        listing_size=args.listing_size,
+        shape_features=args.shape_features,
+        geo_regions=args.geo_regions,
+        geo_dates=args.geo_dates,
+        host=args.host,
+        port=args.port,
+    )
+    with server:
+        print(
+            f"Serving the FRED API on {server.url}. "
+            f"Use it with `pf.configure_session_pool(api_root={server.url!r})`."
+        )
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,500 @@
+"""The `testing.server` module runs a local HTTP server that imitates the FRED API.
+
+`MockFredServer` answers requests with the responses recorded in the VCR cassettes of the test
+suite, and generates the responses of the observation, listing, regional data and shape file
+endpoints that are not recorded with `pyfredapi.testing.synthetic`. `Faults` injects latency, 429
+Too Many Requests and 5xx errors, so the throughput, retry and concurrency features of pyfredapi
+can be load tested without a network or a FRED API key.
+
+The session pools of pyfredapi send their requests to the server when they are created with its
+url as `api_root`. `MockFredServer.client` returns a `FredClient` that does so.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from pyfredapi.client import FredClient
+from pyfredapi.session import SessionPool
+
+from . import synthetic
+
+MISSING_YAML = find_spec("yaml") is None
+
+DEFAULT_API_KEY = "0" * 32
+_BODY_CACHE_SIZE = 64
+
+ResponseKey = Tuple[str, frozenset]
+
+
+@dataclass(frozen=True)
+class MockResponse:
+    """A response of the mock server."""
+
+    status_code: int
+    body: bytes
+    content_type: str = "application/json; charset=UTF-8"
+    headers: Tuple[Tuple[str, str], ...] = ()
+
+
+@dataclass(frozen=True)
+class ServedRequest:
+    """A request answered by the mock server."""
+
+    path: str
+    params: Dict[str, str]
+    status_code: int
+    started: float
+    duration: float
+
+
+@dataclass
+class Faults:
+    """The faults injected by the mock server.
+
+    Every request waits for `latency` seconds plus a random delay of up to `jitter` seconds. Then a
+    random share of the requests, set by `rate_limit_rate` and `server_error_rate`, fails with a
+    429 or a 5xx error. Requests above `max_requests_per_second` also fail with a 429, like the
+    rate limit of the FRED API.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: Optional[float] = None
+    max_requests_per_second: Optional[float] = None
+    server_error_rate: float = 0.0
+    server_error_statuses: Tuple[int, ...] = (500, 502, 503, 504)
+    seed: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.latency < 0 or self.jitter < 0:
+            raise ValueError("`latency` and `jitter` must not be negative.")
+        for name in ("rate_limit_rate", "server_error_rate"):
+            if not 0 <= getattr(self, name) <= 1:
+                raise ValueError(f"`{name}` must be between 0 and 1.")
+        if self.rate_limit_rate + self.server_error_rate > 1:
+            raise ValueError(
+                "The sum of `rate_limit_rate` and `server_error_rate` must not exceed 1."
+            )
+        if (
+            self.max_requests_per_second is not None
+            and self.max_requests_per_second <= 0
+        ):
+            raise ValueError("`max_requests_per_second` must be positive.")
+
+
+def _json_response(status_code: int, data: Any) -> MockResponse:
+    return MockResponse(status_code, json.dumps(data, separators=(",", ":")).encode())
+
+
+def _error_response(
+    status_code: int, message: str, headers: Tuple[Tuple[str, str], ...] = ()
+) -> MockResponse:
+    body = {"error_code": status_code, "error_message": message}
+    return MockResponse(
+        status_code,
+        json.dumps(body).encode(),
+        headers=headers,
+    )
+
+
+def _gateway_error(status_code: int) -> MockResponse:
+    # Gateways in front of FRED answer with HTML pages, not with Json.
+    phrase = f"{status_code} {HTTPStatus(status_code).phrase}"
+    body = f"<html><head><title>{phrase}</title></head><body><h1>{phrase}</h1></body></html>"
+    return MockResponse(status_code, body.encode(), "text/html")
+
+
+def _normalize_path(path: str) -> str:
+    # The GeoFRED base url ends with a slash, so its request paths contain "//".
+    return re.sub("/+", "/", path)
+
+
+def _response_key(path: str, params: Dict[str, str]) -> ResponseKey:
+    return _normalize_path(path), frozenset(params.items())
+
+
+def _split_url(url: str) -> Tuple[str, Dict[str, str], bool]:
+    """Split a url into its path, its query parameters without the api_key, and if it had one."""
+    parts = urlsplit(url)
+    params = dict(parse_qsl(parts.query, keep_blank_values=True))
+    has_api_key = params.pop("api_key", None) is not None
+    return parts.path, params, has_api_key
+
+
+def load_cassettes(directory: Union[str, Path]) -> Dict[ResponseKey, MockResponse]:
+    """Load the responses recorded in the VCR cassettes of a directory and its subdirectories.
+
+    The responses are keyed on the path and the query parameters of their request, without the
+    api_key. When several cassettes recorded the same request, the first one found is used.
+
+    Parameters
+    ----------
+    directory : str | Path
+        Directory of the cassettes, e.g. "tests/vhs".
+
+    Returns
+    -------
+    Dict[Tuple[str, frozenset], MockResponse]
+
+    """
+    if MISSING_YAML:
+        raise ImportError(
+            "Unable to import yaml. Ensure you have the pyyaml package installed. You can install pyfredapi with pyyaml with `pip install 'pyfredapi[testing]'`"
+        )
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    responses: Dict[ResponseKey, MockResponse] = {}
+    for path in sorted(Path(directory).rglob("*.yaml")):
+        text = path.read_text(encoding="utf-8")
+        cassette = yaml.load(text, Loader=loader)  # noqa: S506
+        for interaction in (cassette or {}).get("interactions", []):
+            request, response = interaction["request"], interaction["response"]
+            if request["method"] != "GET":
+                continue
+            url_path, params, _ = _split_url(request["uri"])
+            body = response["body"]["string"]
+            if isinstance(body, str):
+                body = body.encode()
+            content_type = response.get("headers", {}).get("Content-Type", [])
+            responses.setdefault(
+                _response_key(url_path, params),
+                MockResponse(
+                    response["status"]["code"],
+                    body,
+                    *content_type[:1],
+                ),
+            )
+    return responses
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], mock: "MockFredServer"):
+        super().__init__(address, _Handler)
+        self.mock = mock
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # The headers and the body are written separately, so Nagle's algorithm would delay the body.
+    disable_nagle_algorithm = True
+    server: _HTTPServer
+
+    def do_GET(self) -> None:  # noqa: N802
+        response = self.server.mock._handle(self.path)
+        self.send_response(response.status_code)
+        self.send_header("Content-Type", response.content_type)
+        self.send_header("Content-Length", str(len(response.body)))
+        for name, value in response.headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(response.body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class MockFredServer:
+    """A local HTTP server that imitates the FRED API.
+
+    Examples
+    --------
+    >>> from pyfredapi.testing import Faults, MockFredServer
+    >>> with MockFredServer(observations=1_000_000, faults=Faults(latency=0.05)) as server:
+    ...     client = server.client()
+    ...     df = client.get_series("GDP")
+
+    """
+
+    def __init__(
+        self,
+        cassettes: Union[str, Path, None] = None,
+        *,
+        faults: Optional[Faults] = None,
+        synthetic: bool = True,
+        observations: int = 1000,
+        listing_size: int = 2500,
+        shape_features: int = 100,
+        geo_regions: int = 50,
+        geo_dates: int = 10,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Create an instance of MockFredServer.
+
+        Parameters
+        ----------
+        cassettes : str | Path | None, optional
+            Directory of VCR cassettes to replay, e.g. "tests/vhs". Defaults to None.
+        faults : Faults | None, optional
+            Faults to inject. Defaults to None, no faults.
+        synthetic : bool, optional
+            If `True`, generate the responses of the observation, listing, series, regional data
+            and shape file endpoints that are not found in the cassettes. Defaults to True.
+        observations : int, optional
+            Number of observations of the generated series. Defaults to 1000.
+        listing_size : int, optional
+            Number of records of the generated listings. Defaults to 2500.
+        shape_features : int, optional
+            Number of features of the generated shape files. Defaults to 100.
+        geo_regions : int, optional
+            Number of regions of each cross section of the generated regional series. Defaults to 50.
+        geo_dates : int, optional
+            Number of cross sections of the generated regional series. Defaults to 10.
+        host : str, optional
+            Address to listen on. Defaults to "127.0.0.1".
+        port : int, optional
+            Port to listen on. Defaults to 0, a free port.
+
+        """
+        self.faults = faults or Faults()
+        self.synthetic = synthetic
+        self.observations = observations
+        self.listing_size = listing_size
+        self.shape_features = shape_features
+        self.geo_regions = geo_regions
+        self.geo_dates = geo_dates
+        self.host = host
+        self.port = port
+        self._cassettes = load_cassettes(cassettes) if cassettes is not None else {}
+        self._bodies: "OrderedDict[ResponseKey, MockResponse]" = OrderedDict()
+        self._random = random.Random(self.faults.seed)  # noqa: S311
+        self._recent: Deque[float] = deque()
+        self._lock = threading.Lock()
+        self._requests: List[ServedRequest] = []
+        self._in_flight = 0
+        self.max_in_flight = 0
+        self._httpd: Optional[_HTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"MockFredServer(url={self.url!r})" if self._httpd else "MockFredServer()"
+        )
+
+    @property
+    def url(self) -> str:
+        """The root url of the server, to be used as the `api_root` of a session pool."""
+        if self._httpd is None:
+            raise RuntimeError("The server is not running.")
+        return f"http://{self.host}:{self._httpd.server_address[1]}"
+
+    @property
+    def requests(self) -> List[ServedRequest]:
+        """The requests answered by the server, in the order they were answered."""
+        with self._lock:
+            return list(self._requests)
+
+    def reset(self) -> None:
+        """Forget the answered requests and the maximum number of requests in flight."""
+        with self._lock:
+            self._requests.clear()
+            self._recent.clear()
+            self.max_in_flight = self._in_flight
+
+    def start(self) -> "MockFredServer":
+        """Start serving requests on a background thread."""
+        if self._httpd is None:
+            self._httpd = _HTTPServer((self.host, self.port), self)
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever,
+                kwargs={"poll_interval": 0.05},
+                name="MockFredServer",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        httpd, self._httpd = self._httpd, None
+        if httpd is None:
+            return
+        if self._thread is not None:
+            httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        httpd.server_close()
+
+    def __enter__(self) -> "MockFredServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def session_pool(self, **kwargs: Any) -> SessionPool:
+        """Create a session pool that sends its requests to the server.
+
+        Parameters
+        ----------
+        **kwargs : dict, optional
+            Arguments of `SessionPool`, e.g. `pool_size`.
+
+        Returns
+        -------
+        SessionPool
+
+        """
+        return SessionPool(api_root=self.url, **kwargs)
+
+    def async_session_pool(self, **kwargs: Any) -> Any:
+        """Create an `AsyncSessionPool` that sends its requests to the server.
+
+        Parameters
+        ----------
+        **kwargs : dict, optional
+            Arguments of `AsyncSessionPool`, e.g. `pool_size`.
+
+        Returns
+        -------
+        pyfredapi.aio.AsyncSessionPool
+
+        """
+        from pyfredapi.aio.session import AsyncSessionPool
+
+        return AsyncSessionPool(api_root=self.url, **kwargs)
+
+    def client(self, api_key: str = DEFAULT_API_KEY, **kwargs: Any) -> FredClient:
+        """Create a `FredClient` that sends its requests to the server.
+
+        Parameters
+        ----------
+        api_key : str, optional
+            FRED API key of the client. The server does not check it. Defaults to a dummy key.
+        **kwargs : dict, optional
+            Arguments of `FredClient`, e.g. `retry_policy`.
+
+        Returns
+        -------
+        FredClient
+
+        """
+        kwargs.setdefault("session_pool", self.session_pool())
+        return FredClient(api_key, **kwargs)
+
+    def _handle(self, url: str) -> MockResponse:
+        started = time.perf_counter()
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            path, params, has_api_key = _split_url(url)
+            response = self._inject_faults()
+            if response is None:
+                if has_api_key:
+                    response = self._respond(path, params)
+                else:
+                    response = _error_response(
+                        400, "Bad Request.  Variable api_key is not set."
+                    )
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+        with self._lock:
+            self._requests.append(
+                ServedRequest(
+                    path=_normalize_path(path),
+                    params=params,
+                    status_code=response.status_code,
+                    started=started,
+                    duration=time.perf_counter() - started,
+                )
+            )
+        return response
+
+    def _inject_faults(self) -> Optional[MockResponse]:
+        faults = self.faults
+        with self._lock:
+            delay = faults.latency + self._random.uniform(0, faults.jitter)
+            roll = self._random.random()
+            status = self._random.choice(faults.server_error_statuses)
+            throttled = self._throttled(faults.max_requests_per_second)
+        if delay:
+            time.sleep(delay)
+
+        if throttled or roll < faults.rate_limit_rate:
+            headers: Tuple[Tuple[str, str], ...] = ()
+            if faults.retry_after is not None:
+                headers = (("Retry-After", f"{faults.retry_after:g}"),)
+            return _error_response(
+                429, "Too Many Requests.  Exceeded Rate Limit", headers
+            )
+        if roll < faults.rate_limit_rate + faults.server_error_rate:
+            return _gateway_error(status)
+        return None
+
+    def _throttled(self, max_requests_per_second: Optional[float]) -> bool:
+        if max_requests_per_second is None:
+            return False
+        now = time.monotonic()
+        while self._recent and self._recent[0] <= now - 1:
+            self._recent.popleft()
+        if len(self._recent) >= max_requests_per_second:
+            return True
+        self._recent.append(now)
+        return False
+
+    def _respond(self, path: str, params: Dict[str, str]) -> MockResponse:
+        key = _response_key(path, params)
+        response = self._cassettes.get(key)
+        if response is not None:
+            return response
+        if not self.synthetic:
+            return _error_response(404, "Not Found.")
+
+        with self._lock:
+            response = self._bodies.get(key)
+            if response is not None:
+                self._bodies.move_to_end(key)
+                return response
+
+        data = self._generate(key[0], params)
+        if data is None:
+            return _error_response(404, "Not Found.")
+        response = _json_response(200, data)
+        with self._lock:
+            self._bodies[key] = response
+            if len(self._bodies) > _BODY_CACHE_SIZE:
+                self._bodies.popitem(last=False)
+        return response
+
+    def _generate(self, path: str, params: Dict[str, str]) -> Any:
+        root, _, endpoint = path.strip("/").partition("/")
+        if root == "geofred":
+            if endpoint == "shapes/file":
+                return synthetic.shape_file(
+                    params.get("shape", "state"), self.shape_features
+                )
+            series_id = params.get("series_id", "SYN")
+            if endpoint == "series/group":
+                return synthetic.geoseries_group(series_id)
+            if endpoint == "series/data":
+                return synthetic.geoseries_data(
+                    series_id, self.geo_regions, self.geo_dates
+                )
+            return None
+        if root != "fred":
+            return None
+        if endpoint == "series/observations":
+            return synthetic.observations(self.observations, params)
+        if endpoint == "series":
+            return synthetic.series(params.get("series_id", "SYN0000000"))
+        if endpoint in synthetic.LISTING_KEYS:
+            return synthetic.listing(endpoint, self.listing_size, params)
+        return None
@@ -0,0 +1,350 @@
+"""The `testing.synthetic` module generates FRED API responses of any size.
+
+The generated responses have the same shape as the responses of the FRED API, so they can be decoded
+and converted by pyfredapi like real responses. Every value is a pure function of its position, so
+a page of a large response is generated without generating the pages before it, and the same request
+always gets the same response.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+from pyfredapi.utils._common_type_hints import JsonType
+
+REALTIME = "2024-11-03"
+FIRST_DATE = dt.date(1900, 1, 1)
+MAX_OBSERVATIONS = dt.date.max.toordinal() - FIRST_DATE.toordinal()
+MAX_OBSERVATIONS_LIMIT = 100_000
+MAX_LISTING_LIMIT = 1000
+
+# Listing endpoints and the key of the list of records in their responses.
+LISTING_KEYS: Dict[str, str] = {
+    "category/series": "seriess",
+    "release/series": "seriess",
+    "series/search": "seriess",
+    "tags/series": "seriess",
+    "releases": "releases",
+    "source/releases": "releases",
+    "sources": "sources",
+    "release/sources": "sources",
+    "tags": "tags",
+    "related_tags": "tags",
+    "category/tags": "tags",
+    "category/related_tags": "tags",
+    "release/tags": "tags",
+    "release/related_tags": "tags",
+    "series/tags": "tags",
+    "series/search/tags": "tags",
+    "series/search/related_tags": "tags",
+}
+
+
+def _page(params: Mapping[str, Any], count: int, max_limit: int) -> range:
+    offset = int(params.get("offset", 0))
+    limit = min(int(params.get("limit", max_limit)), max_limit)
+    return range(min(offset, count), min(offset + limit, count))
+
+
+def _envelope(params: Mapping[str, Any], count: int, rows: range) -> Dict[str, Any]:
+    return {
+        "realtime_start": params.get("realtime_start", REALTIME),
+        "realtime_end": params.get("realtime_end", REALTIME),
+        "count": count,
+        "offset": rows.start,
+        "limit": len(rows),
+    }
+
+
+def observation_value(index: int) -> str:
+    """Return the value of the observation at the given position.
+
+    One observation in 97 is missing and has the value ".", like the missing values of FRED.
+    """
+    if index % 97 == 96:
+        return "."
+    return f"{100 + index * 0.01 + (index * 7919 % 1000) / 100:.3f}"
+
+
+def observations(count: int, params: Optional[Mapping[str, Any]] = None) -> JsonType:
+    """Generate a `series/observations` response with daily observations starting on 1900-01-01.
+
+    Parameters
+    ----------
+    count : int
+        Total number of observations of the series.
+    params : Mapping[str, Any] | None, optional
+        Query parameters of the request. The `limit` and `offset` select the page, and the
+        `realtime_start` and `realtime_end` are echoed in every observation.
+
+    Returns
+    -------
+    A dictionary representing the json response.
+
+    """
+    if count > MAX_OBSERVATIONS:
+        raise ValueError(f"`count` must be at most {MAX_OBSERVATIONS}, not {count}.")
+
+    params = params or {}
+    rows = _page(params, count, MAX_OBSERVATIONS_LIMIT)
+    response = _envelope(params, count, rows)
+    response["observations"] = observation_records(
+        rows, response["realtime_start"], response["realtime_end"]
+    )
+    return response
+
+
+def observation_records(
+    rows: Union[int, range],
+    realtime_start: str = REALTIME,
+    realtime_end: str = REALTIME,
+) -> List[Dict[str, Any]]:
+    """Generate the observation records at the given positions, or the first `rows` records.
+
+    Parameters
+    ----------
+    rows : int | range
+        Positions of the observations, or the number of observations starting at 1900-01-01.
+    realtime_start : str, optional
+        Realtime start of every observation. Defaults to "2024-11-03".
+    realtime_end : str, optional
+        Realtime end of every observation. Defaults to "2024-11-03".
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+
+    """
+    if isinstance(rows, int):
+        rows = range(rows)
+    first = FIRST_DATE.toordinal()
+    return [
+        {
+            "realtime_start": realtime_start,
+            "realtime_end": realtime_end,
+            "date": dt.date.fromordinal(first + i).isoformat(),
+            "value": observation_value(i),
+        }
+        for i in rows
+    ]
+
+
+def vintage_records(count: int, vintages: int = 4) -> List[Dict[str, Any]]:
+    """Generate observation records with several vintages per date, like all-releases responses.
+
+    Each daily observation is revised `vintages` times, 30 days apart. The last vintage of each
+    observation is still current, so its `realtime_end` is "9999-12-31", like in FRED.
+
+    Parameters
+    ----------
+    count : int
+        Total number of records.
+    vintages : int, optional
+        Number of vintages of each observation. Defaults to 4.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+
+    """
+    first = FIRST_DATE.toordinal()
+    records = []
+    for i in range(count):
+        observation, vintage = divmod(i, vintages)
+        released = first + observation + 30 * (vintage + 1)
+        records.append(
+            {
+                "realtime_start": dt.date.fromordinal(released).isoformat(),
+                "realtime_end": (
+                    "9999-12-31"
+                    if vintage == vintages - 1
+                    else dt.date.fromordinal(released + 29).isoformat()
+                ),
+                "date": dt.date.fromordinal(first + observation).isoformat(),
+                "value": observation_value(i),
+            }
+        )
+    return records
+
+
+def series_record(series_id: str) -> Dict[str, Any]:
+    """Generate the metadata of a series."""
+    return {
+        "id": series_id,
+        "realtime_start": REALTIME,
+        "realtime_end": REALTIME,
+        "title": f"Synthetic Series {series_id}",
+        "observation_start": FIRST_DATE.isoformat(),
+        "observation_end": REALTIME,
+        "frequency": "Daily",
+        "frequency_short": "D",
+        "units": "Index",
+        "units_short": "Index",
+        "seasonal_adjustment": "Not Seasonally Adjusted",
+        "seasonal_adjustment_short": "NSA",
+        "last_updated": "2024-11-01 07:31:04-05",
+        "popularity": 1,
+        "notes": "Generated by pyfredapi.testing.",
+    }
+
+
+def series(series_id: str) -> JsonType:
+    """Generate a `series` response."""
+    return {
+        "realtime_start": REALTIME,
+        "realtime_end": REALTIME,
+        "seriess": [series_record(series_id)],
+    }
+
+
+def _record(records_key: str, index: int) -> Dict[str, Any]:
+    if records_key == "seriess":
+        return series_record(f"SYN{index:07d}")
+    if records_key == "tags":
+        return {
+            "name": f"tag{index}",
+            "group_id": "gen",
+            "notes": "",
+            "created": "2012-02-27 10:18:19-06",
+            "popularity": index % 100,
+            "series_count": index % 1000,
+        }
+    name = "Release" if records_key == "releases" else "Source"
+    return {
+        "id": index + 1,
+        "realtime_start": REALTIME,
+        "realtime_end": REALTIME,
+        "name": f"Synthetic {name} {index + 1}",
+        "link": f"https://example.com/{records_key}/{index + 1}",
+    }
+
+
+def listing(
+    endpoint: str, count: int, params: Optional[Mapping[str, Any]] = None
+) -> JsonType:
+    """Generate a response of a FRED API listing endpoint, e.g. `category/series` or `releases`.
+
+    Parameters
+    ----------
+    endpoint : str
+        A listing endpoint, one of the keys of `LISTING_KEYS`.
+    count : int
+        Total number of records of the listing.
+    params : Mapping[str, Any] | None, optional
+        Query parameters of the request. The `limit` and `offset` select the page.
+
+    Returns
+    -------
+    A dictionary representing the json response.
+
+    """
+    records_key = LISTING_KEYS[endpoint]
+    params = params or {}
+    rows = _page(params, count, MAX_LISTING_LIMIT)
+    response = _envelope(params, count, rows)
+    response["order_by"] = params.get("order_by", "series_id")
+    response["sort_order"] = params.get("sort_order", "asc")
+    response[records_key] = [_record(records_key, i) for i in rows]
+    return response
+
+
+def shape_file(shape: str, features: int, points: int = 64) -> JsonType:
+    """Generate a `shapes/file` GeoFRED response.
+
+    Parameters
+    ----------
+    shape : str
+        Name of the shape, e.g. "county".
+    features : int
+        Number of features of the collection.
+    points : int, optional
+        Number of points of the polygon of each feature. Defaults to 64.
+
+    Returns
+    -------
+    A dictionary representing the GeoJSON FeatureCollection.
+
+    """
+    if points < 3:
+        raise ValueError(f"`points` must be at least 3, not {points}.")
+
+    columns = max(1, int(features**0.5))
+    collection: List[Dict[str, Any]] = []
+    for i in range(features):
+        x, y = (i % columns) * 100, (i // columns) * 100
+        ring = [[x + (j * 97 % 100), y + (j * 89 % 100)] for j in range(points - 1)]
+        ring.append(ring[0])
+        collection.append(
+            {
+                "type": "Feature",
+                "properties": {"name": f"{shape} {i + 1}", "fips": f"{i + 1:05d}"},
+                "geometry": {"type": "MultiPolygon", "coordinates": [[ring]]},
+            }
+        )
+    return {
+        "type": "FeatureCollection",
+        "name": shape,
+        "crs": {
+            "type": "name",
+            "properties": {"name": "urn:ogc:def:crs:OGC:1.3:CRS84"},
+        },
+        "features": collection,
+    }
+
+
+def geoseries_group(series_id: str) -> JsonType:
+    """Generate a `series/group` GeoFRED response."""
+    return {
+        "series_group": {
+            "title": f"Synthetic Regional Series {series_id}",
+            "region_type": "county",
+            "series_group": "1",
+            "season": "NSA",
+            "units": "Dollars",
+            "frequency": "a",
+            "min_date": FIRST_DATE.isoformat(),
+            "max_date": REALTIME,
+        }
+    }
+
+
+def geoseries_data(series_id: str, regions: int, dates: int) -> JsonType:
+    """Generate a `series/data` GeoFRED response with a cross section of regions for each date.
+
+    Parameters
+    ----------
+    series_id : str
+        Series id of the regional series.
+    regions : int
+        Number of regions of each cross section.
+    dates : int
+        Number of yearly cross sections, ending in 2024.
+
+    Returns
+    -------
+    A dictionary representing the json response.
+
+    """
+    data = {
+        f"{2024 - dates + 1 + d}-01-01": [
+            {
+                "region": f"Region {r + 1}",
+                "code": f"{r + 1:05d}",
+                "value": 40000 + (r * 7919 + d * 104729) % 30000,
+                "series_id": f"{series_id}{r + 1:05d}",
+            }
+            for r in range(regions)
+        ]
+        for d in range(dates)
+    }
+    return {
+        "meta": {
+            "title": f"Synthetic Regional Series {series_id}",
+            "region": "county",
+            "seasonality": "Not Seasonally Adjusted",
+            "units": "Dollars",
+            "frequency": "Annual",
+            "data": data,
+        }
+    }
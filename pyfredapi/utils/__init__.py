@@ -1,5 +1,8 @@
 """Utilities module."""
 
+from functools import lru_cache
+from typing import Any, Type
+
 from pydantic import BaseModel
 
 
@@ -9,3 +12,29 @@ def _convert_pydantic_model_to_frozenset(model: BaseModel) -> frozenset:
 
 def _convert_pydantic_model_to_dict(model: BaseModel) -> dict:
     return model.model_dump(exclude_none=True)
+
+
+@lru_cache(maxsize=4096)
+def _validate_params(model: Type[BaseModel], params: frozenset) -> frozenset:
+    return _convert_pydantic_model_to_frozenset(
+        model(**{name: value for name, _, value in params})
+    )
+
+
+def _validated_params(model: Type[BaseModel], **kwargs: Any) -> frozenset:
+    """Validate the parameters of a request with a pydantic model and return them as a frozenset.
+
+    The validated parameters are memoized, so repeated calls with the same parameters, e.g. cache
+    hits, skip the validation. The type of each value is part of the key, so `1` and `True` are
+    validated separately. Parameters with unhashable values are validated on every call.
+    """
+    try:
+        key = frozenset((name, type(value), value) for name, value in kwargs.items())
+    except TypeError:
+        return _convert_pydantic_model_to_frozenset(model(**kwargs))
+    return _validate_params(model, key)
+
+
+def _validated_dict(model: Type[BaseModel], **kwargs: Any) -> dict:
+    """Validate the parameters of a request with a pydantic model and return them as a dictionary."""
+    return dict(_validated_params(model, **kwargs))
@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Literal, Union
-
-from pandas import DataFrame as PdDataFrame
+from typing import TYPE_CHECKING, Any, Dict, Literal, Union
 
 from pyfredapi.utils.enums import ReturnFormat
 
-try:
+if TYPE_CHECKING:
+    from numpy import ndarray as NpArray
+    from pandas import DataFrame as PdDataFrame
     from polars import DataFrame as PlDataFrame
-except ImportError:
-    pass
+    from polars import LazyFrame as PlLazyFrame
+    from pyarrow import Table as PaTable
 
 
 ApiKeyType = Union[str, None]
 JsonType = Dict[str, Any]
-ReturnTypes = Union[Dict, PdDataFrame, "PlDataFrame"]
-ReturnFormats = Union[Literal["json", "pandas", "polars"], ReturnFormat]
+ReturnTypes = Union[
+    Dict, "PdDataFrame", "PlDataFrame", "PlLazyFrame", "PaTable", "NpArray"
+]
+ReturnFormats = Union[
+    Literal["json", "pandas", "polars", "polars_lazy", "arrow", "numpy"], ReturnFormat
+]
 KwargsType = Dict[str, Union[int, str, None]]
@@ -1,46 +1,301 @@
 from __future__ import annotations
 
-import pandas as pd
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
 
-try:
+from pyfredapi.cache import ResponseCache
+from pyfredapi.hooks import _observe_conversion
+from pyfredapi.realtime import _realtime_column, get_realtime_dates
+from pyfredapi.utils.enums import ReturnFormat
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
     import polars as pl
-    from polars.exceptions import InvalidOperationError
-
-    MISSING_POLARS = False
-except ImportError:
-    MISSING_POLARS = True
-
-
-# ! Excluding realtime_start & realtime_end because pandas can't convert the max/min dates in FRED
-# ! I'm not sure this is a good idea. Feels hacky, fragile, and I don't like overwriting the source data when converting
-# ! But I would like to convert all columns to the correct data type
-# ! and pandas does not accept the realtime dates as-is from FRED
-# ! A check could be made against the realtime columns, and if the date is out of bounds, the value is overwritten to the min/max that pandas accepts
-# ! The overwrite will allow pd.to_datetime to work
-# ! The minimum date pandas accepts is 1677-09-21
-# ! The maximum date pandas accepts is 2262-04-11
-# ! code snippet for converting to valid date:
-# for c in date_cols:
-#     df.loc[(df[c] < "1677-09-21"), c] = "1677-09-21"
-#     df.loc[(df[c] > "2262-04-11"), c] = "2262-04-11"
+    import pyarrow as pa
+
+# pandas, polars, and pyarrow are imported on the first conversion, so requests that return json never load them.
+MISSING_POLARS = find_spec("polars") is None
+MISSING_PYARROW = find_spec("pyarrow") is None
+
 
+# FRED marks open realtime periods with 9999-12-31, which does not fit in a datetime64[ns]. The
+# representation of the realtime columns is set with `pyfredapi.realtime.set_realtime_dates`.
 FRED_DATE_COLS = ["date", "created", "realtime_start", "realtime_end"]
 FRED_NUM_COLS = ["value"]
 
+# FRED always sends the observation and realtime dates as YYYY-MM-DD, and missing values as ".".
+FRED_ISO_DATE_COLS = ["date", "realtime_start", "realtime_end"]
+FRED_REALTIME_COLS = ["realtime_start", "realtime_end"]
+FRED_MISSING_VALUE = "."
+
+# Formats of the dates and timestamps of FRED, e.g. "2012-02-27" and "2012-02-27 10:18:19-06".
+# polars needs %#z to parse the offsets without minutes.
+FRED_DATE_FORMAT = "%Y-%m-%d"
+FRED_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S%z"
+FRED_POLARS_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S%#z"
+
+
+def _records_to_columns(
+    data: list[dict], columns: Optional[List[str]] = None
+) -> Dict[str, list]:
+    """Split records into columns, in the order the keys first appear like `pd.DataFrame` does.
+
+    If `columns` is given, only these columns are extracted, in this order, and the missing values
+    are filled with NaN.
+    """
+    nan = float("nan")
+    if columns is not None:
+        return {key: [record.get(key, nan) for record in data] for key in columns}
+    if not data:
+        return {}
+
+    keys = list(data[0])
+    if set(map(len, data)) == {len(keys)}:
+        try:
+            return {key: [record[key] for record in data] for key in keys}
+        except KeyError:
+            pass
+
+    # The records have different keys, so the missing values are filled with NaN.
+    keys = list(dict.fromkeys(key for record in data for key in record))
+    return {key: [record.get(key, nan) for record in data] for key in keys}
+
+
+def _check_columns(columns: List[str], fields: Sequence[str], source: str) -> None:
+    """Raise a ValueError if some of the requested columns are not among the fields."""
+    unknown = set(columns) - set(fields)
+    if unknown:
+        choices = [f"'{f}'" for f in fields]
+        if len(choices) > 1:
+            choices[-1] = f"and {choices[-1]}"
+        raise ValueError(
+            f"{source} has no {sorted(unknown)} fields. Choose among "
+            f"{(', ' if len(choices) > 2 else ' ').join(choices)}."
+        )
+
+
+def _record_fields(data: list[dict], columns: List[str]) -> List[str]:
+    """Return the fields of the records, looking past the first record only if it lacks a column."""
+    fields = list(data[0])
+    if set(columns) <= set(fields):
+        return fields
+    return list(dict.fromkeys(key for record in data for key in record))
+
+
+def _categorical(values: Sequence) -> Optional[pd.Categorical]:
+    """Convert a column of strings where most values repeat, e.g. `frequency` or `units`, to a categorical.
+
+    Returns None if the column has other values than strings and missing values, or if fewer than
+    half of its values repeat.
+    """
+    import pandas as pd
+
+    try:
+        distinct = set(values)
+    except TypeError:
+        return None
+    if 2 * len(distinct) > len(values) or not all(
+        isinstance(v, str) or v is None or v != v for v in distinct
+    ):
+        return None
+    return pd.Categorical(values)
+
+
+def _categorize(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the string columns of a pandas dataframe where most values repeat to categoricals."""
+    for c in df.select_dtypes(include="object").columns:
+        categorical = _categorical(df[c].tolist())
+        if categorical is not None:
+            df[c] = categorical
+    return df
+
+
+def _parse_iso_days(values: list) -> Optional[np.ndarray]:
+    """Parse YYYY-MM-DD strings to datetime64[D], or return None if a value has another format."""
+    import numpy as np
+
+    if not MISSING_PYARROW:
+        dates = _arrow_dates(values)
+        return None if dates is None else dates.to_numpy(zero_copy_only=False)
+
+    try:
+        if set(map(len, values)) != {10}:
+            return None
+        return np.array(values, dtype="datetime64[D]")
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_values(values: list) -> Optional[np.ndarray]:
+    """Parse observation values to float64 with "." as NaN, or return None if a value is not a number."""
+    import numpy as np
+
+    if not MISSING_PYARROW:
+        numbers = _arrow_values(values)
+        return None if numbers is None else numbers.to_numpy(zero_copy_only=False)
+
+    array = np.array(values, dtype=object)
+    array[array == FRED_MISSING_VALUE] = np.nan
+    try:
+        return array.astype(np.float64)
+    except (TypeError, ValueError):
+        return None
+
+
+def _arrow_dates(values: list) -> Optional[pa.Array]:
+    """Parse YYYY-MM-DD strings to a date32 array, or return None if a value has another format."""
+    import pyarrow as pa
+
+    try:
+        return pa.array(values, type=pa.string(), from_pandas=True).cast(pa.date32())
+    except pa.ArrowException:
+        return None
+
+
+def _arrow_timestamps(values: list) -> Optional[pa.Array]:
+    """Parse FRED timestamps to a UTC timestamp array, or return None if a value has another format."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    try:
+        strings = pa.array(values, type=pa.string(), from_pandas=True)
+        return pc.strptime(strings, format=FRED_TIMESTAMP_FORMAT, unit="s")
+    except pa.ArrowException:
+        return None
+
 
-def _convert_to_pandas(data: list[dict]) -> pd.DataFrame:
+def _arrow_values(values: list) -> Optional[pa.Array]:
+    """Parse observation values to a float64 array with "." as null, or return None if a value is not a number."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    try:
+        strings = pa.array(values, type=pa.string(), from_pandas=True)
+        missing = pc.equal(strings, FRED_MISSING_VALUE)
+        return pc.if_else(missing, None, strings).cast(pa.float64())
+    except pa.ArrowException:
+        return None
+
+
+def _arrow_array(values: list) -> pa.Array:
+    """Convert a column to an array of the type inferred by arrow, or to strings if it mixes types."""
+    import pyarrow as pa
+
+    try:
+        return pa.array(values, from_pandas=True)
+    except pa.ArrowException:
+        # NaN != NaN, so the missing values are kept as nulls.
+        return pa.array(
+            [None if v is None or v != v else str(v) for v in values], type=pa.string()
+        )
+
+
+def _records_to_arrow(
+    data: list[dict],
+    timestamps: bool = True,
+    dictionary: bool = True,
+    columns: Optional[List[str]] = None,
+) -> pa.Table:
+    """Convert records to an arrow table with the FRED formats parsed.
+
+    Dates are parsed to date32, which holds every FRED date including 9999-12-31, and values to
+    float64 with "." as null. If `timestamps`, date columns with FRED timestamps are parsed to UTC
+    timestamps. If `dictionary`, string columns where most values repeat are dictionary encoded.
+    If `columns` is given, the other columns are never converted.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    arrays: Dict[str, pa.Array] = {}
+    for c, values in _records_to_columns(data, columns).items():
+        array = None
+        if c in FRED_DATE_COLS:
+            array = _arrow_dates(values)
+            if array is None and timestamps:
+                array = _arrow_timestamps(values)
+        elif c in FRED_NUM_COLS:
+            array = _arrow_values(values)
+
+        if array is None:
+            array = _arrow_array(values)
+            if (
+                dictionary
+                and pa.types.is_string(array.type)
+                and 2 * pc.count_distinct(array).as_py() <= len(array)
+            ):
+                array = array.dictionary_encode()
+        arrays[c] = array
+
+    return pa.table(arrays)
+
+
+@_observe_conversion("pandas")
+def _convert_to_pandas(
+    data: list[dict], columns: Optional[List[str]] = None, categorical: bool = False
+) -> pd.DataFrame:
     """Convert a FRED response dictionary to a pandas dataframe.
 
+    The columns are built directly from the records. Dates are parsed with the fixed YYYY-MM-DD
+    format of FRED, and values are parsed to float64 with "." mapped to NaN. Columns that do not
+    follow the FRED formats fall back to the type inference of pandas. If pyarrow is installed, the
+    dates and values are parsed by arrow. The realtime columns are represented as set by
+    `pyfredapi.realtime.set_realtime_dates`.
+
     Parameters
     ----------
     data : Dict[str, Any]
         Response from FRED api endpoint.
+    columns : List[str] | None, optional
+        Columns to convert, in this order. The other fields of the records are never parsed.
+        Defaults to None, i.e. every field.
+    categorical : bool, optional
+        If `True`, string columns where most values repeat are converted to `category` columns.
+        Defaults to False.
 
     Returns
     -------
     Pandas dataframe.
 
     """
+    import pandas as pd
+
+    if not data:
+        return pd.DataFrame(data, columns=columns)
+
+    frame: Dict[str, Any] = _records_to_columns(data, columns)
+    for c, values in frame.items():
+        if c in FRED_ISO_DATE_COLS:
+            days = _parse_iso_days(values)
+            if days is None:
+                frame[c] = pd.to_datetime(values, errors="coerce")
+            elif c in FRED_REALTIME_COLS:
+                frame[c] = _realtime_column(days)
+            else:
+                frame[c] = _realtime_column(days, "coerce")
+        elif c in FRED_DATE_COLS:
+            frame[c] = pd.to_datetime(values, errors="coerce")
+        elif c in FRED_NUM_COLS:
+            numbers = _parse_values(values)
+            frame[c] = (
+                pd.to_numeric(values, errors="coerce") if numbers is None else numbers
+            )
+        elif categorical:
+            codes = _categorical(values)
+            if codes is not None:
+                frame[c] = codes
+
+    return pd.DataFrame(frame)
+
+
+def _convert_to_pandas_inferred(data: list[dict]) -> pd.DataFrame:
+    """Convert a FRED response dictionary to a pandas dataframe, inferring the formats of the columns.
+
+    This is the conversion of pyfredapi before the columns were parsed with the FRED formats. It is
+    kept as the reference of the tests and benchmarks of `_convert_to_pandas`.
+    """
+    import pandas as pd
+
     df = pd.DataFrame(data)
     date_cols = [c for c in list(df.columns) if c in FRED_DATE_COLS]
     for c in date_cols:
@@ -53,36 +308,365 @@ def _convert_to_pandas(data: list[dict]) -> pd.DataFrame:
     return df
 
 
-def _convert_to_polars(data: list[dict]) -> pl.DataFrame:
-    """Convert a FRED response dictionary to a pandas dataframe.
+def _polars_plan(df: pl.DataFrame, categorical: bool = False) -> pl.LazyFrame:
+    """Plan the parsing of the FRED formats of the string columns of a polars dataframe.
+
+    If `categorical`, the other string columns where most values repeat are cast to Categorical.
+    """
+    import polars as pl
+
+    exprs = []
+    for c, dtype in df.schema.items():
+        if dtype != pl.String:
+            continue
+        if c in FRED_ISO_DATE_COLS:
+            exprs.append(pl.col(c).str.to_date(FRED_DATE_FORMAT, strict=False))
+        elif c in FRED_DATE_COLS:
+            exprs.append(
+                pl.col(c).str.to_datetime(FRED_POLARS_TIMESTAMP_FORMAT, strict=False)
+            )
+        elif c in FRED_NUM_COLS:
+            exprs.append(
+                pl.col(c)
+                .replace(FRED_MISSING_VALUE, None)
+                .cast(pl.Float64, strict=False)
+            )
+        elif categorical and 2 * df[c].n_unique() <= len(df):
+            exprs.append(pl.col(c).cast(pl.Categorical))
+    return df.lazy().with_columns(exprs)
+
+
+def _convert_to_polars_lazy(
+    data: list[dict], columns: Optional[List[str]] = None, categorical: bool = False
+) -> pl.LazyFrame:
+    """Convert a FRED response dictionary to a polars lazyframe.
+
+    The parsing of the columns is a single plan that runs when the lazyframe is collected, so the
+    filters, selections, and joins of the caller are optimized together with it. Dates are parsed
+    with the fixed YYYY-MM-DD format of FRED, timestamps to UTC, and values to Float64 with "." as
+    null. Values that do not follow the FRED formats are null. If pyarrow is installed, the dates and
+    values are parsed by arrow instead, and polars takes over the arrow buffers without copying.
 
     Parameters
     ----------
     data : Dict[str, Any]
         Response from FRED api endpoint.
+    columns : List[str] | None, optional
+        Columns to convert, in this order. The other fields of the records are never parsed.
+        Defaults to None, i.e. every field.
+    categorical : bool, optional
+        If `True`, string columns where most values repeat are cast to Categorical. Defaults to
+        False.
 
     Returns
     -------
-    Polars DataFrame.
+    Polars LazyFrame.
 
     """
     if MISSING_POLARS:
         raise ImportError(
             "Unable to import polars. Ensure you have the polars package installed."
         )
+    import polars as pl
 
-    df = pl.DataFrame(data)
+    if not MISSING_PYARROW:
+        table = _records_to_arrow(
+            data, timestamps=False, dictionary=False, columns=columns
+        )
+        df = pl.DataFrame(table)
+    elif columns is not None:
+        df = pl.DataFrame({c: [record.get(c) for record in data] for c in columns})
+    else:
+        df = pl.DataFrame(data)
+    return _polars_plan(df, categorical)
 
-    date_cols = [c for c in list(df.columns) if c in FRED_DATE_COLS]
-    for col in date_cols:
+
+@_observe_conversion("polars")
+def _convert_to_polars(
+    data: list[dict], columns: Optional[List[str]] = None, categorical: bool = False
+) -> pl.DataFrame:
+    """Convert a FRED response dictionary to a polars dataframe.
+
+    The columns are parsed like in `_convert_to_polars_lazy`. Missing values are null, so the
+    dataframe has a row for every record, like the pandas dataframe.
+
+    Parameters
+    ----------
+    data : Dict[str, Any]
+        Response from FRED api endpoint.
+    columns : List[str] | None, optional
+        Columns to convert, in this order. The other fields of the records are never parsed.
+        Defaults to None, i.e. every field.
+    categorical : bool, optional
+        If `True`, string columns where most values repeat are cast to Categorical. Defaults to
+        False.
+
+    Returns
+    -------
+    Polars DataFrame.
+
+    """
+    return _convert_to_polars_lazy(data, columns, categorical).collect()
+
+
+@_observe_conversion("arrow")
+def _convert_to_arrow(
+    data: list[dict], columns: Optional[List[str]] = None
+) -> pa.Table:
+    """Convert a FRED response dictionary to an arrow table.
+
+    Dates are parsed to date32, FRED timestamps to UTC timestamps, and values to float64 with "."
+    as null. String columns where most values repeat, e.g. the `frequency` and `units` of series
+    search results, are dictionary encoded. The table can be handed to pandas with
+    `table.to_pandas()` and to polars with `pl.from_arrow(table)`.
+
+    Parameters
+    ----------
+    data : Dict[str, Any]
+        Response from FRED api endpoint.
+    columns : List[str] | None, optional
+        Columns to convert, in this order. The other fields of the records are never parsed.
+        Defaults to None, i.e. every field.
+
+    Returns
+    -------
+    Arrow table.
+
+    """
+    if MISSING_PYARROW:
+        raise ImportError(
+            "Unable to import pyarrow. Install it with `pip install 'pyfredapi[arrow]'`."
+        )
+    return _records_to_arrow(data, columns=columns)
+
+
+def _coerce_iso_days(values: list) -> np.ndarray:
+    """Parse YYYY-MM-DD strings one by one to datetime64[D], with NaT for the values with another format."""
+    import numpy as np
+
+    days = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[D]")
+    for i, value in enumerate(values):
+        if isinstance(value, str) and len(value) == 10:
+            try:
+                days[i] = np.datetime64(value, "D")
+            except ValueError:
+                pass
+    return days
+
+
+def _coerce_values(values: list) -> np.ndarray:
+    """Parse observation values one by one to float64, with NaN for the values that are not numbers."""
+    import numpy as np
+
+    numbers = np.full(len(values), np.nan)
+    for i, value in enumerate(values):
         try:
-            df = df.cast({col: pl.Date})
-        except InvalidOperationError:
+            numbers[i] = float(value)
+        except (TypeError, ValueError):
             pass
+    return numbers
 
-    num_cols = [c for c in list(df.columns) if c in FRED_NUM_COLS]
-    for col in num_cols:
-        df = df.filter(pl.col(col) != ".")
-        df = df.cast({col: pl.Float64})
 
-    return df
+@_observe_conversion("numpy")
+def _convert_to_numpy(
+    data: list[dict], realtime: bool = False, columns: Optional[List[str]] = None
+) -> np.ndarray:
+    """Convert FRED observations to a numpy structured array.
+
+    The array has a `date` field of datetime64[D] and a `value` field of float64 with "." as NaN,
+    plus `realtime_start` and `realtime_end` fields of datetime64[D] if `realtime`. datetime64[D]
+    holds every FRED date, including the 9999-12-31 end of open realtime periods. Each field is
+    parsed with vectorized code and written into a single allocation of 8 bytes per field and
+    observation. Values that do not follow the FRED formats are NaT or NaN.
+
+    Parameters
+    ----------
+    data : list[dict]
+        Observations from the FRED api ``series/observations`` endpoint.
+    realtime : bool, optional
+        Whether to include the realtime fields. Defaults to False.
+    columns : List[str] | None, optional
+        Fields of the array, in this order, among "date", "value", "realtime_start", and
+        "realtime_end". Overrides `realtime`. Defaults to None.
+
+    Returns
+    -------
+    np.ndarray
+        Structured array with a record per observation.
+
+    """
+    import numpy as np
+
+    fields = columns or [
+        "date",
+        *FRED_NUM_COLS,
+        *(FRED_REALTIME_COLS if realtime else []),
+    ]
+    _check_columns(
+        fields,
+        ["date", *FRED_NUM_COLS, *FRED_REALTIME_COLS],
+        "The 'numpy' return format",
+    )
+    array = np.empty(
+        len(data),
+        dtype=[
+            (f, "float64" if f in FRED_NUM_COLS else "datetime64[D]") for f in fields
+        ],
+    )
+    for field in fields:
+        values = [record.get(field) for record in data]
+        if field in FRED_NUM_COLS:
+            numbers = _parse_values(values)
+            array[field] = _coerce_values(values) if numbers is None else numbers
+        else:
+            days = _parse_iso_days(values)
+            array[field] = _coerce_iso_days(values) if days is None else days
+    return array
+
+
+def _frame_size(frame: Any) -> int:
+    """Estimate the size of a dataframe in bytes. The strings of pandas object columns are not counted."""
+    module = type(frame).__module__
+    if module.startswith("pandas"):
+        return int(frame.memory_usage(index=True).sum())
+    if module.startswith("polars"):
+        return int(frame.estimated_size())
+    return int(frame.nbytes)
+
+
+def _copy_frame(frame: Any) -> Any:
+    """Copy a cached dataframe, so the caller cannot modify the cached one. Arrow tables are immutable."""
+    module = type(frame).__module__
+    if module.startswith("pandas"):
+        import pandas as pd
+
+        copy_on_write = (
+            int(pd.__version__.split(".")[0]) >= 3
+            or pd.options.mode.copy_on_write is True
+        )
+        # With copy-on-write, the copy shares the data until either dataframe is modified.
+        return frame.copy(deep=not copy_on_write)
+    if module.startswith("polars"):
+        return frame.clone()
+    if module.startswith("numpy"):
+        return frame.copy()
+    return frame
+
+
+def _convert_cached(
+    data: list[dict], conversion: Tuple[Any, ...], convert: Callable[[], Any]
+) -> Any:
+    """Convert records, or reuse their conversion if they are the records of a cached response.
+
+    The conversions are cached with the response in the `ResponseCache` of the request, see
+    `ResponseCache.get_frame`. Callers get a copy of the cached dataframe.
+    """
+    from pyfredapi._base import _active_cache
+
+    cache = _active_cache()
+    if not isinstance(cache, ResponseCache) or not cache.cache_frames:
+        return convert()
+
+    # The realtime columns of pandas dataframes depend on the representation of the realtime dates.
+    key = (*conversion, get_realtime_dates())
+    frame = cache.get_frame(data, key)
+    if frame is None:
+        frame = convert()
+        if not cache.set_frame(data, key, frame, _frame_size(frame)):
+            return frame
+    return _copy_frame(frame)
+
+
+def _convert_records(
+    data: list[dict],
+    return_format: ReturnFormat,
+    columns: Optional[List[str]] = None,
+    categorical: bool = False,
+):
+    """Convert a list of FRED records to the dataframe type defined by the return format.
+
+    If the records are from a response of the response cache, the conversion is cached with it.
+
+    Parameters
+    ----------
+    data : list[dict]
+        Records from a FRED api endpoint response.
+    return_format : ReturnFormat
+        Dataframe type to convert the records to.
+    columns : List[str] | None, optional
+        Columns to convert, in this order. Each must be a field of the records. Defaults to None,
+        i.e. every field.
+    categorical : bool, optional
+        If `True`, string columns where most values repeat are categorical. Arrow tables are always
+        dictionary encoded. Defaults to False.
+
+    Returns
+    -------
+    pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table
+
+    Raises
+    ------
+    ValueError
+        If one of the columns is not a field of the records.
+
+    """
+    if columns is not None and data:
+        _check_columns(columns, _record_fields(data, columns), "The response")
+    conversion = (
+        return_format,
+        None if columns is None else tuple(columns),
+        categorical,
+    )
+    if return_format == ReturnFormat.pandas:
+        return _convert_cached(
+            data, conversion, lambda: _convert_to_pandas(data, columns, categorical)
+        )
+    if return_format == ReturnFormat.polars:
+        return _convert_cached(
+            data, conversion, lambda: _convert_to_polars(data, columns, categorical)
+        )
+    if return_format == ReturnFormat.polars_lazy:
+        # A lazyframe is a plan that parses the columns when it is collected, so it is not cached.
+        return _convert_to_polars_lazy(data, columns, categorical)
+    if return_format == ReturnFormat.arrow:
+        return _convert_cached(
+            data, conversion, lambda: _convert_to_arrow(data, columns)
+        )
+    if return_format == ReturnFormat.numpy:
+        raise ValueError(
+            "The 'numpy' return format is only available for series observations."
+        )
+    raise ValueError(f"Cannot convert records to return format '{return_format}'.")
+
+
+def _convert_observations(
+    data: list[dict],
+    return_format: ReturnFormat,
+    columns: Optional[List[str]] = None,
+    realtime: bool = False,
+):
+    """Convert the records of a `series/observations` response to the type defined by the return format.
+
+    Parameters
+    ----------
+    data : list[dict]
+        Observations of a `series/observations` response.
+    return_format : ReturnFormat
+        Dataframe or array type to convert the observations to.
+    columns : List[str] | None, optional
+        Columns to convert, in this order. Defaults to None, i.e. every field.
+    realtime : bool, optional
+        If `True`, numpy arrays include the realtime fields. Defaults to False.
+
+    Returns
+    -------
+    pd.DataFrame | pl.DataFrame | pl.LazyFrame | pa.Table | np.ndarray
+
+    """
+    if return_format == ReturnFormat.numpy:
+        return _convert_cached(
+            data,
+            (return_format, None if columns is None else tuple(columns), realtime),
+            lambda: _convert_to_numpy(data, realtime, columns),
+        )
+    return _convert_records(data, return_format, columns)
@@ -8,4 +8,7 @@ class ReturnFormat(str, Enum):
 
     pandas = "pandas"
     polars = "polars"
+    polars_lazy = "polars_lazy"
+    arrow = "arrow"
+    numpy = "numpy"
     json = "json"
@@ -1,9 +1,13 @@
 import os
 import time
+from types import SimpleNamespace
 from typing import Dict, Optional
 
 import pytest
 import requests
+from vcr.serializers import yamlserializer
+
+import pyfredapi as pf
 
 api_key = os.environ.get("FRED_API_KEY")
 
@@ -43,6 +47,16 @@ def slow_down_tests(runslow):
         time.sleep(0.5)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def rate_limiter(runslow):
+    # Cassettes are replayed locally, so only throttle requests when running against FRED.
+    previous = pf.get_rate_limiter()
+    if not runslow:
+        pf.set_rate_limiter(None)
+    yield pf.get_rate_limiter()
+    pf.set_rate_limiter(previous)
+
+
 def get_request(
     endpoint: str,
     extra_params: Optional[Dict[str, str]] = None,
@@ -70,3 +84,22 @@ def vcr_config():
 def vcr_cassette_dir(request):
     # Put all cassettes in vhs/{module}/{test}.yaml
     return os.path.join("tests/vhs", request.module.__name__.split(".")[-1])
+
+
+def deserialize_decoded_cassette(cassette_string):
+    # The recorded response bodies are stored decoded, so clients that honor the
+    # Content-Encoding header (like httpx) would try to decompress them again.
+    cassette = yamlserializer.deserialize(cassette_string)
+    for interaction in cassette.get("interactions", []):
+        interaction["response"]["headers"].pop("Content-Encoding", None)
+    return cassette
+
+
+def pytest_recording_configure(config, vcr):
+    vcr.register_serializer(
+        "yaml",
+        SimpleNamespace(
+            serialize=yamlserializer.serialize,
+            deserialize=deserialize_decoded_cassette,
+        ),
+    )
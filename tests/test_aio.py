@@ -0,0 +1,153 @@
+import asyncio
+import inspect
+import os
+import threading
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+import pyfredapi as pf
+import pyfredapi.aio as pfa
+from pyfredapi.maps import GeoseriesData
+from pyfredapi.series import SeriesInfo
+
+vhs = os.path.join(os.path.dirname(__file__), "vhs")
+series_cassettes = os.path.join(vhs, "test_series")
+
+
+@pytest.mark.parametrize(
+    "module", [pf.category, pf.maps, pf.releases, pf.series, pf.sources, pf.tags]
+)
+def test_mirrors_public_functions(module):
+    public_functions = [
+        name
+        for name, obj in vars(module).items()
+        if inspect.isfunction(obj)
+        and obj.__module__ == module.__name__
+        and name.startswith(("get_", "search_", "iter_"))
+    ]
+    assert public_functions
+    for name in public_functions:
+        if name.startswith("iter_"):
+            assert inspect.isasyncgenfunction(getattr(pfa, name)), name
+        else:
+            assert asyncio.iscoroutinefunction(getattr(pfa, name)), name
+
+
+@pytest.mark.vcr(os.path.join(series_cassettes, "test_get_series[pandas].yaml"))
+def test_get_series():
+    actual = asyncio.run(pfa.get_series(series_id="GDP"))
+    assert isinstance(actual, pd.DataFrame)
+    assert {"date", "value", "realtime_start", "realtime_end"} == set(actual.columns)
+    assert pd.api.types.is_float_dtype(actual["value"])
+
+
+@pytest.mark.vcr(
+    os.path.join(series_cassettes, "test_get_series_info.yaml"),
+    os.path.join(series_cassettes, "test_get_series_tags.yaml"),
+)
+def test_concurrent_requests():
+    async def main():
+        return await asyncio.gather(
+            pfa.get_series_info(series_id="GDP"),
+            pfa.get_series_tags(series_id="GDP"),
+        )
+
+    info, tags = asyncio.run(main())
+    assert isinstance(info, SeriesInfo)
+    assert isinstance(tags, dict)
+    assert "tags" in tags
+
+
+@pytest.mark.vcr(
+    os.path.join(vhs, "test_maps", "test_get_geoseries[json].yaml"),
+    os.path.join(vhs, "test_maps", "test_get_geoseries_info.yaml"),
+)
+def test_get_geoseries():
+    actual = asyncio.run(
+        pfa.get_geoseries(
+            series_id="WIPCPI",
+            start_date="2019-01-01",
+            end_date="2021-01-01",
+            return_format="json",
+        )
+    )
+    assert isinstance(actual, GeoseriesData)
+    assert isinstance(actual.data, dict)
+
+
+def test_fredapi_request_err():
+    with pytest.raises(pf.exceptions.FredAPIRequestError):
+        asyncio.run(pfa._base._get_request(endpoint="not-a-real-endpoint"))
+
+
+def test_async_session_pool_per_event_loop():
+    pool = pfa.AsyncSessionPool(pool_size=2)
+
+    async def get_client():
+        return pool.client
+
+    async def main():
+        return await get_client(), await get_client()
+
+    first, second = asyncio.run(main())
+    assert first is second
+    assert asyncio.run(get_client()) is not first
+
+
+@pytest.fixture()
+def thread_recording(monkeypatch):
+    """Record the threads that call the blocking methods of an object."""
+    threads = []
+
+    def record(obj, name):
+        method = getattr(obj, name)
+
+        def wrapper(*args, **kwargs):
+            threads.append((name, threading.get_ident()))
+            return method(*args, **kwargs)
+
+        monkeypatch.setattr(obj, name, wrapper)
+
+    return SimpleNamespace(threads=threads, record=record)
+
+
+def test_sqlite_cache_runs_in_thread(tmp_path, monkeypatch, thread_recording):
+    from pyfredapi.aio import _base as aio_base
+
+    async def fake_get(url, params=None, timeout=30):
+        return SimpleNamespace(status_code=200, content=b'{"seriess": []}')
+
+    sqlite_cache = pf.SQLiteCache(tmp_path / "pyfredapi.sqlite")
+    thread_recording.record(sqlite_cache, "get")
+    thread_recording.record(sqlite_cache, "set")
+    monkeypatch.setattr(aio_base, "get_response_cache", lambda: sqlite_cache)
+    monkeypatch.setattr(aio_base, "get_rate_limiter", lambda: None)
+    monkeypatch.setattr(
+        aio_base, "get_session_pool", lambda: SimpleNamespace(get=fake_get)
+    )
+
+    for _ in range(2):
+        assert asyncio.run(aio_base._get_request("series")) == {"seriess": []}
+    assert [name for name, _ in thread_recording.threads] == ["get", "set", "get"]
+    assert threading.get_ident() not in {t for _, t in thread_recording.threads}
+
+
+def test_sqlite_rate_limiter_runs_in_thread(tmp_path, monkeypatch, thread_recording):
+    from pyfredapi.aio import _base as aio_base
+
+    async def fake_get(url, params=None, timeout=30):
+        return SimpleNamespace(status_code=200, content=b'{"seriess": []}')
+
+    limiter = pf.SQLiteRateLimiter(tmp_path / "rate_limit.sqlite")
+    thread_recording.record(limiter, "reserve")
+    monkeypatch.setattr(aio_base, "get_response_cache", lambda: None)
+    monkeypatch.setattr(aio_base, "get_rate_limiter", lambda: limiter)
+    monkeypatch.setattr(
+        aio_base, "get_session_pool", lambda: SimpleNamespace(get=fake_get)
+    )
+
+    assert asyncio.run(aio_base._get_request("series")) == {"seriess": []}
+    assert [name for name, _ in thread_recording.threads] == ["reserve"]
+    assert threading.get_ident() not in {t for _, t in thread_recording.threads}
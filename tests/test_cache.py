@@ -0,0 +1,441 @@
+import json
+import multiprocessing
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import pyfredapi as pf
+from pyfredapi import _base, cache
+from pyfredapi.cache import ResponseCache, _cache_key
+from pyfredapi.testing import synthetic
+from pyfredapi.utils import _convert_to_df
+
+fred_url = "https://api.stlouisfed.org/fred"
+
+
+def key(series_id: str):
+    return _cache_key(
+        "series/observations", frozenset({"series_id": series_id}.items()), fred_url
+    )
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    fake_clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(cache.time, "monotonic", lambda: fake_clock.now)
+    return fake_clock
+
+
+def test_get_and_set():
+    rc = ResponseCache()
+    assert rc.get(key("GDP")) is None
+    rc.set(key("GDP"), {"observations": []}, size=10, ttl=None)
+    assert rc.get(key("GDP")) == {"observations": []}
+
+    stats = rc.stats
+    assert (stats.hits, stats.misses, stats.entries, stats.size) == (1, 1, 1, 10)
+    assert stats.hit_rate == 0.5
+
+
+def test_ttl(clock):
+    rc = ResponseCache(ttl=10)
+    rc.set(key("GDP"), {}, size=1, ttl=rc.ttl_for("series/observations"))
+    clock.now = 9
+    assert key("GDP") in rc
+    clock.now = 10
+    assert rc.get(key("GDP")) is None
+    assert rc.stats.expirations == 1
+
+
+def test_endpoint_ttl():
+    rc = ResponseCache(ttl=10, endpoint_ttl={"shapes/file": None, "series": 0})
+    assert rc.ttl_for("shapes/file") is None
+    assert rc.ttl_for("series/observations") == 10
+
+    rc.set(key("GDP"), {}, size=1, ttl=rc.ttl_for("series"))
+    assert len(rc) == 0
+
+
+def realtime_params(**params):
+    return frozenset({"series_id": "GDP", **params}.items())
+
+
+@pytest.mark.parametrize(
+    "params, closed",
+    [
+        (None, False),
+        (realtime_params(), False),
+        (realtime_params(realtime_start="1776-07-04", realtime_end="2010-01-01"), True),
+        (
+            realtime_params(realtime_start="1776-07-04", realtime_end="9999-12-31"),
+            False,
+        ),
+        (realtime_params(realtime_end="2024-06-01"), False),
+        (realtime_params(realtime_end="2024-05-30"), True),
+        (realtime_params(vintage_dates="2001-01-01,2010-01-01"), True),
+        (realtime_params(vintage_dates="2001-01-01,2024-06-01"), False),
+        (realtime_params(realtime_end="not a date"), False),
+    ],
+)
+def test_is_closed_realtime_window(params, closed):
+    today = cache.date(2024, 6, 1)
+    assert cache._is_closed_realtime_window(params, today=today) is closed
+
+
+def test_realtime_aware_ttl():
+    closed = realtime_params(realtime_start="1776-07-04", realtime_end="2010-01-01")
+    live = realtime_params(realtime_start="1776-07-04", realtime_end="9999-12-31")
+
+    rc = ResponseCache(ttl=10, endpoint_ttl={"series/vintagedates": 0})
+    assert rc.ttl_for("series/observations", closed) is None
+    assert rc.ttl_for("series/observations", live) == 10
+    assert rc.ttl_for("series/vintagedates", closed) == 0
+
+    rc = ResponseCache(ttl=10, closed_window_ttl=86400)
+    assert rc.ttl_for("series/observations", closed) == 86400
+
+    rc = ResponseCache(ttl=10, realtime_aware=False)
+    assert rc.ttl_for("series/observations", closed) == 10
+
+
+def test_lru_eviction_by_size():
+    rc = ResponseCache(max_size=25, max_entries=None)
+    rc.set(key("A"), {}, size=10, ttl=None)
+    rc.set(key("B"), {}, size=10, ttl=None)
+    rc.get(key("A"))
+    rc.set(key("C"), {}, size=10, ttl=None)
+
+    assert key("A") in rc
+    assert key("B") not in rc
+    assert key("C") in rc
+    assert rc.stats.evictions == 1
+    assert rc.stats.size == 20
+
+
+def test_lfu_eviction_by_entries():
+    rc = ResponseCache(max_entries=2, policy="lfu")
+    rc.set(key("A"), {}, size=1, ttl=None)
+    rc.set(key("B"), {}, size=1, ttl=None)
+    rc.get(key("A"))
+    rc.get(key("A"))
+    rc.get(key("B"))
+    rc.set(key("C"), {}, size=1, ttl=None)
+
+    assert key("A") in rc
+    assert key("B") in rc
+    assert key("C") not in rc
+
+
+def test_oversized_response_not_cached():
+    rc = ResponseCache(max_size=5)
+    rc.set(key("GDP"), {}, size=6, ttl=None)
+    assert len(rc) == 0
+
+
+def test_invalid_policy_err():
+    with pytest.raises(ValueError):
+        ResponseCache(policy="fifo")
+
+
+def test_invalidate():
+    rc = ResponseCache()
+    rc.set(key("GDP"), {}, size=1, ttl=None)
+    rc.set(key("CPIAUCSL"), {}, size=1, ttl=None)
+    rc.set(_cache_key("series", None, fred_url), {}, size=1, ttl=None)
+
+    assert rc.invalidate("series/observations", {"series_id": "GDP"}) == 1
+    assert key("GDP") not in rc
+    assert rc.invalidate("series/observations") == 1
+    assert len(rc) == 1
+    assert rc.invalidate() == 1
+    assert rc.stats.size == 0
+
+
+fake_response = SimpleNamespace(
+    status_code=200, content=b'{"seriess": []}', json=lambda: {"seriess": []}
+)
+
+
+class CountingPool(SimpleNamespace):
+    calls = 0
+
+    def get(self, url, params=None, timeout=30):  # noqa: D102
+        self.calls += 1
+        return fake_response
+
+
+def test_get_request_uses_cache(monkeypatch):
+    pool = CountingPool()
+    rc = ResponseCache()
+    monkeypatch.setattr(_base, "get_session_pool", lambda: pool)
+    monkeypatch.setattr(_base, "get_response_cache", lambda: rc)
+
+    params = frozenset({"series_id": "GDP"}.items())
+    first = _base._get_request(endpoint="series", params=params)
+    second = _base._get_request(endpoint="series", params=params)
+
+    assert first == second == {"seriess": []}
+    assert pool.calls == 1
+    assert rc.stats.size == len(fake_response.content)
+
+
+def test_get_request_closed_window_never_expires(monkeypatch, clock):
+    pool = CountingPool()
+    rc = ResponseCache(ttl=10)
+    monkeypatch.setattr(_base, "get_session_pool", lambda: pool)
+    monkeypatch.setattr(_base, "get_response_cache", lambda: rc)
+
+    closed = realtime_params(realtime_start="1776-07-04", realtime_end="2010-01-01")
+    _base._get_request(endpoint="series/observations", params=closed)
+    _base._get_request(endpoint="series/observations", params=realtime_params())
+    clock.now = 1e9
+    _base._get_request(endpoint="series/observations", params=closed)
+    _base._get_request(endpoint="series/observations", params=realtime_params())
+
+    assert pool.calls == 3
+
+
+def test_get_request_without_cache(monkeypatch):
+    pool = CountingPool()
+    monkeypatch.setattr(_base, "get_session_pool", lambda: pool)
+    monkeypatch.setattr(_base, "get_response_cache", lambda: None)
+
+    _base._get_request(endpoint="series")
+    _base._get_request(endpoint="series")
+    assert pool.calls == 2
+
+
+def test_configure_response_cache():
+    previous = cache.get_response_cache()
+    try:
+        rc = cache.configure_response_cache(max_size=100, policy="lfu")
+        assert cache.get_response_cache() is rc
+        cache.set_response_cache(None)
+        assert cache.get_response_cache() is None
+    finally:
+        cache.set_response_cache(previous)
+
+
+def test_frames():
+    rc = ResponseCache()
+    response = {"observations": [{"date": "2020-01-01", "value": "1"}]}
+    records = response["observations"]
+    rc.set(key("GDP"), response, size=10, ttl=None)
+
+    assert rc.get_frame(records, "pandas") is None
+    assert rc.set_frame(records, "pandas", "frame", size=5)
+    assert rc.get_frame(records, "pandas") == "frame"
+    assert not rc.set_frame(list(records), "pandas", "frame", size=5)
+    assert rc.get_frame(list(records), "pandas") is None
+
+    stats = rc.stats
+    assert (stats.frame_hits, stats.frame_misses, stats.size) == (1, 1, 15)
+
+    rc.invalidate("series/observations")
+    assert rc.get_frame(records, "pandas") is None
+    assert rc.stats.size == 0
+
+
+def test_frames_evicted_with_response():
+    rc = ResponseCache(max_size=100)
+    response = {"observations": []}
+    rc.set(key("GDP"), response, size=10, ttl=None)
+    rc.set_frame(response["observations"], "pandas", "frame", size=95)
+    assert len(rc) == 0
+    assert rc.stats.size == 0
+
+
+def test_frames_disabled():
+    rc = ResponseCache(cache_frames=False)
+    response = {"observations": []}
+    rc.set(key("GDP"), response, size=10, ttl=None)
+    assert not rc.set_frame(response["observations"], "pandas", "frame", size=5)
+
+
+@pytest.fixture()
+def observations_pool(monkeypatch):
+    body = json.dumps(synthetic.observations(50)).encode()
+    pool = CountingPool()
+    pool.get = lambda url, params=None, timeout=30: SimpleNamespace(
+        status_code=200, content=body
+    )
+    rc = ResponseCache()
+    monkeypatch.setattr(_base, "get_session_pool", lambda: pool)
+    monkeypatch.setattr(_base, "get_response_cache", lambda: rc)
+    monkeypatch.setattr(_base, "get_rate_limiter", lambda: None)
+    return rc
+
+
+def test_get_series_reuses_frames(observations_pool, monkeypatch):
+    first = pf.get_series("SYN")
+    array = pf.get_series("SYN", return_format="numpy")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Cached conversions must not be converted again.")
+
+    monkeypatch.setattr(_convert_to_df, "_convert_to_pandas", fail)
+    monkeypatch.setattr(_convert_to_df, "_convert_to_numpy", fail)
+    first.loc[0, "value"] = -1.0
+    array["value"][0] = -1.0
+
+    second = pf.get_series("SYN")
+    assert second is not first
+    assert second.loc[0, "value"] != -1.0
+    assert pf.get_series("SYN", return_format="numpy")["value"][0] != -1.0
+    assert observations_pool.stats.frame_hits == 2
+
+    with pytest.raises(AssertionError):
+        pf.get_series("SYN", columns=["date", "value"])
+
+
+@pytest.fixture()
+def sqlite_cache(tmp_path):
+    sc = cache.SQLiteCache(tmp_path / "pyfredapi.sqlite")
+    yield sc
+    sc.close()
+
+
+def test_sqlite_get_and_set(sqlite_cache):
+    content = b'{"observations": [{"date": "2020-01-01", "value": "1.0"}]}'
+    assert sqlite_cache.get(key("GDP")) is None
+    sqlite_cache.set(key("GDP"), {}, size=len(content), ttl=None, content=content)
+
+    assert sqlite_cache.get(key("GDP")) == {
+        "observations": [{"date": "2020-01-01", "value": "1.0"}]
+    }
+    stats = sqlite_cache.stats
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+def test_sqlite_serializes_value_without_content(sqlite_cache):
+    sqlite_cache.set(key("GDP"), {"seriess": [1, 2]}, size=0, ttl=None)
+    assert sqlite_cache.get(key("GDP")) == {"seriess": [1, 2]}
+
+
+def test_sqlite_uncompressed(tmp_path):
+    sc = cache.SQLiteCache(tmp_path / "pyfredapi.sqlite", compress=False)
+    sc.set(key("GDP"), {}, size=2, ttl=None, content=b"{}")
+    assert sc.stats.size == 2
+    assert sc.get(key("GDP")) == {}
+
+
+def test_sqlite_ttl(sqlite_cache, monkeypatch):
+    now = SimpleNamespace(time=1000.0)
+    monkeypatch.setattr(cache.time, "time", lambda: now.time)
+
+    sqlite_cache.set(key("GDP"), {}, size=2, ttl=10, content=b"{}")
+    assert key("GDP") in sqlite_cache
+    now.time = 1010.0
+    assert sqlite_cache.get(key("GDP")) is None
+    assert sqlite_cache.stats.expirations == 1
+
+
+def test_sqlite_eviction(tmp_path):
+    sc = cache.SQLiteCache(tmp_path / "pyfredapi.sqlite", max_size=25, compress=False)
+    sc.set(key("A"), {}, size=10, ttl=None, content=b"[" + b" " * 8 + b"]")
+    sc.set(key("B"), {}, size=10, ttl=None, content=b"[" + b" " * 8 + b"]")
+    sc.get(key("A"))
+    sc.set(key("C"), {}, size=10, ttl=None, content=b"[" + b" " * 8 + b"]")
+
+    assert key("A") in sc
+    assert key("B") not in sc
+    assert key("C") in sc
+    assert sc.stats.evictions == 1
+
+
+def test_sqlite_size_is_a_running_total(tmp_path):
+    sc = cache.SQLiteCache(tmp_path / "pyfredapi.sqlite", max_size=25, compress=False)
+    statements = []
+    sc._connection().set_trace_callback(statements.append)
+    for name, content in [("A", b"[1]"), ("B", b"[22]"), ("A", b"[333]")]:
+        sc.set(key(name), {}, size=len(content), ttl=None, content=content)
+    # Writes under the maximum size do not scan the table.
+    assert not [s for s in statements if "SUM(" in s or "ORDER BY" in s]
+
+    def total():
+        return sc._connection().execute("SELECT SUM(size) FROM responses").fetchone()[0]
+
+    assert sc.stats.size == total() == 9
+    sc.set(key("C"), {}, size=20, ttl=None, content=b"[" + b" " * 18 + b"]")
+    assert sc.stats.evictions == 1
+    assert sc.stats.size == total() == 25
+    sc.invalidate("series/observations", {"series_id": "A"})
+    assert sc.stats.size == total() == 20
+    sc.clear()
+    assert sc.stats.size == 0
+
+    # A cache opened on an existing database keeps the same total.
+    sc.set(key("D"), {}, size=3, ttl=None, content=b"[4]")
+    assert cache.SQLiteCache(sc.path).stats.size == 3
+
+
+def test_sqlite_hits_are_read_only(tmp_path, monkeypatch):
+    now = SimpleNamespace(time=1000.0)
+    monkeypatch.setattr(cache.time, "time", lambda: now.time)
+    sc = cache.SQLiteCache(tmp_path / "pyfredapi.sqlite", compress=False)
+    sc.set(key("A"), {}, size=2, ttl=None, content=b"{}")
+
+    def fail():
+        raise AssertionError("Cache hits must not write to the database.")
+
+    now.time = 2000.0
+    with monkeypatch.context() as m:
+        m.setattr(sc, "_transaction", fail)
+        assert sc.get(key("A")) == {}
+
+    def accessed_at():
+        query = "SELECT accessed_at FROM responses"
+        return sc._connection().execute(query).fetchone()[0]
+
+    assert accessed_at() == 1000.0
+    sc.close()
+    assert accessed_at() == 2000.0
+
+
+def test_sqlite_invalidate(sqlite_cache):
+    for series_id in ["GDP", "CPIAUCSL"]:
+        sqlite_cache.set(key(series_id), {}, size=2, ttl=None, content=b"{}")
+
+    assert sqlite_cache.invalidate("series/observations", {"series_id": "GDP"}) == 1
+    assert key("GDP") not in sqlite_cache
+    assert key("CPIAUCSL") in sqlite_cache
+    assert sqlite_cache.invalidate() == 1
+    assert len(sqlite_cache) == 0
+
+
+def _write_to_sqlite_cache(path, series_id):
+    sc = cache.SQLiteCache(path)
+    sc.set(key(series_id), {"id": series_id}, size=0, ttl=None)
+
+
+def test_sqlite_shared_across_processes(sqlite_cache):
+    ctx = multiprocessing.get_context("spawn")
+    processes = [
+        ctx.Process(target=_write_to_sqlite_cache, args=(sqlite_cache.path, sid))
+        for sid in ["GDP", "UNRATE"]
+    ]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+
+    assert all(p.exitcode == 0 for p in processes)
+    assert sqlite_cache.get(key("UNRATE")) == {"id": "UNRATE"}
+    assert len(sqlite_cache) == 2
+
+
+def test_sqlite_shared_across_threads(sqlite_cache):
+    threads = [
+        threading.Thread(
+            target=sqlite_cache.set,
+            kwargs=dict(key=key(str(i)), value={"i": i}, size=0, ttl=None),
+        )
+        for i in range(16)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(sqlite_cache) == 16
@@ -0,0 +1,130 @@
+import inspect
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import pyfredapi as pf
+from pyfredapi import _base, category, maps, releases, series, sources, tags
+from pyfredapi.exceptions import InvalidAPIKey
+
+key_a = "a" * 32
+key_b = "b" * 32
+total = 2345
+
+
+class FakePool:
+    """Session pool that serves pages of release series and records the requests."""
+
+    pool_size = 4
+
+    def __init__(self):  # noqa: D107
+        self.requests = []
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def get(self, url, params=None, timeout=30):  # noqa: D102
+        with self.lock:
+            self.requests.append(params)
+        limit = params.get("limit", 1000)
+        offset = params.get("offset", 0)
+        body = {
+            "count": total,
+            "offset": offset,
+            "limit": limit,
+            "seriess": [
+                {"id": f"S{i}"} for i in range(offset, min(offset + limit, total))
+            ],
+        }
+        return SimpleNamespace(status_code=200, content=json.dumps(body).encode())
+
+    def close(self):  # noqa: D102
+        self.closed = True
+
+
+@pytest.fixture()
+def no_global_pool(monkeypatch):
+    def fail():
+        raise AssertionError("The global session pool must not be used.")
+
+    monkeypatch.setattr(_base, "get_session_pool", fail)
+
+
+def client(api_key, **kwargs):
+    return pf.FredClient(api_key, session_pool=FakePool(), rate_limiter=None, **kwargs)
+
+
+def test_clients_use_their_own_key_and_pool(no_global_pool):
+    client_a, client_b = client(key_a), client(key_b)
+
+    client_a.get_release_series(51, limit=10)
+    client_b.get_release_series(51, limit=10)
+
+    assert [r["api_key"] for r in client_a.session_pool.requests] == [key_a]
+    assert [r["api_key"] for r in client_b.session_pool.requests] == [key_b]
+
+
+def test_clients_use_their_own_cache(no_global_pool):
+    client_a, client_b = client(key_a), client(key_b, cache=None)
+
+    for _ in range(2):
+        client_a.get_release_series(51, limit=10)
+        client_b.get_release_series(51, limit=10)
+
+    assert len(client_a.session_pool.requests) == 1
+    assert len(client_b.session_pool.requests) == 2
+    assert client_a.cache.stats.hits == 1
+    assert client_b.cache is None
+
+
+def test_api_key_argument_overrides_client_key():
+    fred = client(key_a)
+    fred.get_release_series(51, api_key=key_b, limit=10)
+    assert fred.session_pool.requests[0]["api_key"] == key_b
+
+
+def test_client_paginate(no_global_pool):
+    fred = client(key_a)
+    response = fred.get_release_series(51, paginate=True)
+
+    assert len(response["seriess"]) == total
+    assert len(fred.session_pool.requests) == 3
+    assert {r["api_key"] for r in fred.session_pool.requests} == {key_a}
+
+
+def test_client_iter_method(no_global_pool):
+    fred = client(key_a)
+    series_ids = fred.iter_release_series(51)
+    assert fred.session_pool.requests == []
+
+    assert [s["id"] for s in series_ids] == [f"S{i}" for i in range(total)]
+    assert len(fred.session_pool.requests) == 3
+    # The client is not active outside of its methods.
+    assert _base._client_context.get() is None
+
+
+def test_client_invalid_api_key_err():
+    with pytest.raises(InvalidAPIKey):
+        pf.FredClient("not-a-key")
+
+
+def test_client_context_manager_closes_pool():
+    with client(key_a) as fred:
+        pool = fred.session_pool
+    assert pool.closed
+
+
+@pytest.mark.parametrize("module", [category, maps, releases, series, sources, tags])
+def test_client_has_every_endpoint(module):
+    endpoints = [
+        name
+        for name, fn in inspect.getmembers(module, inspect.isfunction)
+        if fn.__module__ == module.__name__
+        and name.startswith(("get_", "iter_", "search_"))
+    ]
+    assert endpoints
+    for name in endpoints:
+        method = getattr(pf.FredClient, name)
+        assert method.__doc__ == getattr(module, name).__doc__
+        assert list(inspect.signature(method).parameters)[0] == "self"
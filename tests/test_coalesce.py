@@ -0,0 +1,155 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from pyfredapi import _base
+from pyfredapi.coalesce import RequestCoalescer
+
+callers = 8
+gdp = frozenset({"series_id": "GDP"}.items())
+
+
+class BlockingPool:
+    """Session pool whose requests block until they are released."""
+
+    def __init__(self, status_code=200):  # noqa: D107
+        self.status_code = status_code
+        self.calls = 0
+        self.lock = threading.Lock()
+        self.release = threading.Event()
+
+    def get(self, url, params=None, timeout=30):  # noqa: D102
+        with self.lock:
+            self.calls += 1
+        self.release.wait(5)
+        content = json.dumps({"id": params.get("series_id")}).encode()
+        return SimpleNamespace(
+            status_code=self.status_code,
+            content=content,
+            json=lambda: {"error_message": "Bad Request."},
+            headers={},
+            reason="",
+        )
+
+
+@pytest.fixture()
+def coalescer(monkeypatch):
+    coalescer = RequestCoalescer()
+    monkeypatch.setattr(_base, "get_request_coalescer", lambda: coalescer)
+    monkeypatch.setattr(_base, "get_response_cache", lambda: None)
+    monkeypatch.setattr(_base, "get_rate_limiter", lambda: None)
+    monkeypatch.setattr(_base, "get_retry_policy", lambda: None)
+    return coalescer
+
+
+def wait_for_waiters(coalescer, waiters):
+    deadline = time.monotonic() + 5
+    while coalescer.stats.coalesced < waiters and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def concurrent_requests(pool, params_of_caller):
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        futures = [
+            executor.submit(_base._get_request, "series", params=params_of_caller(i))
+            for i in range(callers)
+        ]
+        yield
+        pool.release.set()
+        yield [f.exception() or f.result() for f in futures]
+
+
+def test_concurrent_identical_requests_are_coalesced(monkeypatch, coalescer):
+    pool = BlockingPool()
+    monkeypatch.setattr(_base, "get_session_pool", lambda: pool)
+
+    requests = concurrent_requests(pool, lambda _: gdp)
+    next(requests)
+    wait_for_waiters(coalescer, callers - 1)
+    results = next(requests)
+
+    assert pool.calls == 1
+    assert results == [{"id": "GDP"}] * callers
+    assert (coalescer.stats.requests, coalescer.stats.coalesced) == (1, callers - 1)
+
+
+def test_coalesced_errors_are_raised_in_every_caller(monkeypatch, coalescer):
+    pool = BlockingPool(status_code=400)
+    monkeypatch.setattr(_base, "get_session_pool", lambda: pool)
+
+    requests = concurrent_requests(pool, lambda _: gdp)
+    next(requests)
+    wait_for_waiters(coalescer, callers - 1)
+    results = next(requests)
+
+    assert pool.calls == 1
+    assert all(isinstance(r, _base.FredAPIRequestError) for r in results)
+
+
+def test_different_requests_are_not_coalesced(monkeypatch, coalescer):
+    pool = BlockingPool()
+    pool.release.set()
+    monkeypatch.setattr(_base, "get_session_pool", lambda: pool)
+
+    requests = concurrent_requests(
+        pool, lambda i: frozenset({"series_id": f"S{i}"}.items())
+    )
+    next(requests)
+    results = next(requests)
+
+    assert pool.calls == callers
+    assert results == [{"id": f"S{i}"} for i in range(callers)]
+
+
+def test_coalescing_disabled(monkeypatch, coalescer):
+    pool = BlockingPool()
+    pool.release.set()
+    monkeypatch.setattr(_base, "get_session_pool", lambda: pool)
+    monkeypatch.setattr(_base, "get_request_coalescer", lambda: None)
+
+    for _ in range(2):
+        assert _base._get_request("series", params=gdp) == {"id": "GDP"}
+    assert pool.calls == 2
+
+
+def test_sequential_requests_are_not_coalesced():
+    coalescer = RequestCoalescer()
+    assert [coalescer.run("key", lambda i=i: i) for i in range(3)] == [0, 1, 2]
+    assert coalescer.stats.coalesced == 0
+
+
+def test_async_requests_are_coalesced(monkeypatch):
+    pytest.importorskip("httpx")
+    from pyfredapi.aio import _base as aio_base
+
+    calls = []
+
+    async def fake_get(url, params=None, timeout=30):
+        calls.append(params)
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(status_code=200, content=b'{"id": "GDP"}')
+
+    coalescer = RequestCoalescer()
+    monkeypatch.setattr(aio_base, "get_request_coalescer", lambda: coalescer)
+    monkeypatch.setattr(aio_base, "get_response_cache", lambda: None)
+    monkeypatch.setattr(aio_base, "get_rate_limiter", lambda: None)
+    monkeypatch.setattr(
+        aio_base, "get_session_pool", lambda: SimpleNamespace(get=fake_get)
+    )
+
+    async def main():
+        first = asyncio.ensure_future(aio_base._get_request("series", params=gdp))
+        others = [aio_base._get_request("series", params=gdp) for _ in range(4)]
+        await asyncio.sleep(0)
+        # Cancelling the first caller does not cancel the request of the others.
+        first.cancel()
+        return await asyncio.gather(*others)
+
+    assert asyncio.run(main()) == [{"id": "GDP"}] * 4
+    assert len(calls) == 1
+    assert coalescer.stats.coalesced == 4
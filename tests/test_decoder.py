@@ -0,0 +1,115 @@
+import json
+
+import pytest
+
+from pyfredapi import decoder
+
+observations = {
+    "realtime_start": "2024-01-01",
+    "realtime_end": "2024-01-01",
+    "observation_start": "1600-01-01",
+    "observation_end": "9999-12-31",
+    "units": "lin",
+    "output_type": 1,
+    "file_type": "json",
+    "order_by": "observation_date",
+    "sort_order": "asc",
+    "count": 2,
+    "offset": 0,
+    "limit": 100000,
+    "observations": [
+        {
+            "realtime_start": "2024-01-01",
+            "realtime_end": "2024-01-01",
+            "date": "1947-01-01",
+            "value": "243.164",
+        },
+        {
+            "realtime_start": "2024-01-01",
+            "realtime_end": "2024-01-01",
+            "date": "1947-04-01",
+            "value": ".",
+        },
+    ],
+}
+
+installed = [
+    "json",
+    pytest.param(
+        "orjson",
+        marks=pytest.mark.skipif(decoder.MISSING_ORJSON, reason="orjson not installed"),
+    ),
+    pytest.param(
+        "msgspec",
+        marks=pytest.mark.skipif(
+            decoder.MISSING_MSGSPEC, reason="msgspec not installed"
+        ),
+    ),
+]
+
+
+@pytest.fixture()
+def backend(request):
+    previous = decoder.get_json_backend()
+    decoder.set_json_backend(request.param)
+    yield request.param
+    decoder.set_json_backend(previous)
+
+
+@pytest.mark.parametrize("backend", installed, indirect=True)
+def test_decode_json(backend):
+    assert decoder.get_json_backend() == backend
+    content = json.dumps(observations).encode()
+    assert decoder.decode_json(content) == observations
+
+
+@pytest.mark.parametrize("backend", installed, indirect=True)
+def test_decode_keeps_unknown_fields(backend):
+    unexpected = {
+        **observations,
+        "count": "two",
+        "extra_top": 5,
+        "observations": [
+            {**obs, "GDP_2009": "1.0"} for obs in observations["observations"]
+        ],
+    }
+    content = json.dumps(unexpected).encode()
+    assert decoder.decode_json(content) == unexpected
+
+
+def test_backends_decode_equal():
+    content = json.dumps(
+        {
+            "count": 1,
+            "extra_top": 5,
+            "observations": [{**observations["observations"][0], "GDP_2009": "1.0"}],
+        }
+    ).encode()
+    expected = decoder._make_decoder("json")(content)
+    for backend in ("msgspec", "orjson"):
+        if getattr(decoder, f"MISSING_{backend.upper()}"):
+            continue
+        decode = decoder._make_decoder(backend)
+        assert decode(content) == expected
+    assert expected["extra_top"] == 5
+    assert expected["observations"][0]["GDP_2009"] == "1.0"
+
+
+def test_auto_backend():
+    previous = decoder.get_json_backend()
+    try:
+        decoder.set_json_backend("auto")
+        assert decoder.get_json_backend() == decoder._detect_backend()
+    finally:
+        decoder.set_json_backend(previous)
+
+
+def test_invalid_backend_err():
+    with pytest.raises(ValueError):
+        decoder.set_json_backend("simplejson")
+
+
+def test_missing_backend_err(monkeypatch):
+    monkeypatch.setattr(decoder, "MISSING_ORJSON", True)
+    with pytest.raises(ImportError, match="pyfredapi\\[orjson\\]"):
+        decoder.set_json_backend("orjson")
@@ -0,0 +1,227 @@
+import asyncio
+import json
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+import pyfredapi as pf
+from pyfredapi import _base
+from pyfredapi.exceptions import FredAPIRequestError
+from pyfredapi.retry import RetryPolicy
+from pyfredapi.utils._convert_to_df import _convert_to_numpy, _convert_to_pandas
+
+body = json.dumps({"seriess": [{"id": "GDP"}]}).encode()
+
+
+def response(status_code, content=body):
+    return SimpleNamespace(
+        status_code=status_code,
+        content=content,
+        json=lambda: {"error_message": "Bad Request."},
+        headers={},
+        reason="",
+    )
+
+
+class RecordingHook(pf.Hook):
+    """Keep every event."""
+
+    def __init__(self):  # noqa: D107
+        self.requests = []
+        self.conversions = []
+
+    def on_request(self, event):  # noqa: D102
+        self.requests.append(event)
+
+    def on_conversion(self, event):  # noqa: D102
+        self.conversions.append(event)
+
+
+class ScriptedPool(SimpleNamespace):
+    def get(self, url, params=None, timeout=30):  # noqa: D102
+        return self.responses.pop(0)
+
+
+@pytest.fixture()
+def recorder():
+    hook = RecordingHook()
+    pf.set_hooks([hook])
+    yield hook
+    pf.set_hooks(None)
+
+
+@pytest.fixture()
+def pool(monkeypatch):
+    pool = ScriptedPool(responses=[])
+    cache = pf.ResponseCache()
+    monkeypatch.setattr(_base, "get_session_pool", lambda: pool)
+    monkeypatch.setattr(_base, "get_response_cache", lambda: cache)
+    monkeypatch.setattr(_base, "get_rate_limiter", lambda: None)
+    monkeypatch.setattr(
+        _base, "get_retry_policy", lambda: RetryPolicy(jitter=False, backoff_factor=0)
+    )
+    return pool
+
+
+def test_request_events(recorder, pool):
+    pool.responses = [response(200)]
+    for _ in range(2):
+        _base._get_request("series", params=frozenset({"series_id": "GDP"}.items()))
+
+    miss, hit = recorder.requests
+    assert miss.endpoint == hit.endpoint == "series"
+    assert (miss.cache_hit, miss.status_code, miss.attempts) == (False, 200, 1)
+    assert miss.bytes_received == len(body)
+    assert miss.duration >= miss.latency >= 0
+    assert miss.decode_time > 0
+    assert (hit.cache_hit, hit.status_code, hit.attempts, hit.bytes_received) == (
+        True,
+        200,
+        0,
+        0,
+    )
+
+
+def test_request_event_retries(recorder, pool):
+    pool.responses = [response(503, b"<html></html>"), response(200)]
+    _base._get_request("series")
+
+    (event,) = recorder.requests
+    assert (event.attempts, event.retries, event.status_code) == (2, 1, 200)
+    assert event.bytes_received == len(body) + len(b"<html></html>")
+
+
+def test_request_event_error(recorder, pool):
+    pool.responses = [response(400)]
+    with pytest.raises(FredAPIRequestError):
+        _base._get_request("series")
+
+    (event,) = recorder.requests
+    assert event.status_code == 400
+    assert isinstance(event.error, FredAPIRequestError)
+
+
+def test_conversion_event(recorder):
+    _convert_to_pandas([{"date": "2020-01-01", "value": "1.0"}] * 3)
+
+    (event,) = recorder.conversions
+    assert (event.return_format, event.rows, event.columns) == ("pandas", 3, 2)
+    assert event.duration > 0
+
+
+def test_conversion_event_numpy(recorder):
+    _convert_to_numpy([{"date": "2020-01-01", "value": "1.0"}] * 3, realtime=True)
+
+    (event,) = recorder.conversions
+    assert (event.return_format, event.rows, event.columns) == ("numpy", 3, 4)
+
+
+def test_no_event_without_hooks(monkeypatch, pool):
+    def fail(*args, **kwargs):
+        raise AssertionError("No event must be created without hooks.")
+
+    monkeypatch.setattr(_base, "RequestEvent", fail)
+    pool.responses = [response(200)]
+    assert _base._get_request("series") == {"seriess": [{"id": "GDP"}]}
+
+
+def test_broken_hook_does_not_break_request(recorder, pool, caplog):
+    class BrokenHook(pf.Hook):
+        def on_request(self, event):  # noqa: D102
+            raise RuntimeError("broken")
+
+    pf.add_hook(BrokenHook())
+    pool.responses = [response(200)]
+    assert _base._get_request("series") == {"seriess": [{"id": "GDP"}]}
+    assert len(recorder.requests) == 1
+    assert "failed on a request event" in caplog.text
+
+
+def test_add_remove_hook():
+    hook = pf.add_hook(pf.Hook())
+    assert pf.get_hooks() == (hook,)
+    pf.remove_hook(hook)
+    assert pf.get_hooks() == ()
+    with pytest.raises(ValueError):
+        pf.remove_hook(hook)
+
+
+def test_logging_hook(pool, caplog):
+    pf.set_hooks([pf.LoggingHook(level=logging.INFO)])
+    try:
+        pool.responses = [response(200)]
+        with caplog.at_level(logging.INFO, logger="pyfredapi"):
+            _base._get_request("series")
+            _convert_to_pandas([{"value": "1"}])
+    finally:
+        pf.set_hooks(None)
+
+    assert "GET series status=200 cache=miss attempts=1" in caplog.text
+    assert "convert pandas rows=1 columns=1" in caplog.text
+
+
+def test_prometheus_hook(pool):
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    pf.set_hooks([pf.PrometheusHook(registry=registry)])
+    try:
+        pool.responses = [response(503), response(200)]
+        for _ in range(2):
+            _base._get_request("series")
+    finally:
+        pf.set_hooks(None)
+
+    def sample(name, **labels):
+        return registry.get_sample_value(name, labels)
+
+    labels = {"endpoint": "series", "status": "200"}
+    assert sample("pyfredapi_requests_total", cache="miss", **labels) == 1
+    assert sample("pyfredapi_requests_total", cache="hit", **labels) == 1
+    assert sample("pyfredapi_retries_total", endpoint="series") == 1
+    assert sample("pyfredapi_network_latency_seconds_count", endpoint="series") == 1
+
+
+def test_opentelemetry_hook(pool):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    pf.set_hooks([pf.OpenTelemetryHook(tracer=provider.get_tracer("test"))])
+    try:
+        pool.responses = [response(400)]
+        with pytest.raises(FredAPIRequestError):
+            _base._get_request("series")
+    finally:
+        pf.set_hooks(None)
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "GET series"
+    assert span.attributes["http.response.status_code"] == 400
+    assert span.attributes["pyfredapi.cache"] == "miss"
+    assert not span.status.is_ok
+    assert span.end_time >= span.start_time
+
+
+def test_async_request_event(recorder, monkeypatch):
+    pytest.importorskip("httpx")
+    from pyfredapi.aio import _base as aio_base
+
+    async def fake_get(url, params=None, timeout=30):
+        return response(200)
+
+    monkeypatch.setattr(aio_base, "get_response_cache", lambda: None)
+    monkeypatch.setattr(aio_base, "get_rate_limiter", lambda: None)
+    monkeypatch.setattr(
+        aio_base, "get_session_pool", lambda: SimpleNamespace(get=fake_get)
+    )
+
+    asyncio.run(aio_base._get_request("series"))
+    (event,) = recorder.requests
+    assert (event.cache_hit, event.status_code, event.attempts) == (False, 200, 1)
@@ -0,0 +1,61 @@
+import subprocess
+import sys
+
+import pytest
+
+import pyfredapi as pf
+import pyfredapi.aio as pfa
+
+heavy_modules = ["pandas", "polars", "plotly", "numpy", "httpx"]
+
+
+def imported_modules(code):
+    """Return the heavy modules imported after running `code` in a fresh interpreter."""
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            f"import sys\n{code}\nprint(' '.join(m for m in {heavy_modules!r} if m in sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.split()
+
+
+def test_import_does_not_load_dependencies():
+    modules = imported_modules("import pyfredapi")
+    assert modules == []
+
+
+def test_json_request_functions_do_not_load_dataframes():
+    code = "import pyfredapi as pf\npf.get_series\npf.search_series\npf.get_geoseries\npf.FredClient"
+    assert imported_modules(code) == []
+
+
+def test_aio_import_does_not_load_dependencies():
+    assert imported_modules("import pyfredapi.aio") == []
+
+
+@pytest.mark.parametrize("package", [pf, pfa])
+def test_lazy_attributes(package):
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+    assert set(package.__all__) <= set(dir(package))
+
+
+def test_lazy_submodules():
+    assert pf.series.get_series is pf.get_series
+    assert pf.__version__
+
+
+def test_hooks_submodule():
+    # The submodule is only reachable through the lazy __getattr__ in a fresh interpreter.
+    assert imported_modules("import pyfredapi as pf\npf.hooks.get_hooks") == []
+    assert "hooks" in dir(pf)
+
+
+def test_unknown_attribute_err():
+    with pytest.raises(AttributeError):
+        pf.not_a_function  # noqa: B018
@@ -0,0 +1,158 @@
+import asyncio
+import threading
+
+import pandas as pd
+import pytest
+
+import pyfredapi as pf
+from pyfredapi import _pagination
+
+total = 2345
+
+
+class FakeFred:
+    """Serve `total` series in pages, like the FRED listing endpoints."""
+
+    def __init__(self):  # noqa: D107
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def page(self, endpoint, api_key=None, params=None, base_url=None):
+        """Return the page at the offset of the request."""
+        params = dict(params)
+        with self.lock:
+            self.requests.append(params)
+        limit = params.get("limit", 1000)
+        offset = params.get("offset", 0)
+        return {
+            "count": total,
+            "offset": offset,
+            "limit": limit,
+            "seriess": [
+                {"id": f"S{i}", "title": f"Series {i}"}
+                for i in range(offset, min(offset + limit, total))
+            ],
+        }
+
+    async def async_page(self, *args, **kwargs):
+        """Return the page at the offset of the request."""
+        return self.page(*args, **kwargs)
+
+
+@pytest.fixture()
+def fake_fred(monkeypatch):
+    fred = FakeFred()
+    monkeypatch.setattr(_pagination, "_get_request", fred.page)
+    return fred
+
+
+def test_page_offsets():
+    assert list(_pagination._page_offsets({"count": 10, "limit": 4})) == [4, 8]
+    assert list(_pagination._page_offsets({"count": 3, "limit": 4})) == []
+    first_page = {"count": 10, "limit": 4, "offset": 2}
+    assert list(_pagination._page_offsets(first_page)) == [6]
+
+
+def test_get_all_pages(fake_fred):
+    response = _pagination._get_all_pages(
+        endpoint="release/series",
+        records_key="seriess",
+        params=frozenset({"release_id": 51}.items()),
+    )
+
+    assert [s["id"] for s in response["seriess"]] == [f"S{i}" for i in range(total)]
+    assert response["count"] == response["limit"] == total
+    assert sorted(r.get("offset", 0) for r in fake_fred.requests) == [0, 1000, 2000]
+    assert all(r["limit"] == 1000 and r["release_id"] == 51 for r in fake_fred.requests)
+
+
+def test_get_all_pages_page_size(fake_fred):
+    response = _pagination._get_all_pages(
+        endpoint="release/series",
+        records_key="seriess",
+        params=frozenset({"limit": 500}.items()),
+    )
+    assert len(response["seriess"]) == total
+    assert len(fake_fred.requests) == 5
+
+
+def test_get_all_pages_single_page(fake_fred):
+    response = _pagination._get_all_pages(
+        endpoint="release/series",
+        records_key="seriess",
+        params=frozenset({"limit": 5000}.items()),
+    )
+    assert len(response["seriess"]) == total
+    assert len(fake_fred.requests) == 1
+
+
+@pytest.mark.parametrize("return_format", ["pandas", "polars"])
+def test_get_release_series_paginate(fake_fred, return_format):
+    df = pf.get_release_series(51, return_format=return_format, paginate=True)
+    assert len(df) == total
+    if return_format == "pandas":
+        assert isinstance(df, pd.DataFrame)
+        assert df["id"].is_unique
+
+
+def test_async_get_all_pages(monkeypatch):
+    pytest.importorskip("httpx")
+    from pyfredapi.aio import _pagination as aio_pagination
+
+    fred = FakeFred()
+    monkeypatch.setattr(aio_pagination, "_get_request", fred.async_page)
+
+    response = asyncio.run(
+        aio_pagination._get_all_pages(endpoint="tags/series", records_key="seriess")
+    )
+    assert [s["id"] for s in response["seriess"]] == [f"S{i}" for i in range(total)]
+    assert len(fred.requests) == 3
+
+
+def test_iter_release_series(fake_fred):
+    series = pf.iter_release_series(51)
+    assert fake_fred.requests == []
+
+    assert [s["id"] for s in series] == [f"S{i}" for i in range(total)]
+    assert len(fake_fred.requests) == 3
+
+
+@pytest.mark.parametrize("prefetch", [0, 1])
+def test_iter_pages_is_lazy(fake_fred, prefetch):
+    pages = _pagination._iter_pages(
+        endpoint="tags/series",
+        params=frozenset({"limit": 100}.items()),
+        prefetch=prefetch,
+    )
+    next(pages)
+    next(pages)
+    pages.close()
+
+    # The first two pages, and at most `prefetch` pages ahead of the consumer.
+    assert 2 <= len(fake_fred.requests) <= 2 + prefetch
+
+
+def test_iter_pages_invalid_prefetch_err(fake_fred):
+    with pytest.raises(ValueError):
+        next(_pagination._iter_pages(endpoint="tags/series", prefetch=-1))
+
+
+def test_iter_search_series_pandas(fake_fred):
+    pages = list(pf.iter_search_series("gdp", return_format="pandas"))
+    assert [len(df) for df in pages] == [1000, 1000, 345]
+    assert all(isinstance(df, pd.DataFrame) for df in pages)
+
+
+def test_async_iter_pages(monkeypatch):
+    pytest.importorskip("httpx")
+    import pyfredapi.aio as pfa
+    from pyfredapi.aio import _pagination as aio_pagination
+
+    fred = FakeFred()
+    monkeypatch.setattr(aio_pagination, "_get_request", fred.async_page)
+
+    async def collect():
+        return [s["id"] async for s in pfa.iter_series_matching_tags("usa")]
+
+    assert asyncio.run(collect()) == [f"S{i}" for i in range(total)]
+    assert len(fred.requests) == 3
@@ -0,0 +1,151 @@
+import asyncio
+import multiprocessing
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from pyfredapi import _base, rate_limit
+from pyfredapi.rate_limit import RateLimiter, SQLiteRateLimiter
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    fake_clock = SimpleNamespace(now=1000.0, slept=[])
+
+    def sleep(seconds):
+        fake_clock.slept.append(seconds)
+        fake_clock.now += seconds
+
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: fake_clock.now)
+    monkeypatch.setattr(rate_limit.time, "time", lambda: fake_clock.now)
+    monkeypatch.setattr(rate_limit.time, "sleep", sleep)
+    return fake_clock
+
+
+@pytest.mark.parametrize("rate, burst", [(0, 1), (-1, 1), (1, 0)])
+def test_invalid_limits_err(rate, burst):
+    with pytest.raises(ValueError):
+        RateLimiter(rate=rate, burst=burst)
+
+
+def test_burst_then_rate(clock):
+    limiter = RateLimiter(rate=2, burst=3)
+    assert [limiter.acquire() for _ in range(3)] == [0, 0, 0]
+    assert limiter.acquire() == pytest.approx(0.5)
+    assert limiter.acquire() == pytest.approx(0.5)
+    assert clock.slept == pytest.approx([0.5, 0.5])
+
+
+def test_refill_is_capped_at_burst(clock):
+    limiter = RateLimiter(rate=2, burst=2)
+    limiter.acquire()
+    limiter.acquire()
+    clock.now += 60
+    assert [limiter.reserve() for _ in range(3)] == pytest.approx([0, 0, 0.5])
+
+
+def test_reservations_are_served_in_order(clock):
+    limiter = RateLimiter(rate=1, burst=1)
+    assert [limiter.reserve() for _ in range(4)] == pytest.approx([0, 1, 2, 3])
+
+
+def test_shared_across_threads():
+    limiter = RateLimiter(rate=1, burst=1)
+    waits = []
+    threads = [
+        threading.Thread(target=lambda: waits.append(limiter.reserve()))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(round(w) for w in waits) == list(range(8))
+
+
+def test_sqlite_burst_then_rate(tmp_path, clock):
+    limiter = SQLiteRateLimiter(tmp_path / "quota.sqlite", rate=2, burst=2)
+    assert [limiter.reserve() for _ in range(4)] == pytest.approx([0, 0, 0.5, 1])
+
+    clock.now += 60
+    assert limiter.reserve() == 0
+
+
+def test_sqlite_buckets_are_shared_by_name(tmp_path, clock):
+    path = tmp_path / "quota.sqlite"
+    first = SQLiteRateLimiter(path, rate=1, burst=1)
+    second = SQLiteRateLimiter(path, rate=1, burst=1)
+    other = SQLiteRateLimiter(path, rate=1, burst=1, name="other")
+
+    assert first.reserve() == 0
+    assert second.reserve() == pytest.approx(1)
+    assert other.reserve() == 0
+
+
+def _reserve_from_sqlite(path):
+    return SQLiteRateLimiter(path, rate=0.01, burst=2).reserve()
+
+
+def test_sqlite_shared_across_processes(tmp_path):
+    path = str(tmp_path / "quota.sqlite")
+    with multiprocessing.get_context("spawn").Pool(2) as pool:
+        waits = pool.map(_reserve_from_sqlite, [path] * 4)
+
+    # Two requests fit in the burst and the others wait for about 100 and 200 seconds.
+    assert sorted(round(w, -2) for w in waits) == [0, 0, 100, 200]
+
+
+fake_response = SimpleNamespace(
+    status_code=200, content=b'{"seriess": []}', json=lambda: {"seriess": []}
+)
+
+
+def test_get_request_acquires_on_cache_miss(monkeypatch):
+    calls = []
+    limiter = SimpleNamespace(acquire=lambda: calls.append("acquire"))
+    pool = SimpleNamespace(get=lambda *args, **kwargs: fake_response)
+    monkeypatch.setattr(_base, "get_session_pool", lambda: pool)
+    monkeypatch.setattr(_base, "get_response_cache", lambda: None)
+    monkeypatch.setattr(_base, "get_rate_limiter", lambda: limiter)
+
+    _base._get_request(endpoint="series")
+    _base._get_request(endpoint="series")
+    assert calls == ["acquire", "acquire"]
+
+
+def test_async_get_request_sleeps_without_blocking(monkeypatch):
+    pytest.importorskip("httpx")
+    from pyfredapi.aio import _base as aio_base
+
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    async def fake_get(*args, **kwargs):
+        return fake_response
+
+    limiter = SimpleNamespace(reserve=lambda: 0.25)
+    monkeypatch.setattr(aio_base, "get_rate_limiter", lambda: limiter)
+    monkeypatch.setattr(aio_base, "get_response_cache", lambda: None)
+    monkeypatch.setattr(
+        aio_base, "get_session_pool", lambda: SimpleNamespace(get=fake_get)
+    )
+    monkeypatch.setattr(aio_base.asyncio, "sleep", fake_sleep)
+
+    asyncio.run(aio_base._get_request(endpoint="series"))
+    assert slept == [0.25]
+
+
+def test_configure_rate_limiter():
+    previous = rate_limit.get_rate_limiter()
+    try:
+        limiter = rate_limit.configure_rate_limiter(rate=1, burst=10)
+        assert rate_limit.get_rate_limiter() is limiter
+        assert (limiter.rate, limiter.burst) == (1, 10)
+        rate_limit.set_rate_limiter(None)
+        assert rate_limit.get_rate_limiter() is None
+    finally:
+        rate_limit.set_rate_limiter(previous)
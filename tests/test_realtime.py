@@ -0,0 +1,95 @@
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pyfredapi as pf
+from pyfredapi.realtime import REALTIME_OPEN, to_realtime_days
+from pyfredapi.testing import synthetic
+from pyfredapi.utils._convert_to_df import (
+    _convert_to_pandas,
+    _convert_to_polars,
+    _convert_to_polars_lazy,
+)
+
+records = synthetic.vintage_records(60, vintages=3)
+
+
+@pytest.fixture(params=["coerce", "datetime", "days"])
+def representation(request):
+    pf.set_realtime_dates(request.param)
+    yield request.param
+    pf.set_realtime_dates("coerce")
+
+
+def expected_asof(date):
+    """Select the rows current on a date by comparing the strings."""
+    return [
+        i
+        for i, record in enumerate(records)
+        if record["realtime_start"] <= date <= record["realtime_end"]
+    ]
+
+
+def test_coerce_is_default():
+    assert pf.get_realtime_dates() == "coerce"
+    df = _convert_to_pandas(records)
+    assert df["realtime_end"].dtype == "datetime64[ns]"
+    assert df["realtime_end"].isna().sum() == 20
+
+
+def test_datetime():
+    pf.set_realtime_dates("datetime")
+    try:
+        df = _convert_to_pandas(records)
+    finally:
+        pf.set_realtime_dates("coerce")
+    assert df["realtime_start"].dtype == df["realtime_end"].dtype == "datetime64[s]"
+    assert df["realtime_end"].max() == pd.Timestamp("9999-12-31")
+    assert df["date"].dtype == "datetime64[ns]"
+
+
+def test_days():
+    pf.set_realtime_dates("days")
+    try:
+        df = _convert_to_pandas(records)
+    finally:
+        pf.set_realtime_dates("coerce")
+    assert df["realtime_start"].dtype == df["realtime_end"].dtype == "int32"
+    assert (df["realtime_end"] == REALTIME_OPEN).sum() == 20
+    assert df.loc[0, "realtime_start"] == to_realtime_days(records[0]["realtime_start"])
+
+
+def test_to_realtime_days():
+    assert to_realtime_days("1970-01-02") == 1
+    assert to_realtime_days(dt.date(9999, 12, 31)) == REALTIME_OPEN
+    days = to_realtime_days(["1776-07-04", "9999-12-31"])
+    assert days.dtype == np.int32
+    assert days.tolist() == [-70672, REALTIME_OPEN]
+
+
+@pytest.mark.parametrize(
+    "date", ["1900-01-01", "1900-02-15", "1900-03-20", "2024-01-01"]
+)
+def test_filter_asof(representation, date):
+    df = _convert_to_pandas(records)
+    assert pf.filter_asof(df, date).index.tolist() == expected_asof(date)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_filter_asof_polars(lazy):
+    pytest.importorskip("polars")
+    df = _convert_to_polars_lazy(records) if lazy else _convert_to_polars(records)
+    actual = pf.filter_asof(df, "1900-02-15")
+    if lazy:
+        actual = actual.collect()
+    assert actual["realtime_start"].to_list() == [
+        dt.date.fromisoformat(records[i]["realtime_start"])
+        for i in expected_asof("1900-02-15")
+    ]
+
+
+def test_set_realtime_dates_invalid():
+    with pytest.raises(ValueError):
+        pf.set_realtime_dates("ordinal")
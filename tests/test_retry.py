@@ -0,0 +1,186 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from pyfredapi import _base, retry
+from pyfredapi.exceptions import FredAPIRequestError
+from pyfredapi.retry import RetryPolicy, _parse_retry_after
+
+gateway_page = "<html><body><h1>504 Gateway Time-out</h1></body></html>"
+
+
+def response(status_code, body=None, headers=None, reason=""):
+    content = (body if isinstance(body, str) else json.dumps(body)).encode()
+
+    def decode():
+        return json.loads(content)
+
+    return SimpleNamespace(
+        status_code=status_code,
+        content=content,
+        json=decode,
+        headers=headers or {},
+        reason=reason,
+    )
+
+
+ok = response(200, {"seriess": []})
+
+
+class ScriptedPool(SimpleNamespace):
+    def get(self, url, params=None, timeout=30):  # noqa: D102
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture()
+def scripted(monkeypatch):
+    slept = []
+    pool = ScriptedPool(outcomes=[])
+    monkeypatch.setattr(_base, "get_session_pool", lambda: pool)
+    monkeypatch.setattr(_base, "get_response_cache", lambda: None)
+    monkeypatch.setattr(_base, "get_rate_limiter", lambda: None)
+    monkeypatch.setattr(_base.time, "sleep", slept.append)
+    return SimpleNamespace(pool=pool, slept=slept)
+
+
+def use_policy(monkeypatch, policy):
+    monkeypatch.setattr(_base, "get_retry_policy", lambda: policy)
+    return policy
+
+
+def test_backoff_without_jitter():
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+    assert [policy.backoff(n) for n in range(1, 6)] == [0.5, 1, 2, 3, 3]
+
+
+def test_backoff_with_jitter():
+    policy = RetryPolicy(backoff_factor=1)
+    assert all(0 <= policy.backoff(3) <= 4 for _ in range(100))
+
+
+def test_next_wait():
+    policy = RetryPolicy(max_attempts=3, jitter=False, deadline=10)
+    assert policy.next_wait(1, 503, {}, elapsed=0) == 0.5
+    assert policy.next_wait(1, None, {}, elapsed=0) == 0.5
+    assert policy.next_wait(1, 400, {}, elapsed=0) is None
+    assert policy.next_wait(3, 503, {}, elapsed=0) is None
+    assert policy.next_wait(1, 503, {}, elapsed=9.9) is None
+    assert policy.next_wait(1, 429, {"Retry-After": "7"}, elapsed=0) == 7
+    assert policy.next_wait(1, 429, {"Retry-After": "11"}, elapsed=0) is None
+
+    policy = RetryPolicy(jitter=False, respect_retry_after=False)
+    assert policy.next_wait(1, 429, {"Retry-After": "7"}, elapsed=0) == 0.5
+
+
+def test_parse_retry_after(monkeypatch):
+    monkeypatch.setattr(retry.time, "time", lambda: 782724567.0)
+    assert _parse_retry_after(None) is None
+    assert _parse_retry_after("120") == 120
+    assert _parse_retry_after("Wed, 21 Oct 1994 07:29:57 GMT") == 30
+    assert _parse_retry_after("Wed, 21 Oct 1994 07:27:57 GMT") == 0
+    assert _parse_retry_after("soon") is None
+
+
+def test_invalid_max_attempts_err():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_retries_transient_errors(monkeypatch, scripted):
+    policy = use_policy(monkeypatch, RetryPolicy(jitter=False))
+    scripted.pool.outcomes = [
+        requests.exceptions.ConnectionError("reset"),
+        response(429, {"error_message": "Too Many Requests"}, {"Retry-After": "3"}),
+        ok,
+    ]
+
+    assert _base._get_request(endpoint="series") == {"seriess": []}
+    assert scripted.slept == [0.5, 3]
+
+    stats = policy.stats
+    assert (stats.requests, stats.attempts, stats.retries, stats.failures) == (
+        1,
+        3,
+        2,
+        0,
+    )
+    assert stats.wait == 3.5
+
+
+def test_gives_up_after_max_attempts(monkeypatch, scripted):
+    policy = use_policy(monkeypatch, RetryPolicy(max_attempts=3, jitter=False))
+    scripted.pool.outcomes = [
+        response(504, gateway_page, reason="Gateway Time-out") for _ in range(3)
+    ]
+
+    with pytest.raises(FredAPIRequestError) as e:
+        _base._get_request(endpoint="series")
+
+    assert e.value.status_code == 504
+    assert e.value.message == "504 Gateway Time-out"
+    assert [a.status_code for a in e.value.attempts] == [504, 504, 504]
+    assert [a.wait for a in e.value.attempts] == [0.5, 1, None]
+    assert policy.stats.failures == 1
+
+
+def test_does_not_retry_client_errors(monkeypatch, scripted):
+    use_policy(monkeypatch, RetryPolicy())
+    scripted.pool.outcomes = [response(400, {"error_message": "Bad Request."})]
+
+    with pytest.raises(FredAPIRequestError, match="Bad Request.") as e:
+        _base._get_request(endpoint="series")
+    assert len(e.value.attempts) == 1
+    assert scripted.slept == []
+
+
+def test_no_retry_policy(monkeypatch, scripted):
+    use_policy(monkeypatch, None)
+    scripted.pool.outcomes = [requests.exceptions.Timeout("timed out")]
+
+    with pytest.raises(FredAPIRequestError) as e:
+        _base._get_request(endpoint="series")
+    assert e.value.status_code is None
+    assert isinstance(e.value.__cause__, requests.exceptions.Timeout)
+
+
+def test_async_retries_transient_errors(monkeypatch):
+    pytest.importorskip("httpx")
+    from pyfredapi.aio import _base as aio_base
+
+    outcomes = [response(502, gateway_page, reason="Bad Gateway"), ok]
+    slept = []
+
+    async def fake_get(*args, **kwargs):
+        return outcomes.pop(0)
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr(aio_base, "get_retry_policy", lambda: RetryPolicy(jitter=False))
+    monkeypatch.setattr(aio_base, "get_rate_limiter", lambda: None)
+    monkeypatch.setattr(aio_base, "get_response_cache", lambda: None)
+    monkeypatch.setattr(
+        aio_base, "get_session_pool", lambda: SimpleNamespace(get=fake_get)
+    )
+    monkeypatch.setattr(aio_base.asyncio, "sleep", fake_sleep)
+
+    assert asyncio.run(aio_base._get_request(endpoint="series")) == {"seriess": []}
+    assert slept == [0.5]
+
+
+def test_configure_retry_policy():
+    previous = retry.get_retry_policy()
+    try:
+        policy = retry.configure_retry_policy(max_attempts=8, deadline=None)
+        assert retry.get_retry_policy() is policy
+        assert (policy.max_attempts, policy.deadline) == (8, None)
+        retry.set_retry_policy(None)
+        assert retry.get_retry_policy() is None
+    finally:
+        retry.set_retry_policy(previous)
@@ -1,3 +1,6 @@
+import datetime as dt
+
+import numpy as np
 import pandas as pd
 import polars as pl
 import pytest
@@ -19,7 +22,12 @@ from pyfredapi.series import (
     search_series_related_tags,
     search_series_tags,
 )
-from pyfredapi.utils._convert_to_df import _convert_to_pandas, _convert_to_polars
+from pyfredapi.utils._convert_to_df import (
+    _convert_records,
+    _convert_to_pandas,
+    _convert_to_polars,
+)
+from pyfredapi.utils.enums import ReturnFormat
 
 from .conftest import get_request
 
@@ -134,6 +142,71 @@ def test_get_series_all_releases(return_type):
         pd.testing.assert_frame_equal(_convert_to_pandas(expected), actual)
 
 
+@pytest.mark.vcr()
+@pytest.mark.default_cassette("test_get_series[pandas].yaml")
+def test_get_series_numpy():
+    actual = get_series(series_id=series_params["series_id"], return_format="numpy")
+    expected = get_request(
+        endpoint=series_obv_endpoint, extra_params=series_params
+    ).json()["observations"]
+
+    assert actual.dtype.names == ("date", "value")
+    assert actual["date"].tolist() == [
+        dt.date.fromisoformat(obs["date"]) for obs in expected
+    ]
+
+
+@pytest.mark.vcr()
+@pytest.mark.default_cassette("test_get_series[pandas].yaml")
+@pytest.mark.parametrize("return_type", ["pandas", "polars", "numpy"])
+def test_get_series_columns(return_type):
+    actual = get_series(
+        series_id=series_params["series_id"],
+        return_format=return_type,
+        columns=["date", "value"],
+    )
+    expected = get_request(
+        endpoint=series_obv_endpoint, extra_params=series_params
+    ).json()["observations"]
+
+    if return_type == "numpy":
+        assert actual.dtype.names == ("date", "value")
+        assert len(actual) == len(expected)
+    else:
+        assert list(actual.columns) == ["date", "value"]
+        assert len(actual) == len(expected)
+
+
+@pytest.mark.vcr()
+@pytest.mark.default_cassette("test_get_series_all_releases[pandas].yaml")
+def test_get_series_all_releases_numpy():
+    actual = get_series_all_releases(
+        series_id=series_params["series_id"], return_format="numpy"
+    )
+    expected = _convert_to_pandas(
+        get_request(
+            endpoint=series_obv_endpoint,
+            extra_params={
+                "realtime_start": "1776-07-04",
+                "realtime_end": "9999-12-31",
+                "series_id": series_params["series_id"],
+            },
+        ).json()["observations"]
+    )
+
+    assert actual.dtype.names == ("date", "value", "realtime_start", "realtime_end")
+    np.testing.assert_array_equal(actual["value"], expected["value"].to_numpy())
+    np.testing.assert_array_equal(
+        actual["realtime_start"], expected["realtime_start"].to_numpy()
+    )
+    assert str(actual["realtime_end"].max()) == "9999-12-31"
+
+
+def test_numpy_return_format_only_for_observations():
+    with pytest.raises(ValueError, match="only available for series observations"):
+        _convert_records([{"id": "GDP"}], ReturnFormat.numpy)
+
+
 @pytest.mark.vcr()
 @return_type_mark
 def test_get_series_initial_release(return_type):
@@ -217,6 +290,27 @@ def test_search_series(return_type):
         assert_frame_equal(_convert_to_polars(expected["seriess"]), actual)
 
 
+@pytest.mark.vcr()
+@pytest.mark.default_cassette("test_search_series[pandas].yaml")
+@pytest.mark.parametrize("return_type", ["pandas", "polars"])
+def test_search_series_categorical(return_type):
+    actual = search_series(
+        search_text=test_search_text,
+        return_format=return_type,
+        categorical=True,
+    )
+    expected = search_series(search_text=test_search_text, return_format=return_type)
+
+    if return_type == "pandas":
+        assert actual["frequency"].dtype == "category"
+        assert actual["title"].dtype == object
+        pd.testing.assert_frame_equal(actual.astype(expected.dtypes), expected)
+    else:
+        assert actual.schema["frequency"] == pl.Categorical
+        assert actual.schema["title"] == pl.String
+        assert_frame_equal(actual.cast(expected.schema), expected)
+
+
 @pytest.mark.vcr()
 @return_type_mark
 def test_search_series_tags(return_type):
@@ -1,7 +1,27 @@
 import pandas as pd
 import pytest
 
+import pyfredapi as pf
+from pyfredapi import _base
 from pyfredapi.series_collection import SeriesCollection, SeriesData
+from pyfredapi.testing import MockFredServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    with MockFredServer(observations=50) as server:
+        yield server
+
+
+@pytest.fixture()
+def synthetic(server, monkeypatch):
+    """Request the series of the collections from the mock server."""
+    pool = server.session_pool()
+    monkeypatch.setattr(_base, "get_session_pool", lambda: pool)
+    monkeypatch.setattr(_base, "get_response_cache", lambda: pf.ResponseCache())
+    monkeypatch.setattr(_base, "get_rate_limiter", lambda: None)
+    yield
+    pool.close()
 
 
 def test_init():
@@ -99,6 +119,36 @@ def test_merge_long():
     assert set(series) == set(long_df.series.tolist())
 
 
+def test_merge_long_categorical(synthetic):
+    sc = SeriesCollection(series_id=["SYN1", "SYN2"])
+    long_df = sc.merge_long(include_info_attrs=True)
+    assert long_df.shape == (100, 18)
+    assert long_df["series"].dtype == "category"
+    assert long_df["series"].tolist() == ["SYN1"] * 50 + ["SYN2"] * 50
+    assert long_df["frequency"].dtype == "category"
+    assert long_df["popularity"].dtype == "int64"
+
+    plain_df = sc.merge_long(include_info_attrs=True, categorical=False)
+    assert plain_df["series"].dtype == object
+    pd.testing.assert_frame_equal(long_df.astype(plain_df.dtypes), plain_df)
+
+
+def test_merge_long_realtime_info_attrs(synthetic):
+    sc = SeriesCollection(series_id="SYN1", drop_realtime=False)
+    long_df = sc.merge_long(include_info_attrs=True)
+    assert {"realtime_start_x", "realtime_start_y"} <= set(long_df.columns)
+    assert long_df["realtime_start_x"].dtype == "datetime64[ns]"
+
+
+def test_columns_kwarg(synthetic):
+    sc = SeriesCollection(
+        series_id="SYN1", drop_realtime=False, columns=["date", "value"]
+    )
+    sc.add("SYN2", columns=["date", "value"])
+    assert sc.SYN1.df.columns.tolist() == ["date", "SYN1"]
+    assert sc.SYN2.df.columns.tolist() == ["date", "SYN2"]
+
+
 @pytest.mark.vcr()
 def test_merge_asof():
     series = ["CPIAUCSL", "CPILFESL"]
@@ -0,0 +1,68 @@
+import threading
+
+import pytest
+
+from pyfredapi import session as session_module
+from pyfredapi.session import SessionPool, configure_session_pool, get_session_pool
+
+
+def test_session_reused():
+    pool = SessionPool()
+    assert pool.session is pool.session
+
+
+def test_pool_size():
+    pool = SessionPool(pool_size=4, pool_block=True)
+    adapter = pool.session.get_adapter("https://api.stlouisfed.org/fred")
+    assert adapter._pool_maxsize == 4
+    assert adapter._pool_block is True
+
+
+def test_invalid_pool_size_err():
+    with pytest.raises(ValueError):
+        SessionPool(pool_size=0)
+
+
+def test_session_shared_across_threads():
+    pool = SessionPool()
+    sessions = []
+
+    def get_session():
+        sessions.append(pool.session)
+
+    threads = [threading.Thread(target=get_session) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len({id(s) for s in sessions}) == 1
+
+
+def test_session_recreated_in_child_process(monkeypatch):
+    pool = SessionPool()
+    parent_session = pool.session
+
+    monkeypatch.setattr(session_module.os, "getpid", lambda: -1)
+    child_session = pool.session
+
+    assert child_session is not parent_session
+    assert pool.session is child_session
+
+
+def test_reset_after_fork():
+    pool = SessionPool()
+    _ = pool.session
+    session_module._reset_pools_after_fork()
+    assert pool._session is None
+
+
+def test_configure_session_pool():
+    previous = get_session_pool()
+    try:
+        pool = configure_session_pool(pool_size=2)
+        assert get_session_pool() is pool
+        assert pool.pool_size == 2
+        assert previous._session is None
+    finally:
+        session_module._session_pool = previous
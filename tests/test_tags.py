@@ -13,6 +13,16 @@ def test_get_tags():
     assert actual == expected
 
 
+@pytest.mark.vcr()
+@pytest.mark.default_cassette("test_get_tags.yaml")
+def test_get_tags_columns():
+    actual = get_tags(return_format="pandas", columns=["name", "series_count"])
+    expected = get_request(endpoint="tags").json()["tags"]
+
+    assert actual.columns.tolist() == ["name", "series_count"]
+    assert actual["name"].tolist() == [tag["name"] for tag in expected]
+
+
 @pytest.mark.vcr()
 def test_get_related_tags():
     actual = get_related_tags(tag_names="nation")
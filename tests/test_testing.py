@@ -0,0 +1,187 @@
+import asyncio
+import time
+
+import pytest
+
+import pyfredapi as pf
+from pyfredapi.exceptions import FredAPIRequestError
+from pyfredapi.testing import Faults, MockFredServer, load_cassettes, synthetic
+
+pytest.importorskip("yaml")
+
+no_retry = pf.RetryPolicy(max_attempts=1)
+
+
+@pytest.fixture(scope="module")
+def server():
+    with MockFredServer("tests/vhs", observations=2500) as server:
+        yield server
+
+
+@pytest.fixture()
+def client(server):
+    server.reset()
+    with server.client(rate_limiter=None, retry_policy=no_retry) as client:
+        yield client
+
+
+def test_session_pool_api_root():
+    pool = pf.SessionPool(api_root="http://localhost:8000/")
+    assert pool.api_root == "http://localhost:8000"
+    assert "api_root='http://localhost:8000'" in repr(pool)
+
+
+def test_load_cassettes():
+    responses = load_cassettes("tests/vhs/test_maps")
+    key = (
+        "/geofred/shapes/file",
+        frozenset({"file_type": "json", "shape": "bea"}.items()),
+    )
+    assert responses[key].status_code == 200
+    assert responses[key].body.startswith(b'{"type":"FeatureCollection"')
+
+
+def test_replay_cassette(client, server):
+    info = client.get_series_info("GDP")
+    assert info.id == "GDP"
+    assert info.title == "Gross Domestic Product"
+    (request,) = server.requests
+    assert request.path == "/fred/series"
+    assert "api_key" not in request.params
+
+
+def test_replay_geofred_cassette(client):
+    shapes = client.get_shape_files("bea")
+    assert shapes["name"] == "state_bea_region"
+
+
+def test_synthetic_observations(client, server):
+    data = client.get_series("SYNTHETIC", return_format="json")
+    assert len(data) == 2500
+    assert data[0]["date"] == "1900-01-01"
+    assert data[96]["value"] == "."
+
+    page = client.get_series("SYNTHETIC", return_format="json", limit=10, offset=2495)
+    assert [obs["date"] for obs in page] == [obs["date"] for obs in data[2495:]]
+
+
+def test_synthetic_listing_pages(client, server):
+    series = client.get_category_series(category_id=1, paginate=True)
+    assert len(series) == server.listing_size
+    assert sorted(request.params.get("offset", "0") for request in server.requests) == [
+        "0",
+        "1000",
+        "2000",
+    ]
+
+
+def test_synthetic_shape_file():
+    with MockFredServer(shape_features=500) as server:
+        shapes = server.client(rate_limiter=None).get_shape_files("county")
+    assert len(shapes["features"]) == 500
+    ring = shapes["features"][0]["geometry"]["coordinates"][0][0]
+    assert ring[0] == ring[-1]
+
+
+def test_synthetic_geoseries():
+    pytest.importorskip("pandas")
+    with MockFredServer(geo_regions=30, geo_dates=4) as server:
+        geoseries = server.client(rate_limiter=None).get_geoseries("SYN")
+    assert geoseries.info.region_type == "county"
+    assert geoseries.data.shape == (120, 5)
+    assert geoseries.data["date"].nunique() == 4
+
+
+def test_not_found_without_synthetic():
+    with MockFredServer(synthetic=False) as server:
+        client = server.client(rate_limiter=None, retry_policy=no_retry)
+        with pytest.raises(FredAPIRequestError) as exc:
+            client.get_series("GDP")
+    assert exc.value.status_code == 404
+
+
+def test_latency():
+    with MockFredServer(faults=Faults(latency=0.05)) as server:
+        client = server.client(rate_limiter=None)
+        start = time.perf_counter()
+        client.get_series_info("GDP")
+        assert time.perf_counter() - start >= 0.05
+
+
+def test_rate_limit_retried():
+    faults = Faults(rate_limit_rate=0.5, retry_after=0, seed=1)
+    with MockFredServer(faults=faults) as server:
+        policy = pf.RetryPolicy(max_attempts=20, backoff_factor=0, jitter=False)
+        client = server.client(rate_limiter=None, retry_policy=policy, cache=None)
+        for series_id in ["A", "B", "C", "D"]:
+            client.get_series_info(series_id)
+        statuses = [request.status_code for request in server.requests]
+    assert statuses.count(200) == 4
+    assert statuses.count(429) == policy.stats.retries > 0
+
+
+def test_server_errors():
+    faults = Faults(server_error_rate=1, server_error_statuses=(502,))
+    with MockFredServer(faults=faults) as server:
+        policy = pf.RetryPolicy(max_attempts=3, backoff_factor=0, jitter=False)
+        client = server.client(rate_limiter=None, retry_policy=policy)
+        with pytest.raises(FredAPIRequestError) as exc:
+            client.get_series_info("GDP")
+    assert exc.value.status_code == 502
+    assert exc.value.message == "502 Bad Gateway"
+    assert len(exc.value.attempts) == 3
+
+
+def test_max_requests_per_second():
+    with MockFredServer(faults=Faults(max_requests_per_second=2)) as server:
+        client = server.client(rate_limiter=None, retry_policy=no_retry, cache=None)
+        client.get_series_info("A")
+        client.get_series_info("B")
+        with pytest.raises(FredAPIRequestError) as exc:
+            client.get_series_info("C")
+    assert exc.value.status_code == 429
+
+
+def test_concurrency():
+    with MockFredServer(faults=Faults(latency=0.05)) as server:
+        client = server.client(rate_limiter=None)
+        client.get_category_series(category_id=1, paginate=True)
+        assert server.max_in_flight == 2
+
+
+def test_invalid_faults():
+    with pytest.raises(ValueError):
+        Faults(rate_limit_rate=0.6, server_error_rate=0.6)
+
+
+def test_synthetic_observations_page():
+    response = synthetic.observations(10, {"limit": "3", "offset": "8"})
+    assert (response["count"], response["offset"], response["limit"]) == (10, 8, 2)
+    assert [obs["date"] for obs in response["observations"]] == [
+        "1900-01-09",
+        "1900-01-10",
+    ]
+
+
+def test_async_session_pool(monkeypatch):
+    pytest.importorskip("httpx")
+    import pyfredapi.aio as pfa
+    from pyfredapi.aio import _base as aio_base
+
+    async def main(pool):
+        try:
+            return await asyncio.gather(
+                *(
+                    pfa.get_series(f"S{i}", api_key="0" * 32, return_format="json")
+                    for i in range(3)
+                )
+            )
+        finally:
+            await pool.aclose()
+
+    with MockFredServer(observations=10) as server:
+        pool = server.async_session_pool()
+        monkeypatch.setattr(aio_base, "get_session_pool", lambda: pool)
+        monkeypatch.setattr(aio_base, "get_rate_limiter", lambda: None)
+        results = asyncio.run(main(pool))
+    assert [len(result) for result in results] == [10, 10, 10]
@@ -0,0 +1,315 @@
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from pyfredapi.series import SeriesApiParameters
+from pyfredapi.testing import synthetic
+from pyfredapi.utils import (
+    _convert_pydantic_model_to_frozenset,
+    _convert_to_df,
+    _validate_params,
+    _validated_dict,
+    _validated_params,
+)
+from pyfredapi.utils._convert_to_df import (
+    _categorize,
+    _convert_records,
+    _convert_to_arrow,
+    _convert_to_numpy,
+    _convert_to_pandas,
+    _convert_to_pandas_inferred,
+    _convert_to_polars,
+    _convert_to_polars_lazy,
+)
+from pyfredapi.utils.enums import ReturnFormat
+
+
+@pytest.fixture(params=["arrow", "numpy"])
+def parser(request, monkeypatch):
+    """Parse the FRED formats with arrow, or with numpy as without pyarrow."""
+    if request.param == "arrow":
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setattr(_convert_to_df, "MISSING_PYARROW", True)
+    return request.param
+
+
+def test_validated_params_matches_model():
+    kwargs = {"series_id": "GDP", "units": "pch", "limit": 10, "offset": None}
+    expected = _convert_pydantic_model_to_frozenset(SeriesApiParameters(**kwargs))
+    assert _validated_params(SeriesApiParameters, **kwargs) == expected
+    assert _validated_dict(SeriesApiParameters, **kwargs) == dict(expected)
+
+
+def test_validated_params_are_memoized():
+    _validate_params.cache_clear()
+    for _ in range(3):
+        _validated_params(SeriesApiParameters, series_id="GDP")
+    info = _validate_params.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_validated_params_key_on_type():
+    _validate_params.cache_clear()
+    _validated_params(SeriesApiParameters, series_id="GDP", limit=1)
+    _validated_params(SeriesApiParameters, series_id="GDP", limit=True)
+    assert _validate_params.cache_info().misses == 2
+
+
+def test_validated_params_unhashable_value():
+    # Lists are not hashable, so the parameters are validated without memoization.
+    with pytest.raises(ValidationError):
+        _validated_params(SeriesApiParameters, series_id=["GDP"])
+
+
+@pytest.mark.parametrize("attempt", range(2))
+def test_validated_params_invalid_err(attempt):
+    with pytest.raises(ValidationError):
+        _validated_params(SeriesApiParameters, series_id="GDP", units="foo")
+
+
+def test_convert_to_pandas_matches_inferred(parser):
+    records = synthetic.vintage_records(400, vintages=2)
+    records[5]["value"] = "."
+    records[6]["realtime_start"] = "1600-01-01"
+    df = _convert_to_pandas(records)
+    pd.testing.assert_frame_equal(df, _convert_to_pandas_inferred(records))
+    assert df["value"].isna().sum() == sum(r["value"] == "." for r in records)
+    assert df["realtime_end"].isna().sum() == 200
+    assert df.loc[6, "realtime_start"] is pd.NaT
+
+
+def test_convert_to_pandas_values_are_float():
+    df = _convert_to_pandas([{"date": "2020-01-01", "value": "1"}])
+    assert df["value"].dtype == "float64"
+
+
+@pytest.mark.parametrize(
+    "records",
+    [
+        # Records with different keys
+        [{"date": "2020-01-01", "value": "1.5"}, {"date": "2020-01-02"}],
+        # Dates with a time
+        [{"date": "2020-01-01 10:00:00", "value": "1.5"}],
+        # Values that are not numbers
+        [{"date": "2020-01-01", "value": "n/a"}],
+    ],
+)
+def test_convert_to_pandas_fallback(records, parser):
+    df = _convert_to_pandas(records)
+    expected = _convert_to_pandas_inferred(records)
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+
+
+def test_convert_to_arrow_observations():
+    pa = pytest.importorskip("pyarrow")
+    records = synthetic.vintage_records(400, vintages=2)
+    table = _convert_to_arrow(records)
+    assert table.schema.types == [pa.date32(), pa.date32(), pa.date32(), pa.float64()]
+    assert table["value"].null_count == sum(r["value"] == "." for r in records)
+    # date32 holds the open end of the realtime periods, unlike datetime64[ns].
+    assert str(table["realtime_end"][1]) == "9999-12-31"
+    assert table["value"].to_pylist()[0] == float(records[0]["value"])
+
+
+def test_convert_to_arrow_listings():
+    pa = pytest.importorskip("pyarrow")
+    series = _convert_to_arrow(synthetic.listing("series/search", 50)["seriess"])
+    assert series["id"].type == pa.string()
+    assert pa.types.is_dictionary(series["frequency"].type)
+    assert series["title"].type == pa.string()
+
+    tags = _convert_to_arrow(synthetic.listing("tags", 5)["tags"])
+    assert tags["created"].type == pa.timestamp("s", tz="UTC")
+    assert str(tags["created"][0]) == "2012-02-27 16:18:19+00:00"
+    assert tags["popularity"].type == pa.int64()
+
+
+def test_convert_to_arrow_missing_keys():
+    pytest.importorskip("pyarrow")
+    table = _convert_to_arrow(
+        [{"date": "2020-01-01", "value": "1.5", "name": "a"}, {"date": "2020-01-02"}]
+    )
+    assert table.column_names == ["date", "value", "name"]
+    assert table["value"].to_pylist() == [1.5, None]
+    assert table["name"].to_pylist() == ["a", None]
+    assert _convert_to_arrow([]).num_rows == 0
+
+
+def test_convert_to_polars_with_arrow(monkeypatch):
+    pytest.importorskip("pyarrow")
+    pytest.importorskip("polars")
+    records = synthetic.vintage_records(400, vintages=2)
+    tags = synthetic.listing("tags", 5)["tags"]
+    observations_df, tags_df = _convert_to_polars(records), _convert_to_polars(tags)
+
+    monkeypatch.setattr(_convert_to_df, "MISSING_PYARROW", True)
+    assert observations_df.equals(_convert_to_polars(records))
+    assert tags_df.equals(_convert_to_polars(tags))
+
+
+def test_convert_to_polars_keeps_missing_values(parser):
+    pytest.importorskip("polars")
+    records = synthetic.vintage_records(400, vintages=2)
+    df = _convert_to_polars(records)
+    assert len(df) == len(_convert_to_pandas(records))
+    assert df["value"].null_count() == sum(r["value"] == "." for r in records)
+    assert df.schema["date"] == df.schema["realtime_end"]
+    assert str(df["realtime_end"][1]) == "9999-12-31"
+
+
+def test_convert_to_polars_timestamps(parser):
+    pl = pytest.importorskip("polars")
+    df = _convert_to_polars(synthetic.listing("tags", 5)["tags"])
+    assert df.schema["created"] == pl.Datetime("us", "UTC")
+    assert str(df["created"][0]) == "2012-02-27 16:18:19+00:00"
+
+
+def test_convert_to_polars_coerces_invalid_values(parser):
+    pytest.importorskip("polars")
+    df = _convert_to_polars([{"date": "2020-01-01 10:00", "value": "n/a"}])
+    assert df.row(0) == (None, None)
+
+
+def test_convert_to_polars_lazy(parser):
+    pl = pytest.importorskip("polars")
+    records = synthetic.vintage_records(400, vintages=2)
+    lf = _convert_to_polars_lazy(records)
+    assert isinstance(lf, pl.LazyFrame)
+    assert lf.collect().equals(_convert_to_polars(records))
+
+    # Filters are planned together with the parsing of the columns.
+    current = lf.filter(pl.col("realtime_end") == pl.date(9999, 12, 31)).collect()
+    assert len(current) == 200
+
+
+def test_convert_to_numpy(parser):
+    records = synthetic.vintage_records(400, vintages=2)
+    array = _convert_to_numpy(records, realtime=True)
+    assert array.dtype.names == ("date", "value", "realtime_start", "realtime_end")
+    assert array.itemsize == 32
+    df = _convert_to_pandas(records)
+    assert (array["date"] == df["date"].to_numpy()).all()
+    pd.testing.assert_series_equal(
+        pd.Series(array["value"]), df["value"], check_names=False
+    )
+    # datetime64[D] holds the open end of the realtime periods.
+    assert str(array["realtime_end"][1]) == "9999-12-31"
+
+    array = _convert_to_numpy(records)
+    assert array.dtype.names == ("date", "value")
+    assert array.itemsize == 16
+
+
+def test_convert_to_numpy_coerces_invalid_values(parser):
+    array = _convert_to_numpy(
+        [{"date": "2020-01-01 10:00", "value": "n/a"}, {"date": "2020-01-02"}]
+    )
+    assert pd.isna(array["date"][0])
+    assert str(array["date"][1]) == "2020-01-02"
+    assert pd.isna(array["value"]).all()
+
+
+@pytest.mark.parametrize("return_format", ["pandas", "polars", "polars_lazy", "arrow"])
+def test_convert_records_columns(parser, return_format):
+    if return_format == "arrow" and parser == "numpy":
+        pytest.skip("The arrow return format requires pyarrow.")
+    if return_format != "pandas":
+        pytest.importorskip("polars" if "polars" in return_format else "pyarrow")
+
+    def convert(*columns):
+        df = _convert_records(records, ReturnFormat(return_format), *columns)
+        if return_format == "polars_lazy":
+            df = df.collect()
+        if return_format == "pandas":
+            return df
+        return pd.DataFrame(
+            df.to_pydict() if return_format == "arrow" else df.to_dict(as_series=False)
+        )
+
+    records = synthetic.vintage_records(40, vintages=2)
+    columns = ["value", "date"]
+    df = convert(columns)
+    assert df.columns.tolist() == columns
+    assert df["date"].tolist() == convert()["date"].tolist()
+
+
+def test_convert_to_pandas_columns_skips_parsing(monkeypatch):
+    parsed = []
+
+    def parse_iso_days(values):
+        parsed.append(values)
+        return parse(values)
+
+    parse = _convert_to_df._parse_iso_days
+    monkeypatch.setattr(_convert_to_df, "_parse_iso_days", parse_iso_days)
+    records = synthetic.vintage_records(40, vintages=2)
+    df = _convert_to_pandas(records, columns=["date", "value"])
+    assert df.dtypes.tolist() == ["datetime64[ns]", "float64"]
+    # Only the date column is parsed, not the realtime columns.
+    assert parsed == [[r["date"] for r in records]]
+
+
+def test_convert_to_pandas_columns_empty():
+    df = _convert_to_pandas([], columns=["date", "value"])
+    assert df.columns.tolist() == ["date", "value"]
+
+
+def test_convert_to_numpy_columns(parser):
+    records = synthetic.vintage_records(40, vintages=2)
+    array = _convert_to_numpy(records, columns=["realtime_end", "value"])
+    assert array.dtype.names == ("realtime_end", "value")
+    with pytest.raises(ValueError, match="no \\['id'\\] fields"):
+        _convert_to_numpy(records, columns=["id"])
+
+
+@pytest.mark.parametrize("return_format", ["pandas", "polars", "polars_lazy", "arrow"])
+def test_convert_records_unknown_columns(return_format):
+    if return_format != "pandas":
+        pytest.importorskip("polars" if "polars" in return_format else "pyarrow")
+    records = synthetic.vintage_records(40, vintages=2)
+    with pytest.raises(ValueError, match="no \\['vlaue'\\] fields"):
+        _convert_records(records, ReturnFormat(return_format), ["date", "vlaue"])
+    # A field of only some of the records is a valid column.
+    records[1] = {**records[1], "note": "revised"}
+    _convert_records(records, ReturnFormat(return_format), ["date", "note"])
+
+
+def test_convert_to_pandas_categorical(parser):
+    series = synthetic.listing("series/search", 50)["seriess"]
+    df = _convert_to_pandas(series, categorical=True)
+    assert df["frequency"].dtype == "category"
+    assert df["title"].dtype == object
+    assert df["popularity"].dtype == "int64"
+
+    expected = _convert_to_pandas(series)
+    pd.testing.assert_frame_equal(df.astype(expected.dtypes), expected)
+
+
+def test_convert_to_polars_categorical(parser):
+    pl = pytest.importorskip("polars")
+    series = synthetic.listing("series/search", 50)["seriess"]
+    df = _convert_to_polars(series, categorical=True)
+    assert df.schema["frequency"] == pl.Categorical
+    assert df.schema["title"] == pl.String
+    assert df.schema["realtime_start"] == pl.Date
+
+    expected = _convert_to_polars(series)
+    assert df.cast(expected.schema).equals(expected)
+
+
+def test_categorize():
+    df = _categorize(
+        pd.DataFrame(
+            {
+                "group_id": ["gen", "gen", None, "gen"],
+                "mixed": ["gen", 1, "gen", 1],
+                "name": ["a", "b", "c", "d"],
+                "count": [1, 1, 1, 1],
+            }
+        )
+    )
+    assert df["group_id"].dtype == "category"
+    assert df["group_id"].isna().tolist() == [False, False, True, False]
+    assert df.dtypes[["mixed", "name"]].tolist() == [object, object]
+    assert df["count"].dtype == "int64"